@@ -125,7 +125,6 @@ class YacrafModel:
                     # Copy the loss_event from the risk tree
                     linked_loss_event : GUISetupClass = model.create_linked_setup_class_gui(loss_event.setup_class_gui, setup_view_attack_tree_top_level, position=loss_event_position)
                     loss_event.set_attribute_values(linked_loss_event) # copy values over
-                    loss_event_top_left_corner = Node.get_top_left_corner(loss_event_position)
 
                     attack_event_position = (loss_event_position[0] - AttackEvent.width - 2*Node.Padding.X, loss_event_position[1])
 
@@ -135,8 +134,7 @@ class YacrafModel:
                         linked_attack_event : GUISetupClass = model.create_linked_setup_class_gui(already_linked_attack_events[attack_event.id].setup_class_gui, setup_view_attack_tree_top_level, position=attack_event_position)
                         already_linked_attack_events[attack_event.id].set_attribute_values(linked_attack_event)
                         # Connect to loss_event
-                        attack_event_top_right_corner = Node.get_top_right_corner(attack_event_position)
-                        setup_view_attack_tree_top_level.create_connection_with_blocks(start_coordinate=attack_event_top_right_corner, end_coordinate=loss_event_top_left_corner)
+                        setup_view_attack_tree_top_level.connect(linked_attack_event, linked_loss_event)
 
                         loss_event_position = (loss_event_position[0], loss_event_position[1] + AttackEvent.height + Node.Padding.Y)
                         continue
@@ -144,17 +142,14 @@ class YacrafModel:
                     linked_attack_event : GUISetupClass = model.create_linked_setup_class_gui(attack_event.setup_class_gui, setup_view_attack_tree_top_level, position=attack_event_position)
                     attack_event.set_attribute_values(linked_attack_event)
                     # Create a connection from the attack event to the loss event
-                    attack_event_top_right_corner = Node.get_top_right_corner(attack_event_position)
-                    setup_view_attack_tree_top_level.create_connection_with_blocks(start_coordinate=attack_event_top_right_corner, end_coordinate=loss_event_top_left_corner)
+                    setup_view_attack_tree_top_level.connect(linked_attack_event, linked_loss_event)
 
                     # Link the attack event to its abuse case
                     abuse_case_position = (attack_event_position[0] - AbuseCase.width - 2*Node.Padding.X, attack_event_position[1])
                     linked_abuse_case : GUISetupClass = model.create_linked_setup_class_gui(attack_event.abuse_case.setup_class_gui, setup_view_attack_tree_top_level, position=abuse_case_position)
                     attack_event.abuse_case.set_attribute_values(linked_abuse_case)
-                    linked_abuse_case_top_right_corner = Node.get_top_right_corner(abuse_case_position)
-                    attack_event_top_left_corner = Node.get_top_left_corner(attack_event_position)
                     # Create a connection from the abuse case to the attack event
-                    setup_view_attack_tree_top_level.create_connection_with_blocks(start_coordinate=linked_abuse_case_top_right_corner, end_coordinate=attack_event_top_left_corner)
+                    setup_view_attack_tree_top_level.connect(linked_abuse_case, linked_attack_event)
                     
                     loss_event_position = (loss_event_position[0], loss_event_position[1] + AbuseCase.height + Node.Padding.Y)
 
@@ -327,7 +322,7 @@ class AttackEvent(Node):
 
         # Connect children to the parent
         for child in self.children:
-            setup_view.create_connection_with_blocks(start_coordinate=child.get_top_right_corner(), end_coordinate=self.get_top_left_corner())
+            setup_view.connect(child.setup_class_gui, self.setup_class_gui)
 
         if full_attack_tree:
             next_spot_on_same_row = (next_available_child_position[0] + 2*Node.Padding.X, position[1])
@@ -405,7 +400,6 @@ class Defense(Node):
 
         # Create children
         next_available_attack_event_position = (self.grid_position[0] + 2*Node.Padding.X + Defense.width, self.grid_position[1])
-        top_right_corner = self.get_top_right_corner()
         for attack_event in self.attack_events:
             # stack the attack_events
             linked_setup_class_gui = model.create_linked_setup_class_gui(attack_event.setup_class_gui, setup_view, position=next_available_attack_event_position)
@@ -413,8 +407,7 @@ class Defense(Node):
             # manually copy from the original setup class
             logger.debug(f"Copying setup class {attack_event.setup_class_gui.get_name()} for attack event {attack_event.data[String.NAME]} for defense {self.data[String.NAME]}")
             attack_event.set_attribute_values(linked_setup_class_gui)
-            attack_event_top_left_corner = Node.get_top_left_corner(next_available_attack_event_position)
-            setup_view.create_connection_with_blocks(start_coordinate=top_right_corner, end_coordinate=attack_event_top_left_corner)
+            setup_view.connect(self.setup_class_gui, linked_setup_class_gui)
             next_available_attack_event_position = (next_available_attack_event_position[0], next_available_attack_event_position[1] + Node.Padding.X + AttackEvent.height)
 
     def set_attribute_values(self, setup_class_gui=None):
@@ -566,7 +559,7 @@ class Actor(Node):
 
         # Connect children to the parent
         for loss_events in self.loss_events:
-            setup_view.create_connection_with_blocks(start_coordinate=loss_events.get_top_right_corner(), end_coordinate=self.get_top_left_corner())
+            setup_view.connect(loss_events.setup_class_gui, self.setup_class_gui)
 
         next_spot_on_same_row = (next_available_child_position[0] + 2*Node.Padding.X, position[1])
         return next_spot_on_same_row
@@ -653,7 +646,7 @@ class LossEvent(Node):
 
         # Connect abuse_cases to the parent
         for abuse_case in self.abuse_cases:
-            setup_view.create_connection_with_blocks(start_coordinate=abuse_case.get_top_right_corner(), end_coordinate=self.get_top_left_corner())
+            setup_view.connect(abuse_case.setup_class_gui, self.setup_class_gui)
 
         next_spot_on_same_row = (next_available_child_position[0] + 2*Node.Padding.X, position[1])
         return next_spot_on_same_row
@@ -744,7 +737,7 @@ class AbuseCase(Node):
         self.setup_class_gui : GUISetupClass = setup_view.create_setup_class_gui(configuration_class_gui=configuration_classes_gui[Configuration_classes_gui.ABUSE_CASE], position=position)
 
         # connect the child to the parent
-        setup_view.create_connection_with_blocks(start_coordinate=self.attacker.get_top_right_corner(), end_coordinate=self.get_top_left_corner())
+        setup_view.connect(self.attacker.setup_class_gui, self.setup_class_gui)
 
         self.setup_class_gui.set_name(self.data[String.NAME])
         self.set_attribute_values()
@@ -1,16 +1,24 @@
 import os
-import tkinter as tk
-import platform
+import sys
 
 from program_paths import *
-from settings import Settings
+from settings import load_settings
 from general_calculations import *
 
-settings = Settings()
+settings = load_settings()
 
 # The pixel width of each block in the grid
 LENGTH_UNIT = 25
 LENGTH_UNIT_ZOOM_LIMITS = (5, 50)
+ZOOM_FONT_UPDATE_DELAY = 150 # Milliseconds after the last zoom before the fonts are updated to the new zoom level
+CULLING_CELL_SIZE = 20 # Grid width and height of the cells that blocks are shown or hidden in depending on whether they are in the visible part of a view
+CULLING_MARGIN = 10 # Grid units outside the visible part of a view where blocks are still shown
+CULLING_RELEASE_MARGIN = 100 # Grid units outside the visible part of a view beyond which the items of blocks and connections are deleted, and recreated once they come closer again
+LENGTH_UNIT_LOW_DETAIL = 10 # Length unit below which only the rectangles of setup classes are drawn, as their text can not be read anyway
+CALCULATION_APPLY_DELAY = 50 # Milliseconds between applying the values calculated in another thread
+CALCULATION_VALUES_PER_BATCH = 500 # Maximum number of values calculated in another thread that are applied at a time, to keep the GUI responsive
+PROGRESSIVE_INITIAL_NUM_SAMPLES = 500 # Number of samples that values are first estimated with, which is doubled until reaching the number in the settings
+REFINING_VALUE_MARKER = "~ " # Shown before values that are estimates still being refined with more samples
 
 
 
@@ -22,6 +30,13 @@ DECIMALS_WHEN_ROUNDING = 3
 SAVES_DIRECTORY = os.path.join(SAVES_DIRECTORY, settings.get_save_name())
 
 SAVES_PATH = os.path.join(BASE_PATH, SAVES_DIRECTORY)
+SAVE_FILE_PATH = os.path.join(SAVES_PATH, "save.sqlite") # Single file storing all views of the save
+SAVE_FORMAT_VERSION = 3 # Version of how views are stored in the save file, increased when older versions need to be converted or written in full
+
+AUTOSAVES_PATH = os.path.join(SAVES_PATH, "autosaves") # Snapshots of unsaved changes that are written regularly, and recovered if the program was not closed normally
+NUM_AUTOSAVES = 3 # Number of the most recent snapshots that are kept
+
+# Saves from before the single save file, with one file per view, which can still be restored
 FILE_PATHS_SAVES_PATH = os.path.join(SAVES_PATH, "view_file_paths.txt")
 CONFIGURATION_SAVES_DIRECTORY = "configurations"
 SETUP_SAVES_DIRECTORY = "setups"
@@ -37,6 +52,10 @@ VALUE_TYPES = (ValueTypeString, ValueTypeNumber, ValueTypeProbability, ValueType
 # Available types of calculation operations between input attribute values
 CALCULATION_TYPES = (CalculationTypeMean, CalculationTypeAND, CalculationTypeOR, CalculationTypeMultiplication, CalculationTypeDivision, CalculationTypeSampleTriangle, CalculationTypeQualitative)
 
+# Value and calculation types are stored by name in saves
+VALUE_TYPES_PER_NAME = {value_type.__name__: value_type for value_type in VALUE_TYPES}
+CALCULATION_TYPES_PER_NAME = {calculation_type.__name__: calculation_type for calculation_type in CALCULATION_TYPES}
+
 
 
 VIEW_BACKGROUND_COLOR = "white" # Window default value
@@ -45,6 +64,7 @@ VIEW_EXCLUDED_COLOR = "red"
 # Default text values
 FONT = ("Arial", 11)
 FONT_DECREASE_LINE_BREAK = 3
+FITTED_TEXTS_CACHE_SIZE = 10000 # Number of texts fitted to blocks that are remembered, as the same texts are fitted repeatedly
 TEXT_COLOR = "black"
 
 OUTLINE_WIDTH = 1
@@ -105,9 +125,8 @@ SAVE_HEIGHT = SETTINGS_HEIGHT
 SAVE_COLOR = SETTINGS_COLOR
 SAVE_HEADER_COLOR = "gray"
 
-# Change view buttons
-CHANGE_VIEW_WIDTH = 5
-CHANGE_VIEW_HEIGHT = 1
+# List of views used to change between them
+VIEW_NAVIGATOR_WIDTH = 8 * LENGTH_UNIT # Pixel width, which is independent of zooming
 CHANGE_VIEW_COLOR = "orange"
 CHANGE_VIEW_HEADER_COLOR = "gainsboro"
 CHANGE_VIEW_SELECTED_COLOR = SELECT_COLOR
@@ -122,9 +141,8 @@ ADD_INPUT_WIDTH = ADD_CLASS_WIDTH
 ADD_INPUT_HEIGHT = ADD_CLASS_HEIGHT
 ADD_INPUT_COLOR = ADD_CLASS_COLOR
 
-# Button for adding class from configuration views to the current setup view
-ADD_TO_SETUP_WIDTH = ADD_CLASS_WIDTH
-ADD_TO_SETUP_HEIGHT = ADD_CLASS_HEIGHT
+# List of classes from configuration views that can be added to the current setup view
+CLASS_PALETTE_WIDTH = 6 * LENGTH_UNIT # Pixel width, which is independent of zooming
 ADD_TO_SETUP_COLOR = ADD_CLASS_COLOR
 
 # Add directional connection to setup view
@@ -136,15 +154,14 @@ ADD_CONNECTION_COLOR = "forest green"
 CALCULATE_VALUES_WIDTH = ADD_CLASS_WIDTH
 CALCULATE_VALUES_HEIGHT = ADD_CLASS_HEIGHT
 CALCULATE_VALUES_COLOR = "tomato"
+CALCULATE_VALUES_TEXT = "Calculate"
 
 # Button found at the bottom of a class block that adds another attribute to the class
 ADD_ATTRIBUTE_WIDTH = 1
 ADD_ATTRIBUTE_HEIGHT = 1
 ADD_ATTRIBUTE_COLOR = "forest green"
 
-# Button found at the bottom of all buttons that change view that adds another view
-ADD_CHANGE_VIEW_WIDTH = ADD_ATTRIBUTE_WIDTH
-ADD_CHANGE_VIEW_HEIGHT = ADD_ATTRIBUTE_HEIGHT
+# Button found in the list of views that adds another view
 ADD_CHANGE_VIEW_COLOR = ADD_ATTRIBUTE_COLOR
 
 # Button for running scripts in setup views
@@ -212,6 +229,8 @@ TAG_CONNECTION_LINE = "connection_line"
 TAG_CONNECTION_CORNER = "connection_corner"
 TAG_INPUT = "input"
 TAG_INPUT_TEXT = "input_text"
+TAG_CONTENT = "content" # All items that move together when panning/zooming, as opposed to buttons and options
+TAG_ENTRY_WINDOW = "entry_window"
 
 
 
@@ -223,7 +242,7 @@ MOUSE_LEFT_RELEASE = "<ButtonRelease-1>"
 # Different mouse buttons on different operating systems
 # See issue and discussion here:
 # https://www.reddit.com/r/Tkinter/comments/14ro346/button1_button2_button3_problem_need_help/
-if platform.system() == "Darwin":
+if sys.platform == "darwin":
     MOUSE_RIGHT_PRESS = "<ButtonPress-2>"
 else:
     MOUSE_RIGHT_PRESS = "<ButtonPress-3>"
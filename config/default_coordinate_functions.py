@@ -25,18 +25,6 @@ def get_settings_coordinate(length_unit):
     """
     return 0, settings.get_canvas_height() / length_unit - SETTINGS_HEIGHT
     
-def get_change_configuration_view_start_coordinate(length_unit):
-    """
-    Returns the grid coordinate of the first configuration view button
-    """
-    return settings.get_canvas_width() / length_unit - 2 * CHANGE_VIEW_WIDTH, CHANGE_VIEW_HEIGHT
-    
-def get_change_setup_view_start_coordinate(length_unit):
-    """
-    Returns the grid coordinate of the first setup view button
-    """
-    return settings.get_canvas_width() / length_unit - CHANGE_VIEW_WIDTH, CHANGE_VIEW_HEIGHT
-    
 def get_create_class_coordinate(length_unit):
     """
     Returns the grid coordinate of the button creating a new configuration class
@@ -49,12 +37,6 @@ def get_create_input_coordinate(length_unit):
     """
     return 0, ADD_CLASS_HEIGHT
     
-def get_to_setup_start_coordinate(length_unit):
-    """
-    Returns the grid coordinate of the first button that adds the setup version of a configuration class to a setup view
-    """
-    return 0, 0
-    
 def get_create_connection_coordinate(length_unit):
     """
     Returns the grid coordinate of the button creating a directional connection in a setup view
@@ -73,18 +55,6 @@ def get_create_attribute_offset():
     """
     return (ATTRIBUTE_WIDTH - ADD_ATTRIBUTE_WIDTH) / 2, 0
     
-def get_create_configuration_view_offset():
-    """
-    Returns the grid offset from the last button changing to configuration views that the button for creating another configuration view is positioned
-    """
-    return (CHANGE_VIEW_WIDTH - ADD_CHANGE_VIEW_WIDTH) / 2, 0
-    
-def get_create_setup_view_offset():
-    """
-    Returns the grid offset from the last button changing to setup views that the button for creating another setup view is positioned
-    """
-    return (CHANGE_VIEW_WIDTH - ADD_CHANGE_VIEW_WIDTH) / 2, 0
-    
 def get_run_script_start_coordinate(length_unit):
     """
     Returns the grid coordinate of the button running or clearing scripts
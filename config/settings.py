@@ -4,6 +4,8 @@ from program_paths import CONFIG_PATH
 
 SETTINGS_FILE = os.path.join(CONFIG_PATH, "settings.txt")
 
+loaded_settings = None # Settings shared by the whole program, which are only read from file once
+
 class Settings:
     """
     Manages general settings that are saved to file
@@ -13,6 +15,7 @@ class Settings:
         self.__canvas_height = 600
         self.__num_samples = 10000
         self.__warn_duplicate_names = True
+        self.__autosave_interval = 120
         self.__save_name = save_name
         
         if os.path.exists(SETTINGS_FILE):
@@ -32,6 +35,9 @@ class Settings:
                     elif variable == "WARN_DUPLICATE_NAMES":
                         self.__warn_duplicate_names = value == "True"
                         
+                    elif variable == "AUTOSAVE_INTERVAL":
+                        self.__autosave_interval = int(value) # Seconds between autosaves, where 0 turns off autosaving
+                        
                     elif variable == "SAVE_NAME":
                         if save_name == None:
                             self.__save_name = value
@@ -58,6 +64,12 @@ class Settings:
     def set_warn_duplicate_names(self, warn_duplicate_names):
         self.__warn_duplicate_names = warn_duplicate_names
         
+    def get_autosave_interval(self):
+        return self.__autosave_interval
+        
+    def set_autosave_interval(self, autosave_interval):
+        self.__autosave_interval = autosave_interval
+        
     def get_save_name(self):
         return self.__save_name
         
@@ -67,5 +79,19 @@ class Settings:
                                     ("CANVAS_HEIGHT", self.__canvas_height), \
                                     ("NUM_SAMPLES", self.__num_samples), \
                                     ("WARN_DUPLICATE_NAMES", self.__warn_duplicate_names), \
+                                    ("AUTOSAVE_INTERVAL", self.__autosave_interval), \
                                     ("SAVE_NAME", self.__save_name)]:
                 file_settings.write(f"{variable} = {value}\n")
+                
+def load_settings(save_name=None):
+    """
+    Returns the settings shared by the whole program, which are read from file the first time
+    
+    save_name: Save to use instead of the one in the settings file, which is only used if the settings have not been read yet
+    """
+    global loaded_settings
+    
+    if loaded_settings == None:
+        loaded_settings = Settings(save_name)
+        
+    return loaded_settings
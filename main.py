@@ -1,4 +1,3 @@
-import tkinter as tk
 import sys
 import os
 
@@ -9,7 +8,7 @@ from program_paths import *
 for path in IMPORT_PATHS:
     sys.path.append(path)
     
-from settings import Settings
+from settings import load_settings
 
 def main():
     if len(sys.argv) != 2:
@@ -21,9 +20,12 @@ def main():
         
     save_name = sys.argv[1]
     
-    settings = Settings(save_name)
+    # Read once here, where the rest of the program uses the same settings
+    settings = load_settings(save_name)
     settings.save()
     
+    # Only imported once needed, so that showing how to use the program starts quickly
+    import tkinter as tk
     from model import Model
     
     root = tk.Tk()
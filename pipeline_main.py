@@ -1,4 +1,3 @@
-import tkinter as tk
 import sys
 import os
 import json
@@ -15,7 +14,7 @@ from program_paths import *
 for path in IMPORT_PATHS:
     sys.path.append(path)
     
-from settings import Settings
+from settings import load_settings
 
 def main():
     setup_logging()
@@ -35,24 +34,19 @@ def main():
     # Use this existing save as a starting point. This save includes the YACRAF metamodel 
     save_name = "custom"
     
-    settings = Settings(save_name)
+    settings = load_settings(save_name)
     settings.save()
     
+    import tkinter as tk
     from model import Model
     
     root = tk.Tk()
-    model = Model(root, num_setup_views=1)
+    # Only the metamodel is restored from the save, as all setup views are created from the input file
+    model = Model(root, metamodel_only=True)
 
     from pipeline_util import create_yacraf_model
     create_yacraf_model(model, file_path)
     
-    # clean up the default model. Needs to be done after the model is created
-    # since the model needs to have at least one setup view to be valid
-    setup_views = model.get_setup_views()
-    # delete the first 3 setup views (those are empty by default)
-    for setup_view in list(setup_views):
-        if setup_view.get_name() in ["Setup 1", "Setup 2", "Setup 3"]:         
-            model.delete_view(setup_view)
     setup_view = model.get_setup_views()[0]
     model.change_view(setup_view)
     root.mainloop()
@@ -16,7 +16,9 @@ def create_yacraf_model(model, file_path: str):
     # read the file into a tree representation
     yacraf_instance : YacrafModel = file_to_yacraf_instance(file_path)
     if yacraf_instance.isValid():
-        yacraf_instance.plot(model)
+        # Only order items and fit texts once all views have been plotted
+        with model.bulk_build():
+            yacraf_instance.plot(model)
     else:
         logger.error("The YACRAF instance is not valid. Please check the input file. See logs for more information.")
         sys.exit(1)
@@ -1,15 +1,11 @@
 def script_logic(script_if):
     # Insert logic here
     
-    # Loops through all defense mechanism instances
-    for defense_mechanism_name in script_if.get_class_instance_names("Defense mechanism"):
-        current_value = script_if.get_attribute_values("Defense mechanism", defense_mechanism_name, "Impact")[0]
-        override_value = " / ".join(["0"] * len(current_value)) # Override value with zeros, where the number of zeros is according to the value type
-        
-        script_if.override_attribute_values(override_value, \
-                                            "Defense mechanism", \
-                                            class_instance=defense_mechanism_name, \
-                                            attribute="Impact")
+    # Overrides the impact of all defense mechanism instances at once
+    class_instance_names, columns = script_if.get_attribute_table("Defense mechanism")
+    override_values = [[0] * len(value) for value in columns["Impact"]] # Override value with zeros, where the number of zeros is according to the value type
+    
+    script_if.override_attribute_table(override_values, "Defense mechanism", "Impact")
         
     script_if.calculate_values()
     
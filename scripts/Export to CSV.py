@@ -4,26 +4,15 @@ def script_logic(script_if):
     
     # Write all class instances of the given types to CSV format that can be converted to a table used in a report
     for class_type_name in ("Loss event", "Abuse case", "Attacker"):
-        headers = [class_type_name]
-        rows = []
+        # All values of the class type are found at once, with one column per attribute
+        class_instance_names, columns = script_if.get_attribute_table(class_type_name)
         
-        # For each unique class instance found among the class types
-        for i, class_instance_name in enumerate(script_if.get_class_instance_names(class_type_name)):
-            row = [class_instance_name]
-            
-            # For each attribute type that the current class type has
-            for attribute_name in script_if.get_attribute_names(class_type_name):
-                if i == 0:
-                    headers.append(attribute_name)
-                    
-                attribute_values = script_if.get_attribute_values(class_type_name, class_instance_name, attribute_name)
-                
-                if len(attribute_values) > 1:
-                    print(f"Warning: Multiple attributes found when searching for {class_type_name}, {class_instance_name}, and {attribute_name}, using the attribute value of the first encountered")
-                    
-                row.append(script_if.convert_value_to_string(attribute_values[0]))
-                
-            rows.append(row)
+        headers = [class_type_name] + list(columns.keys())
+        rows = [[class_instance_name] for class_instance_name in class_instance_names]
+        
+        for column in columns.values():
+            for row, value in zip(rows, column):
+                row.append(script_if.convert_value_to_string(tuple(value)))
             
         # Currently prints the results
         print("--------------------------------------------------")
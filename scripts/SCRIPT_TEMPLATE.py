@@ -28,12 +28,22 @@
 #     Returns a list of the values displayed by the specified attributes, each displayed value being represented by a tuple
 #     Example: [(1, 2, 3), (0.45,), ("Text",), ...]
 
+# script_if.get_attribute_table(class_type, view=None)
+#     Returns a tuple with a list of the names of all class instances of the class type, and a dictionary with attribute names as keys and the values of that attribute for each class instance as values
+#     Columns where all values are numbers with the same number of values are two-dimensional NumPy arrays with one row per class instance, while other columns are lists of tuples
+#     Example: (["DoS attack", ...], {"Local difficulty": array([[1, 2, 3], ...]), "Description": [("Text",), ...], ...})
+
 # script_if.convert_value_to_string(attribute_value)
 #     Returns the specified attribute tuple value as a formatted string
 
 # script_if.override_attribute_values(override_value, class_type, *, class_instance=None, attribute=None, view=None)
 #     Overrides the displayed value of matching attributes with a temporary one given in string format (as if it was entered through an entry field)
 
+# script_if.override_attribute_table(override_values, class_type, attribute, *, class_instances=None, view=None)
+#     Overrides the displayed value of an attribute for many class instances at once, where each override value is a string (as if it was entered through an entry field), a number, or a sequence of values such as a row of a two-dimensional NumPy array
+#     Numbers in a sequence are used directly and other values in it are kept as they are, so a column from get_attribute_table can be passed back
+#     The override values are in the order of the class instances given, or in the order of get_attribute_table if no class instances are given
+
 # script_if.reset_override_attribute_values(*, class_type=None, class_instance=None, attribute=None, view=None)
 #     Resets any override value of matching attributes
 
@@ -0,0 +1,174 @@
+import os
+import time
+import queue
+import threading
+from save_file import SaveFile
+from config import *
+
+class Autosave:
+    """
+    Regularly takes a snapshot of all views on the main loop and writes it to a separate save file in another thread, so that unsaved changes can be recovered if the program is not closed normally
+    """
+    def __init__(self, model, directory=AUTOSAVES_PATH, *, is_enabled=True):
+        """
+        is_enabled: Whether snapshots are taken and removed at all, which is not the case for models that are not the save of the user, such as generated ones
+        """
+        self.__model = model
+        self.__directory = directory
+        self.__is_enabled = is_enabled
+        self.__snapshot_id = None
+        self.__num_snapshots = 0
+        
+        # States are only taken again for views that have changed since the previous snapshot, where the unchanged ones are shared with it
+        self.__saved_states_per_view = {} # Key: View, Value: Tuple (number of changes of the view, saved state, or None if the record of the view is copied from the save file)
+        
+        self.__snapshots_to_write = queue.Queue() # Filled from the main loop with tuples (saved states, records to copy, view order) of snapshots, where None marks that all snapshots should be removed
+        self.__thread = None # Started once there is something to write
+        
+    @staticmethod
+    def get_snapshot_paths(directory=AUTOSAVES_PATH):
+        """
+        Returns the file paths of all snapshots in the directory, from oldest to newest
+        """
+        if not os.path.isdir(directory):
+            return []
+            
+        return sorted(os.path.join(directory, file_name) for file_name in os.listdir(directory) if file_name.startswith("autosave_") and file_name.endswith(".sqlite"))
+        
+    @staticmethod
+    def get_save_file_to_recover(directory=AUTOSAVES_PATH):
+        """
+        Returns the save file of the newest snapshot, or None if there is nothing to recover
+        Snapshots are removed when saving and when closing the program normally, so any snapshot left is from a session that was not closed normally
+        """
+        snapshot_paths = Autosave.get_snapshot_paths(directory)
+        
+        if len(snapshot_paths) == 0:
+            return None
+            
+        return SaveFile(snapshot_paths[-1])
+        
+    def schedule(self):
+        """
+        Schedules the next snapshot according to the interval in the settings, replacing any snapshot that is already scheduled
+        """
+        if self.__snapshot_id != None:
+            self.__model.get_root().after_cancel(self.__snapshot_id)
+            self.__snapshot_id = None
+            
+        if self.__is_enabled and settings.get_autosave_interval() > 0:
+            self.__snapshot_id = self.__model.get_root().after(settings.get_autosave_interval() * 1000, self.take_snapshot)
+            
+    def take_snapshot(self):
+        """
+        Takes a snapshot of the saved state of all views, which is written in another thread as the saved states are not changed by later edits
+        Setup views that have not been restored are not read here, where their records are copied from the save file in that thread instead
+        """
+        self.__snapshot_id = None
+        
+        # Nothing to recover
+        if not any(view.has_unsaved_changes() for view in self.__model.get_configuration_views() + self.__model.get_setup_views()):
+            self.schedule()
+            return
+            
+        saved_states = {} # Key: Tuple (whether configuration view, name), Value: Saved state
+        records_to_copy = {} # Key: Tuple (whether configuration view, name), Value: Tuple (name in the save file, whether excluded from calculations)
+        view_order = []
+        saved_states_per_view = {}
+        has_changed = False
+        
+        for is_configuration_view, views in [(True, self.__model.get_configuration_views()), (False, self.__model.get_setup_views())]:
+            for view in views:
+                num_changes, saved_state = self.__saved_states_per_view.get(view, (None, None))
+                
+                if num_changes != view.get_num_changes():
+                    num_changes, saved_state = view.get_num_changes(), None if view.has_unread_save() else view.get_saved_state()
+                    has_changed = True
+                    
+                saved_states_per_view[view] = (num_changes, saved_state)
+                name = view.get_name()
+                
+                # Views with the same name are only renamed when saving, so their snapshots are kept apart here
+                while (is_configuration_view, name) in saved_states or (is_configuration_view, name) in records_to_copy:
+                    name = f"{name} (1)"
+                    
+                view_order.append((is_configuration_view, name))
+                
+                if saved_state != None:
+                    saved_states[view_order[-1]] = saved_state
+                else:
+                    records_to_copy[view_order[-1]] = (view.get_name(), view.is_excluded())
+                    
+        # Deleted views are also a change
+        has_changed = has_changed or saved_states_per_view.keys() != self.__saved_states_per_view.keys()
+        self.__saved_states_per_view = saved_states_per_view
+        
+        if has_changed:
+            self.add_to_write((saved_states, records_to_copy, view_order))
+            
+        self.schedule()
+        
+    def add_to_write(self, snapshot):
+        if self.__thread == None:
+            self.__thread = threading.Thread(target=self.write_snapshots, daemon=True)
+            self.__thread.start()
+            
+        self.__snapshots_to_write.put(snapshot)
+        
+    def write_snapshots(self):
+        """
+        Runs in the autosave thread, where the snapshots are written in the order they were taken
+        """
+        while True:
+            snapshot = self.__snapshots_to_write.get()
+            
+            try:
+                if snapshot == None:
+                    self.remove_snapshot_files()
+                else:
+                    self.write_snapshot(*snapshot)
+            except Exception as error:
+                print(f"Error: Could not autosave: {error}")
+                
+            self.__snapshots_to_write.task_done()
+            
+    def write_snapshot(self, saved_states, records_to_copy, view_order):
+        """
+        Writes a snapshot to a new file, and removes the oldest snapshots so that only the most recent ones are kept
+        """
+        self.__num_snapshots += 1
+        file_path = os.path.join(self.__directory, f"autosave_{time.strftime('%Y%m%d-%H%M%S')}-{self.__num_snapshots:06d}.sqlite")
+        
+        # Written under another name first, so that an interrupted write is never recovered
+        SaveFile(file_path + ".tmp").write(saved_states, view_order, records_to_copy=records_to_copy, save_file_to_copy_from=self.__model.get_save_file())
+        os.replace(file_path + ".tmp", file_path)
+        
+        for snapshot_path in Autosave.get_snapshot_paths(self.__directory)[:-NUM_AUTOSAVES]:
+            os.remove(snapshot_path)
+            
+    def remove_snapshot_files(self):
+        """
+        Removes all snapshot files, including any that were not completely written
+        """
+        if os.path.isdir(self.__directory):
+            for file_name in os.listdir(self.__directory):
+                if file_name.startswith("autosave_"):
+                    os.remove(os.path.join(self.__directory, file_name))
+                    
+    def remove_snapshots(self):
+        """
+        Removes all snapshots, such as when they have been replaced by saving
+        """
+        if self.__is_enabled:
+            self.add_to_write(None)
+        
+    def stop(self):
+        """
+        Stops taking snapshots and removes the existing ones, waiting until they have been removed as the program is being closed normally
+        """
+        if self.__snapshot_id != None:
+            self.__model.get_root().after_cancel(self.__snapshot_id)
+            self.__snapshot_id = None
+            
+        self.remove_snapshots()
+        self.__snapshots_to_write.join()
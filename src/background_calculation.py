@@ -0,0 +1,172 @@
+import threading
+import queue
+from setup_attribute_snapshot import SetupAttributeSnapshot
+from config import *
+
+class BackgroundCalculation:
+    """
+    Calculates the values of setup attributes in another thread so that the GUI stays responsive, where the calculated values are applied in batches from the main loop
+    """
+    def __init__(self, model, setup_classes_gui, *, progressive=False):
+        """
+        setup_classes_gui: Dictionary with setup classes whose values should be calculated as keys and lists of their GUI versions as values
+        progressive: Whether values are first estimated with few samples and then refined with more samples until reaching the number in the settings
+        """
+        self.__model = model
+        self.__setup_classes_gui = setup_classes_gui
+        
+        setup_attributes = [setup_attribute for setup_class in setup_classes_gui for setup_attribute in setup_class.get_setup_attributes()]
+        snapshots = SetupAttributeSnapshot.create_snapshots(setup_attributes)
+        
+        self.__snapshots_to_calculate = [snapshots[setup_attribute] for setup_attribute in setup_attributes if snapshots[setup_attribute].needs_calculation()]
+        self.__num_samples_per_round = self.get_num_samples_per_round(settings.get_num_samples(), progressive)
+        
+        # Values that depend on sampling are calculated again with more samples in each round after the first one
+        if len(self.__num_samples_per_round) > 1:
+            self.__snapshots_to_reset = [snapshot for snapshot in snapshots.values() if snapshot.depends_on_sampling()]
+            self.__snapshots_to_refine = [snapshot for snapshot in self.__snapshots_to_calculate if snapshot.depends_on_sampling()]
+        else:
+            self.__snapshots_to_reset = []
+            self.__snapshots_to_refine = []
+            
+        self.__refined_setup_attributes = set(snapshot.get_setup_attribute() for snapshot in self.__snapshots_to_refine) # Setup attributes whose shown value is not yet final
+        self.__num_values_to_apply = len(self.__snapshots_to_calculate) + len(self.__snapshots_to_refine) * (len(self.__num_samples_per_round) - 1)
+        self.__num_applied = 0
+        
+        self.__calculated_values = queue.Queue() # Filled by the calculation thread with tuples (snapshot, value, whether final), where None marks that all values have been calculated
+        self.__is_cancelled = threading.Event()
+        self.__apply_id = None
+        
+        self.__thread = threading.Thread(target=self.calculate, daemon=True)
+        
+    @staticmethod
+    def get_num_samples_per_round(num_samples, progressive):
+        """
+        Returns the number of samples used in each round of calculations, where the number is doubled each round when calculating progressively
+        """
+        num_samples_per_round = []
+        
+        if progressive:
+            num_samples_in_round = PROGRESSIVE_INITIAL_NUM_SAMPLES
+            
+            while num_samples_in_round < num_samples:
+                num_samples_per_round.append(num_samples_in_round)
+                num_samples_in_round *= 2
+                
+        num_samples_per_round.append(num_samples)
+        
+        return num_samples_per_round
+        
+    def start(self):
+        self.__thread.start()
+        self.__apply_id = self.__model.get_root().after(CALCULATION_APPLY_DELAY, self.apply_calculated_values)
+        
+    def calculate(self):
+        """
+        Runs in the calculation thread, where only the snapshots are used as the GUI can not be accessed from other threads
+        """
+        for round_index, num_samples in enumerate(self.__num_samples_per_round):
+            is_final_round = round_index == len(self.__num_samples_per_round) - 1
+            
+            if round_index == 0:
+                snapshots = self.__snapshots_to_calculate
+            else:
+                snapshots = self.__snapshots_to_refine
+                
+                for snapshot in self.__snapshots_to_reset:
+                    snapshot.reset_value()
+                    
+            for snapshot in snapshots:
+                if self.__is_cancelled.is_set():
+                    return
+                    
+                try:
+                    snapshot.calculate_value(num_samples)
+                except Exception as error:
+                    print(f"Error: Could not calculate the value of {snapshot.get_setup_attribute().get_name()}: {error}")
+                    self.__calculated_values.put(None)
+                    return
+                    
+                self.__calculated_values.put((snapshot, snapshot.get_value(), is_final_round or not snapshot.depends_on_sampling()))
+                
+        self.__calculated_values.put(None)
+        
+    def apply_calculated_values(self):
+        """
+        Applies and shows the values calculated since last time, which is repeated until all values have been calculated
+        """
+        self.__apply_id = None
+        updated_setup_classes = set()
+        is_finished = False
+        
+        for i in range(CALCULATION_VALUES_PER_BATCH):
+            try:
+                calculated_value = self.__calculated_values.get_nowait()
+            except queue.Empty:
+                break
+                
+            if calculated_value == None:
+                is_finished = True
+                break
+                
+            snapshot, value, is_final = calculated_value
+            setup_attribute = snapshot.get_setup_attribute()
+            
+            snapshot.apply_value(value)
+            updated_setup_classes.add(setup_attribute.get_setup_class())
+            self.__num_applied += 1
+            
+            if is_final:
+                self.__refined_setup_attributes.discard(setup_attribute)
+                
+        # Values that never became final, such as after an error, are no longer marked as being refined
+        if is_finished:
+            updated_setup_classes.update(self.stop_refining())
+            
+        self.display_changed_values(updated_setup_classes)
+        
+        # Calculations stopped by an error finish without having applied all values
+        if is_finished:
+            self.__model.finish_background_calculation(is_complete=self.__num_applied == self.__num_values_to_apply)
+        else:
+            self.__model.show_calculation_progress(self.get_progress())
+            self.__apply_id = self.__model.get_root().after(CALCULATION_APPLY_DELAY, self.apply_calculated_values)
+            
+    def display_changed_values(self, setup_classes):
+        for setup_class in setup_classes:
+            for setup_class_gui in self.__setup_classes_gui[setup_class]:
+                if not setup_class_gui.is_deleted():
+                    setup_class_gui.display_changed_values()
+                    
+    def is_refining(self, setup_attribute):
+        return setup_attribute in self.__refined_setup_attributes
+        
+    def stop_refining(self):
+        """
+        Stops marking values as being refined, and returns the setup classes of those values
+        """
+        setup_classes = set(setup_attribute.get_setup_class() for setup_attribute in self.__refined_setup_attributes)
+        self.__refined_setup_attributes.clear()
+        
+        return setup_classes
+        
+    def get_progress(self):
+        """
+        Returns the percentage of values that have been calculated and applied
+        """
+        if self.__num_values_to_apply == 0:
+            return 100
+            
+        return int(100 * self.__num_applied / self.__num_values_to_apply)
+        
+    def cancel(self):
+        """
+        Stops calculating, where values that have already been applied are kept
+        """
+        self.__is_cancelled.set()
+        
+        if self.__apply_id != None:
+            self.__model.get_root().after_cancel(self.__apply_id)
+            self.__apply_id = None
+            
+        self.display_changed_values(self.stop_refining())
@@ -330,6 +330,13 @@ class CalculationType:
         """
         return None
         
+    @staticmethod
+    def is_sampled():
+        """
+        Returns whether the output value is estimated through sampling, which becomes more precise with more samples
+        """
+        return False
+        
     @staticmethod
     def calculate_output_value(input_values, num_samples):
         """
@@ -431,6 +438,10 @@ class CalculationTypeSampleTriangle(CalculationType):
     def number_of_inputs():
         return 2
         
+    @staticmethod
+    def is_sampled():
+        return True
+        
     @staticmethod
     def calculate_output_value(input_values, num_samples):
         sampled_values = []
@@ -11,6 +11,9 @@ class SetupAttribute:
     def has_setup_class(self, setup_class):
         return self.__setup_class == setup_class
         
+    def get_setup_class(self):
+        return self.__setup_class
+        
     def get_attribute_index(self):
         return self.__setup_class.get_setup_attributes().index(self)
         
@@ -86,6 +89,9 @@ class SetupAttribute:
     def get_value_type(self):
         return self.__configuration_attribute.get_value_type()
         
+    def get_configuration_attribute(self):
+        return self.__configuration_attribute
+        
     def has_configuration_attribute(self, configuration_attribute):
         return self.__configuration_attribute == configuration_attribute
         
@@ -111,9 +117,10 @@ class SetupAttribute:
                 
                 # If a setup class corresponding to the configuration class with the connected configuration attribute is currently connected
                 if found_internal_connection or found_external_connection:
-                    # Go through all setup attributes of the connected setup class to find the one with the correct configuration attribute
-                    for connected_setup_attribute in connected_setup_class.get_setup_attributes():
-                        if connected_setup_attribute.has_configuration_attribute(connected_configuration_attribute):
-                            filtered_connected_setup_attributes[connected_setup_attribute] = input_scalars
+                    # Find the setup attribute of the connected setup class with the connected configuration attribute
+                    connected_setup_attribute = connected_setup_class.get_setup_attribute(connected_configuration_attribute)
+                    
+                    if connected_setup_attribute != None:
+                        filtered_connected_setup_attributes[connected_setup_attribute] = input_scalars
                             
         return filtered_connected_setup_attributes
@@ -0,0 +1,135 @@
+from general_calculations import combine_values
+
+class SetupAttributeSnapshot:
+    """
+    Copy of everything needed to calculate the value of a setup attribute, so that values can be calculated in another thread while the setup attributes keep being edited
+    """
+    def __init__(self, setup_attribute):
+        configuration_attribute = setup_attribute.get_configuration_attribute()
+        
+        self.__setup_attribute = setup_attribute
+        self.__value = setup_attribute.get_value()
+        self.__override_value = setup_attribute.get_override_value()
+        self.__needs_calculation = self.__value == None
+        self.__applied_value = None # Last value set on the setup attribute, which is replaced by more precise values
+        
+        self.__value_type = configuration_attribute.get_value_type()
+        self.__calculation_type = configuration_attribute.get_calculation_type()
+        self.__input_scalar = configuration_attribute.get_input_scalar()
+        self.__input_offset = configuration_attribute.get_input_offset()
+        self.__is_correctly_connected = self.__needs_calculation and self.__value_type.correctly_connected(self.__calculation_type, list(configuration_attribute.get_input_configuration_attributes().keys()))
+        
+        self.__connected_snapshots = []
+        self.__setup_input_scalars_per_snapshot = []
+        self.__depends_on_sampling = None # Determined once all snapshots have been connected
+        
+    @staticmethod
+    def create_snapshots(setup_attributes):
+        """
+        Returns snapshots of the specified setup attributes and of all setup attributes they take as input, where each snapshot is connected to the snapshots of its inputs
+        """
+        snapshots = {} # Key: Setup attribute, Value: Snapshot
+        setup_attributes_to_connect = []
+        
+        for setup_attribute in setup_attributes:
+            if setup_attribute not in snapshots:
+                snapshots[setup_attribute] = SetupAttributeSnapshot(setup_attribute)
+                setup_attributes_to_connect.append(setup_attribute)
+                
+        while len(setup_attributes_to_connect) > 0:
+            setup_attribute = setup_attributes_to_connect.pop()
+            snapshot = snapshots[setup_attribute]
+            
+            # Inputs are only needed if the value is calculated
+            if not snapshot.needs_calculation():
+                continue
+                
+            for connected_setup_attribute, input_setup_scalars in setup_attribute.get_connected_setup_attributes().items():
+                if connected_setup_attribute not in snapshots:
+                    snapshots[connected_setup_attribute] = SetupAttributeSnapshot(connected_setup_attribute)
+                    setup_attributes_to_connect.append(connected_setup_attribute)
+                    
+                snapshot.add_connected_snapshot(snapshots[connected_setup_attribute], input_setup_scalars)
+                
+        return snapshots
+        
+    def add_connected_snapshot(self, connected_snapshot, input_setup_scalars):
+        if input_setup_scalars != None:
+            input_setup_scalars = list(input_setup_scalars)
+            
+        self.__connected_snapshots.append(connected_snapshot)
+        self.__setup_input_scalars_per_snapshot.append(input_setup_scalars)
+        
+    def needs_calculation(self):
+        return self.__needs_calculation
+        
+    def depends_on_sampling(self):
+        """
+        Returns whether the calculated value is estimated through sampling, either by itself or by any of its inputs
+        """
+        if self.__depends_on_sampling == None:
+            self.__depends_on_sampling = self.__needs_calculation and \
+                                         (self.__calculation_type.is_sampled() or any(connected_snapshot.depends_on_sampling() for connected_snapshot in self.__connected_snapshots))
+            
+        return self.__depends_on_sampling
+        
+    def get_setup_attribute(self):
+        return self.__setup_attribute
+        
+    def get_value_type(self):
+        return self.__value_type
+        
+    def get_current_value(self):
+        if self.__override_value != None:
+            return self.__override_value
+            
+        return self.__value
+        
+    def get_value(self):
+        return self.__value
+        
+    def reset_value(self):
+        """
+        Resets a calculated value so that it is calculated again, such as with more samples
+        """
+        if self.__needs_calculation:
+            self.__value = None
+            
+    # Used in place of the configuration attribute when combining values
+    def get_input_scalar(self):
+        return self.__input_scalar
+        
+    def get_input_offset(self):
+        return self.__input_offset
+        
+    def calculate_value(self, num_samples):
+        """
+        Calculates the value based on the snapshots of input attributes, in the same way as the setup attribute itself
+        """
+        if self.__value != None:
+            return
+            
+        for connected_snapshot in self.__connected_snapshots:
+            connected_snapshot.calculate_value(num_samples)
+            
+        if self.__is_correctly_connected:
+            self.__value = combine_values(self.__value_type, \
+                                          self.__calculation_type, \
+                                          self.__connected_snapshots, \
+                                          self.__setup_input_scalars_per_snapshot, \
+                                          self, \
+                                          num_samples)
+        else:
+            self.__value = ("CONFIGURATION ERROR",)
+            
+    def apply_value(self, value):
+        """
+        Sets a calculated value of the setup attribute, unless it has been given another value since the snapshot was created
+        
+        value: Value calculated from the snapshot, which is passed on separately as the snapshot might already be calculating a more precise value
+        """
+        current_value = self.__setup_attribute.get_value()
+        
+        if current_value == None or current_value is self.__applied_value:
+            self.__setup_attribute.set_value(value)
+            self.__applied_value = value
@@ -6,6 +6,7 @@ class SetupClass:
         self.__instance_name = instance_name
         self.__configuration_class = configuration_class
         self.__setup_attributes = []
+        self.__setup_attributes_per_configuration_attribute = {} # Used for finding connected setup attributes without going through all setup attributes
         self.__input_setup_classes = {} # Key: Setup class, Value: List of input scalars
         
         # Create setup versions of each configuration attribute in the specified configuration class
@@ -31,12 +32,19 @@ class SetupClass:
     def get_setup_attributes(self):
         return self.__setup_attributes
         
+    def get_setup_attribute(self, configuration_attribute):
+        """
+        Returns the setup attribute corresponding to a configuration attribute, or None if there is no such setup attribute
+        """
+        return self.__setup_attributes_per_configuration_attribute.get(configuration_attribute)
+        
     def create_setup_attribute(self, configuration_attribute):
         """
         Creates a setup version of a configuration attribute
         """
         setup_attribute = SetupAttribute(self, configuration_attribute)
         self.__setup_attributes.append(setup_attribute)
+        self.__setup_attributes_per_configuration_attribute[configuration_attribute] = setup_attribute
         
         return setup_attribute
         
@@ -44,10 +52,8 @@ class SetupClass:
         """
         Removes a setup attribute based on its configuration attribute
         """
-        for setup_attribute in self.__setup_attributes:
-            if setup_attribute.has_configuration_attribute(configuration_attribute):
-                self.__setup_attributes.remove(setup_attribute)
-                break
+        if configuration_attribute in self.__setup_attributes_per_configuration_attribute:
+            self.__setup_attributes.remove(self.__setup_attributes_per_configuration_attribute.pop(configuration_attribute))
         
     def get_input_setup_classes(self):
         return self.__input_setup_classes
@@ -1,9 +1,6 @@
-import os
-import importlib.util
 from general_gui import GUIModelingBlock
-from script_interface import ScriptInterface
 from helper_functions_general import convert_grid_coordinate_to_actual
-from default_coordinate_functions import get_save_coordinate, get_settings_coordinate, get_change_configuration_view_start_coordinate, get_change_setup_view_start_coordinate, get_create_class_coordinate, get_create_input_coordinate, get_to_setup_start_coordinate, get_create_connection_coordinate, get_calculate_values_coordinate, get_create_attribute_offset, get_create_configuration_view_offset, get_create_setup_view_offset, get_run_script_start_coordinate
+from default_coordinate_functions import get_save_coordinate, get_settings_coordinate, get_create_class_coordinate, get_create_input_coordinate, get_create_connection_coordinate, get_calculate_values_coordinate, get_create_attribute_offset, get_run_script_start_coordinate
 from config import *
 
 class Button(GUIModelingBlock):
@@ -66,26 +63,6 @@ class TouchButton(Button):
         command = lambda: configuration_class_gui.create_attribute()
         return TouchButton(model, view, "+", x, y, ADD_ATTRIBUTE_WIDTH, ADD_ATTRIBUTE_HEIGHT, ADD_ATTRIBUTE_COLOR, command, tags_rect=(), tags_text=())
         
-    @staticmethod
-    def add_view(model, view, is_configuration_view):
-        """
-        Button for adding another view
-        """
-        if is_configuration_view:
-            offset_x, offset_y = get_create_configuration_view_offset()
-            x, y = get_change_configuration_view_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-            command = lambda: model.create_view(True, "New configuration")
-            
-        else:
-            offset_x, offset_y = get_create_setup_view_offset()
-            x, y = get_change_setup_view_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-            command = lambda: model.create_view(False, "New setup")
-            
-        x += offset_x
-        y += offset_y
-        
-        return TouchButton(model, view, "+", x, y, ADD_CHANGE_VIEW_WIDTH, ADD_CHANGE_VIEW_HEIGHT, ADD_CHANGE_VIEW_COLOR, command, ignore_zoom=True)
-        
     @staticmethod
     def save(model, view):
         """
@@ -106,26 +83,6 @@ class TouchButton(Button):
         command = lambda: Options.settings(model, view)
         return TouchButton(model, view, "Settings", x, y, SETTINGS_WIDTH, SETTINGS_HEIGHT, SETTINGS_COLOR, command, ignore_zoom=True)
         
-    @staticmethod
-    def change_view(model, view, view_name, view_to_change_to, is_configuration_view, current_number_of_buttons):
-        """
-        Button for changing to a specified view
-        """
-        if view == view_to_change_to:
-            color = CHANGE_VIEW_SELECTED_COLOR # Appear selected if it changes to the existing view
-            command = None # No need to make any changes when pressed
-        else:
-            color = CHANGE_VIEW_COLOR
-            command = lambda: model.change_view(view_to_change_to)
-            
-        if is_configuration_view:
-            x, y = get_change_configuration_view_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-        else:
-            x, y = get_change_setup_view_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-            
-        y += current_number_of_buttons * CHANGE_VIEW_HEIGHT
-        return TouchButton(model, view, view_name, x, y, CHANGE_VIEW_WIDTH, CHANGE_VIEW_HEIGHT, color, command, ignore_zoom=True)
-        
     @staticmethod
     def add_configuration_class(model, view):
         """
@@ -144,20 +101,6 @@ class TouchButton(Button):
         command = lambda: view.create_configuration_input_gui()
         return TouchButton(model, view, "Add input", x, y, ADD_INPUT_WIDTH, ADD_INPUT_HEIGHT, ADD_INPUT_COLOR, command, ignore_zoom=True)
         
-    @staticmethod
-    def add_to_setup(model, view, configuration_class_gui, current_number_of_buttons):
-        """
-        Button for creating a setup version of a configuration class
-        """
-        x, y = get_to_setup_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-        y += current_number_of_buttons * ADD_TO_SETUP_HEIGHT
-        command = lambda: view.create_setup_class_gui(configuration_class_gui=configuration_class_gui)
-        
-        to_setup_button = TouchButton(model, view, configuration_class_gui.get_name(), x, y, ADD_TO_SETUP_WIDTH, ADD_TO_SETUP_HEIGHT, ADD_TO_SETUP_COLOR, command, ignore_zoom=True)
-        configuration_class_gui.add_to_setup_button(view, to_setup_button)
-        
-        return to_setup_button
-        
     @staticmethod
     def create_connection(model, view):
         """
@@ -173,24 +116,18 @@ class TouchButton(Button):
         Button for calculating the values of all setup attributes
         """
         x, y = get_calculate_values_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
-        command = lambda: model.calculate_values()
-        return TouchButton(model, view, "Calculate", x, y, CALCULATE_VALUES_WIDTH, CALCULATE_VALUES_HEIGHT, CALCULATE_VALUES_COLOR, command, ignore_zoom=True)
+        command = lambda: model.cancel_background_calculation() if model.is_calculating_in_background() else model.calculate_values_in_background(progressive=True)
+        return TouchButton(model, view, CALCULATE_VALUES_TEXT, x, y, CALCULATE_VALUES_WIDTH, CALCULATE_VALUES_HEIGHT, CALCULATE_VALUES_COLOR, command, ignore_zoom=True)
         
     @staticmethod
-    def run_script(model, view, script_path, script_name, num_script_buttons):
+    def run_script(model, view, script_name, num_script_buttons):
         """
-        Button for running the corrosponding script
+        Button for running the corrosponding script, which is loaded by the script registry shared by all setup views
         """
-        # Import the module of the script
-        spec = importlib.util.spec_from_file_location(script_name, os.path.join(script_path, f"{script_name}.py"))
-        script_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(script_module)
-        
         x, y = get_run_script_start_coordinate(LENGTH_UNIT) # Uses LENGTH_UNIT as zoom is ignored
         y -= num_script_buttons * RUN_SCRIPT_HEIGHT
         
-        script_interface = ScriptInterface(model)
-        command = lambda: script_module.script_control(script_interface)
+        command = lambda: model.get_script_registry().run_script(script_name)
         return TouchButton(model, view, script_name, x, y, RUN_SCRIPT_WIDTH, RUN_SCRIPT_HEIGHT, RUN_SCRIPT_COLOR, command, ignore_zoom=True)
         
     @staticmethod
@@ -1,4 +1,4 @@
-from helper_functions_general import convert_grid_coordinate_to_actual, get_actual_coordinates_after_scale, get_font
+from helper_functions_general import convert_grid_coordinate_to_actual, get_font
 from config import *
 
 class GUICircleIndicator:
@@ -7,13 +7,16 @@ class GUICircleIndicator:
     """
     def __init__(self, view, x, y, radius, color, outline_width, text):
         self.__view = view
-        self.__x = x
-        self.__y = y
+        self.__x = x - view.get_offset()[0] # Relative to the offset of the view, as panning only moves the items on the canvas
+        self.__y = y - view.get_offset()[1]
         self.__radius = radius
         self.__color = color
         self.__outline_width = outline_width
         self.__circle = None
         self.__label = None
+        self.__text = None
+        self.__is_shown = True
+        self.__is_released = False # Whether the items have been deleted as the indicator is far outside the visible part of the view
         
         self.create(text)
         self.update_font_size()
@@ -32,27 +35,49 @@ class GUICircleIndicator:
         self.__view.get_canvas().move(self.__circle, actual_move_x, actual_move_y)
         self.__view.get_canvas().move(self.__label, actual_move_x, actual_move_y)
         
-    def scale(self, new_length_unit, last_length_unit):
-        circle_x1, circle_y1, circle_x2, circle_y2 = get_actual_coordinates_after_scale(self.__view.get_canvas().coords(self.__circle), new_length_unit, last_length_unit)
-        label_x, label_y = get_actual_coordinates_after_scale(self.__view.get_canvas().coords(self.__label), new_length_unit, last_length_unit)
-        
-        self.__view.get_canvas().coords(self.__circle, circle_x1, circle_y1, circle_x2, circle_y2)
-        self.__view.get_canvas().coords(self.__label, label_x, label_y)
-        
-        self.update_font_size()
-        
     def update_font_size(self):
         self.__view.get_canvas().itemconfig(self.__label, font=get_font(self.__view.get_length_unit(), canvas_and_label=(self.__view.get_canvas(), self.__label)))
         
+    def set_shown(self, is_shown):
+        """
+        Shows or hides the indicator, such as when the block it belongs to leaves the visible part of the view
+        """
+        self.__is_shown = is_shown
+        state = "normal" if is_shown else "hidden"
+        
+        self.__view.get_canvas().itemconfig(self.__circle, state=state)
+        self.__view.get_canvas().itemconfig(self.__label, state=state)
+        
+    def set_released(self, is_released):
+        """
+        Deletes the items of the indicator or draws them again, such as when the block it belongs to is far outside the visible part of the view
+        """
+        if is_released != self.__is_released:
+            self.__is_released = is_released
+            
+            if is_released:
+                self.remove()
+            else:
+                self.create(self.__text)
+                
     def get_x(self):
-        return self.__x
+        return self.__x + self.__view.get_offset()[0]
+        
+    def get_y(self):
+        return self.__y + self.__view.get_offset()[1]
         
     def create(self, text):
         """
         Draws the indicator on the canvas
         """
+        self.__text = text
+        
+        # Drawn once the indicator is no longer released
+        if self.__is_released:
+            return
+            
         circle_radius = convert_grid_coordinate_to_actual(self.__radius, 0, self.__view.get_length_unit())[0]
-        actual_x, actual_y = convert_grid_coordinate_to_actual(self.__x, self.__y, self.__view.get_length_unit())
+        actual_x, actual_y = convert_grid_coordinate_to_actual(self.get_x(), self.get_y(), self.__view.get_length_unit())
         
         self.__circle = self.__view.get_canvas().create_oval(actual_x-circle_radius, \
                                                              actual_y-circle_radius, \
@@ -61,8 +86,11 @@ class GUICircleIndicator:
                                                              width=self.__outline_width, \
                                                              outline=OUTLINE_COLOR, \
                                                              fill=self.__color, \
-                                                             tags=(TAG_INDICATOR,))
-        self.__label = self.__view.get_canvas().create_text(actual_x, actual_y, text=text, font=get_font(self.__view.get_length_unit()), tags=(TAG_INDICATOR_TEXT,))
+                                                             tags=(TAG_INDICATOR, TAG_CONTENT))
+        self.__label = self.__view.get_canvas().create_text(actual_x, actual_y, text=text, font=get_font(self.__view.get_length_unit()), tags=(TAG_INDICATOR_TEXT, TAG_CONTENT))
+        
+        if not self.__is_shown:
+            self.set_shown(False)
         
     def remove(self):
         """
@@ -62,12 +62,6 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         for connection in self.__connections:
             connection.move_lines(move_x, move_y)
             
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
-        
-        for connection in self.__connections:
-            connection.scale(new_length_unit, last_length_unit)
-        
     def get_configuration_attribute(self):
         return self.__configuration_attribute
         
@@ -120,6 +114,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         """
         Sets whether the corresponding setup version of this attribute should be hidden from setup views
         """
+        self.get_model().restore_all_setup_views() # Saved setup views can only be restored with the configurations they were saved with
         self.__configuration_attribute.set_hidden(is_hidden)
         
         if is_hidden:
@@ -142,6 +137,8 @@ class GUIConfigurationAttribute(GUIModelingBlock):
                         
                 setup_class_gui.update_setup_attribute_gui_order()
                 
+        self.set_linked_views_changed()
+        
     def get_setup_attributes_gui(self):
         return self.__setup_attributes_gui
         
@@ -160,6 +157,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         """
         self.__configuration_attribute.set_name(name)
         self.update_text()
+        self.set_linked_views_changed()
         
     def get_value_type(self):
         return self.__configuration_attribute.get_value_type()
@@ -170,6 +168,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         """
         self.__configuration_attribute.set_value_type(value_type)
         self.update_text()
+        self.set_linked_views_changed()
         
     def get_calculation_type(self):
         return self.__configuration_attribute.get_calculation_type()
@@ -178,6 +177,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         """
         Sets the mathematical operation performed between input values
         """
+        self.get_model().restore_all_setup_views()
         self.__configuration_attribute.set_calculation_type(calculation_type)
         
         # Update value entry type (manual entry or calculated value) of setup versions
@@ -185,6 +185,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
             setup_attribute_gui.update_value_input_type()
             
         self.update_text()
+        self.set_linked_views_changed()
         
     def reset_calculation_type(self):
         self.set_calculation_type(None)
@@ -194,18 +195,29 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         
     def set_input_scalar(self, input_scalar):
         self.__configuration_attribute.set_input_scalar(input_scalar)
+        self.set_linked_views_changed()
         
     def reset_input_scalar(self):
         self.__configuration_attribute.reset_input_scalar()
+        self.set_linked_views_changed()
         
     def get_input_offset(self):
         return self.__configuration_attribute.get_input_offset()
         
     def set_input_offset(self, input_offset):
         self.__configuration_attribute.set_input_offset(input_offset)
+        self.set_linked_views_changed()
         
     def reset_input_offset(self):
         self.__configuration_attribute.reset_input_offset()
+        self.set_linked_views_changed()
+        
+    def set_linked_views_changed(self):
+        """
+        Marks the views of this attribute and its linked copies as changed, as they all save the shared configuration attribute
+        """
+        for configuration_attribute_gui in [self] + self.get_model().get_linked_configuration_attributes_gui(self):
+            configuration_attribute_gui.get_view().set_changed()
         
     def get_attribute_text(self):
         """
@@ -252,6 +264,9 @@ class GUIConfigurationAttribute(GUIModelingBlock):
         if self.is_deleted():
             return
             
+        if manual_delete:
+            self.get_model().restore_all_setup_views()
+            
         super().delete()
         
         # Delete held connection if it is attached to this attribute
@@ -271,7 +286,7 @@ class GUIConfigurationAttribute(GUIModelingBlock):
     def save_state(self):
         return {"configuration_attribute_gui": str(self), \
                 "name": self.get_name(), \
-                "value_type": self.__configuration_attribute.get_value_type(), \
+                "value_type": self.__configuration_attribute.get_value_type().__name__, \
                 "input_scalar": self.get_input_scalar(), \
                 "input_offset": self.get_input_offset(), \
                 "is_hidden": self.is_hidden()}
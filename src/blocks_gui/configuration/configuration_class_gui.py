@@ -1,3 +1,4 @@
+import uuid
 from general_gui import GUIClass
 from buttons_gui import TouchButton
 from options import Options
@@ -10,21 +11,17 @@ class GUIConfigurationClass(GUIClass):
     """
     Manages a GUI configuration class
     """
-    def __init__(self, model, view, configuration_class, *, position=None, linked_group_number=None, setup_classes_gui=None, to_setup_buttons=None, configuration_attributes_gui_to_copy=None):
+    def __init__(self, model, view, configuration_class, *, position=None, linked_group_number=None, setup_classes_gui=None, configuration_attributes_gui_to_copy=None):
         self.__configuration_class = configuration_class
         super().__init__(model, view, self.__configuration_class.get_name(), CLASS_WIDTH, CLASS_HEIGHT, True, position=position, linked_group_number=linked_group_number)
         self.__configuration_attributes_gui = []
+        self.__save_id = uuid.uuid4().hex # Identifies the class in saves, which is kept when restoring so that views saved at different times refer to the same class
         
         if setup_classes_gui == None:
             self.__setup_classes_gui = []
         else:
             self.__setup_classes_gui = setup_classes_gui
             
-        if to_setup_buttons == None:
-            self.__to_setup_buttons = {} # Key: View, Value: Create setup version button
-        else:
-            self.__to_setup_buttons = to_setup_buttons
-            
         self.__add_attribute_button = TouchButton.add_attribute(model, view, self)
         self.add_attached_block(self.__add_attribute_button)
         
@@ -44,7 +41,6 @@ class GUIConfigurationClass(GUIClass):
                                      position=position, \
                                      linked_group_number=configuration_class_gui.get_linked_group_number(), \
                                      setup_classes_gui=configuration_class_gui.get_setup_classes_gui(), \
-                                     to_setup_buttons=configuration_class_gui.get_to_setup_buttons(), \
                                      configuration_attributes_gui_to_copy=configuration_class_gui.get_configuration_attributes_gui())
         
     def open_options(self):
@@ -53,6 +49,12 @@ class GUIConfigurationClass(GUIClass):
     def get_configuration_class(self):
         return self.__configuration_class
         
+    def get_save_id(self):
+        return self.__save_id
+        
+    def set_save_id(self, save_id):
+        self.__save_id = save_id
+        
     def create_attribute(self, configuration_attribute_gui_to_copy=None):
         """
         Create configuration attribute and any corresponding setup attributes
@@ -67,6 +69,7 @@ class GUIConfigurationClass(GUIClass):
             
         # Create new
         else:
+            self.get_model().restore_all_setup_views() # Saved setup views can only be restored with the configurations they were saved with
             configuration_attribute_gui = GUIConfigurationAttribute.new(self.get_model(), self.get_view(), self)
             
             # Update any existing linked GUI configuration classes
@@ -120,6 +123,8 @@ class GUIConfigurationClass(GUIClass):
         if move_to_index >= len(configuration_attributes_gui) or move_to_index < 0:
             return
             
+        self.get_model().restore_all_setup_views()
+        
         # Swap GUI positions of blocks
         configuration_attributes_gui[move_from_index].move_block(0, -steps_to_move_up)
         configuration_attributes_gui[move_to_index].move_block(0, steps_to_move_up)
@@ -144,16 +149,6 @@ class GUIConfigurationClass(GUIClass):
     def remove_setup_class_gui(self, setup_class_gui):
         self.__setup_classes_gui.remove(setup_class_gui)
         
-    def get_to_setup_buttons(self):
-        return self.__to_setup_buttons
-            
-    def add_to_setup_button(self, view, to_setup_button):
-        self.__to_setup_buttons[view] = to_setup_button
-        
-    def remove_to_setup_button(self, view):
-        if view in self.__to_setup_buttons:
-            self.__to_setup_buttons.pop(view)
-            
     def get_name(self):
         return self.__configuration_class.get_name()
         
@@ -172,11 +167,12 @@ class GUIConfigurationClass(GUIClass):
         for setup_class_gui in self.__setup_classes_gui:
             setup_class_gui.update_text()
             
-        # Update the text of the buttons that add the class to the setup views
-        for to_setup_button in self.__to_setup_buttons.values():
-            to_setup_button.set_text(name)
-            
-        self.get_model().update_add_to_setup_button_order()
+        # Update the text and order of the list of classes that can be added to the setup views
+        self.get_model().get_class_palette().update_order()
+        
+        # The name is saved in the views of all linked copies
+        for configuration_class_gui in [self] + self.get_model().get_linked_configuration_classes_gui(self):
+            configuration_class_gui.get_view().set_changed(False)
         
     def update_value_input_types(self, specific_attribute_index=None):
         """
@@ -186,18 +182,25 @@ class GUIConfigurationClass(GUIClass):
             setup_class_gui.update_value_input_types(specific_attribute_index=specific_attribute_index, update_linked=False)
             
     def delete(self):
+        self.get_model().restore_all_setup_views()
+        linked_configuration_classes_gui = self.get_model().get_linked_configuration_classes_gui(self)
+        
         super().delete()
         
-        # Remove button for creating setup version and delete all setup class version if there are no currently linked copies of this configuration class
+        # Remove the class from the list of classes that can be added to setup views and delete all setup class version if there are no currently linked copies of this configuration class
         if self.get_linked_group_number() == None:
-            self.get_model().remove_add_to_setup_buttons(list(self.__to_setup_buttons.values()))
+            self.get_model().get_class_palette().remove_configuration_class_gui(self)
             
             delete_all(self.__setup_classes_gui)
             
+        # Let a remaining linked copy be used when adding setup versions
+        elif len(linked_configuration_classes_gui) > 0:
+            self.get_model().get_class_palette().replace_configuration_class_gui(self, linked_configuration_classes_gui[0])
+            
         self.get_view().remove_configuration_class_gui(self)
         
     def save_state(self):
-        saved_states = super().save_state() | {"name": self.get_name(), "configuration_class_gui": str(self), "configuration_attributes_gui": []}
+        saved_states = super().save_state() | {"name": self.get_name(), "configuration_class_gui": self.__save_id, "configuration_attributes_gui": []}
         
         for configuration_attribute_gui in self.__configuration_attributes_gui:
             saved_states["configuration_attributes_gui"].append(configuration_attribute_gui.save_state())
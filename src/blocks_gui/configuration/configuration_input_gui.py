@@ -73,13 +73,6 @@ class GUIConfigurationInput(GUIModelingBlock):
             if input_indicator != None:
                 input_indicator.move(move_x, move_y)
                 
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
-        
-        for input_indicator in (self.__input_scalar_indicator, self.__input_offset_indicator):
-            if input_indicator != None:
-                input_indicator.scale(new_length_unit, last_length_unit)
-                
     def attempt_to_attach_to_attribute(self):
         """
         Attempt to attach to an adjacent GUI configuration attribute
@@ -180,6 +173,7 @@ class GUIConfigurationInput(GUIModelingBlock):
                     
         self.update_calculation_type()
         self.update_connection_numbers()
+        self.get_view().set_changed()
         
     def update_calculation_type(self):
         """
@@ -331,8 +325,9 @@ class GUIConfigurationInput(GUIModelingBlock):
             self.__input_scalar_indicator.remove()
             
     def save_state(self):
+        calculation_type = self.get_calculation_type()
         saved_states = super().save_state() | \
-                       {"calculation_type": self.get_calculation_type(), \
+                       {"calculation_type": calculation_type.__name__ if calculation_type != None else None, \
                         "connections": [connection.save_state() for connection in self.__connections]}
         
         if self.is_attached():
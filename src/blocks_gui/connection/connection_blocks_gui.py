@@ -161,13 +161,6 @@ class GUIConnectionTriangle(GUIBlock):
         if (not self.get_view().is_panning() and not self.get_view().is_zooming()) or not self.__is_end_block:
             self.__connection.move_lines(move_x, move_y)
             
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
-        
-        # Scale the connection between the triangle blocks if this is the start block
-        if not self.__is_end_block:
-            self.__connection.scale(new_length_unit, last_length_unit)
-            
     def open_options(self):
         self.__connection.open_options()
             
@@ -175,34 +168,50 @@ class GUIConnectionTriangle(GUIBlock):
         """
         When releasing the block after dragging it, attempt to attach to an adjacent setup class
         """
-        for setup_class_gui in self.get_view().get_setup_classes_gui():
-            is_adjacent, direction = setup_class_gui.is_adjacent([(self.get_x(), self.get_y())])
+        setup_class_gui, direction = self.get_view().get_adjacent_setup_class_gui(self.get_x(), self.get_y())
+        
+        # Attach to class, unless the connection was deleted due to being redundant
+        if setup_class_gui != None and not self.attach_to_setup_class_gui(setup_class_gui, direction):
+            return
             
-            # Attach to class
-            if is_adjacent:
-                # If this connection is redundant (another already exist between these two setup classes), delete it
-                if (self.__is_end_block and \
-                    self.__connection.get_start_setup_class() in setup_class_gui.get_setup_class().get_input_setup_classes()) \
-                   or \
-                   (not self.__is_end_block and \
-                    self.__connection.get_end_setup_class() != None and \
-                    setup_class_gui.get_setup_class() in self.__connection.get_end_setup_class().get_input_setup_classes()):
-                    self.delete()
-                    return
-                    
-                setup_class_gui.add_connection(self.__connection)
-                setup_class_gui.add_attached_block(self)
-                self.__attached_setup_class_gui = setup_class_gui
-                
-                self.__connection.update_direction(self, direction)
-                self.rotate_triangle(direction)
-                
-                self.attempt_to_enable_calculation_connection() # If both ends are connected, the connection is now used for calculations
-                
-                break
-                
         self.__connection.correct_scalars_indicator_location()
         
+    def put_down_next_to(self, setup_class_gui, side):
+        """
+        Moves the block next to the specified side of a setup class and attaches to it, without searching for which setup class is adjacent
+        """
+        x, y = setup_class_gui.get_side_coordinate(side)
+        self.move_block(x - self.get_x(), y - self.get_y())
+        
+        if self.attach_to_setup_class_gui(setup_class_gui, side):
+            self.__connection.correct_scalars_indicator_location()
+            
+    def attach_to_setup_class_gui(self, setup_class_gui, direction):
+        """
+        Attaches the block to a setup class, where the direction is the side of the setup class the block is on
+        Returns False if the connection instead was deleted due to being redundant
+        """
+        # If this connection is redundant (another already exist between these two setup classes), delete it
+        if (self.__is_end_block and \
+            self.__connection.get_start_setup_class() in setup_class_gui.get_setup_class().get_input_setup_classes()) \
+           or \
+           (not self.__is_end_block and \
+            self.__connection.get_end_setup_class() != None and \
+            setup_class_gui.get_setup_class() in self.__connection.get_end_setup_class().get_input_setup_classes()):
+            self.delete()
+            return False
+            
+        setup_class_gui.add_connection(self.__connection)
+        setup_class_gui.add_attached_block(self)
+        self.__attached_setup_class_gui = setup_class_gui
+        
+        self.__connection.update_direction(self, direction)
+        self.rotate_triangle(direction)
+        
+        self.attempt_to_enable_calculation_connection() # If both ends are connected, the connection is now used for calculations
+        
+        return True
+        
     def rotate_triangle(self, new_direction):
         """
         Rotates the triangle to point in the specified direction
@@ -2,7 +2,7 @@ import tkinter as tk
 import numpy as np
 from connection_blocks_gui import GUIConnectionCorner, GUIConnectionTriangle
 from circle_indicator_gui import GUICircleIndicator
-from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid, get_actual_coordinates_after_scale, get_grid_mid_x, get_grid_mid_y, convert_direction_to_vector
+from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid, get_grid_mid_x, get_grid_mid_y, convert_direction_to_vector
 from options import Options
 from config import *
 
@@ -34,6 +34,11 @@ class GUIConnection:
         self.__is_external = is_external
         self.__is_deleted = False
         
+        # Connections outside the visible part of the view are hidden like blocks, where their lines are released when far outside
+        self.__is_shown = True
+        self.__is_detail_shown = True
+        self.__is_released = False
+        
         start_block.add_connection(self)
         
         # End block was specified
@@ -52,27 +57,12 @@ class GUIConnection:
                 
             self.adjust_lines_to_dragged_corners()
             
-    def scale(self, new_length_unit, last_length_unit):
-        """
-        Scales items on the canvas when zooming
-        """
-        # Scale lines
-        for line in self.__lines:
-            adjusted_actual_coordinates = get_actual_coordinates_after_scale(self.__view.get_canvas().coords(line), new_length_unit, last_length_unit)
-            x1, y1, x2, y2 = adjusted_actual_coordinates
-            self.__view.get_canvas().coords(line, x1, y1, x2, y2)
-            
-        # Scale corners        
-        for corner in self.__corners:
-            corner.scale(new_length_unit, last_length_unit)
-            
-        # Scale connection order indicator
-        if self.__num_order_indicator != None:
-            self.__num_order_indicator.scale(new_length_unit, last_length_unit)
-            
     def open_options(self):
         return Options.connection(self.__model, self.__view, self)
             
+    def get_view(self):
+        return self.__view
+        
     def get_start_block(self):
         return self.__start_block
         
@@ -109,12 +99,15 @@ class GUIConnection:
             
         self.create_new_lines()
         
-    def create_new_lines(self, mouse_location=None):
+    def create_new_lines(self, mouse_location=None, *, affects_values=True):
         """
         Deletes existing lines and corners, creating new ones
+        
+        affects_values: Whether the calculated values become outdated, which is not the case when the lines only follow a moved block
         """
         self.remove_corners()
         self.remove_lines()
+        self.__view.set_changed(affects_values)
         
         start_x, start_y = self.__start_block.get_connection_grid_start(self.__start_direction)
         
@@ -144,13 +137,66 @@ class GUIConnection:
         else:
             self.create_lines_from_corners()
             
+        self.update_cells()
+        
     def adjust_lines_to_dragged_corners(self):
         """
         Corrects the lines to match the new position of corners as they have been dragged around
         """
         self.remove_lines()
         self.create_lines_from_corners()
+        self.update_cells()
+        
+    def update_cells(self):
+        """
+        Updates the culling cells that the view uses to show or hide the connection, such as after its lines have changed
+        """
+        coordinates = [self.__start_block.get_connection_grid_start(self.__start_direction)] + [(corner.get_x(), corner.get_y()) for corner in self.__corners]
         
+        if self.__end_block != None:
+            coordinates.append(self.__end_block.get_connection_grid_start(self.__end_direction))
+            
+        x_coordinates, y_coordinates = zip(*coordinates)
+        self.__view.update_culling_cells(self, min(x_coordinates), min(y_coordinates), max(x_coordinates) + 1, max(y_coordinates) + 1)
+        
+    def is_shown(self):
+        return self.__is_shown
+        
+    def is_detail_shown(self):
+        return self.__is_detail_shown
+        
+    def set_shown(self, is_shown, is_detail_shown=None):
+        """
+        Shows or hides the lines and corners, such as when the connection leaves the visible part of the view, where the number indicator is only shown together with details
+        """
+        if is_detail_shown == None:
+            is_detail_shown = is_shown
+            
+        self.__is_shown = is_shown
+        self.__is_detail_shown = is_detail_shown
+        
+        for line in self.__lines:
+            self.__view.get_canvas().itemconfig(line, state="normal" if is_shown else "hidden")
+            
+        for corner in self.__corners:
+            corner.set_shown(is_shown)
+            
+        if self.__num_order_indicator != None:
+            self.__num_order_indicator.set_shown(is_detail_shown)
+            
+    def is_released(self):
+        return self.__is_released
+        
+    def set_released(self, is_released):
+        """
+        Deletes the lines or draws them again, such as when the connection is far outside the visible part of the view, where the corners are kept as they store the path
+        """
+        if is_released:
+            self.remove_lines()
+            self.__is_released = True
+        else:
+            self.create_lines_from_corners()
+            
     def get_corners(self):
         return self.__corners
                 
@@ -205,11 +251,13 @@ class GUIConnection:
             if self.__num_order_indicator != None:
                 self.__num_order_indicator.move(move_x, move_y)
                 
+            self.update_cells()
+            
             return True
             
         # If not panning, need to create completely new lines and corners
         else:
-            self.create_new_lines()
+            self.create_new_lines(affects_values=False)
             
             return False
             
@@ -217,7 +265,8 @@ class GUIConnection:
         """
         Will add an indicator for the order which this connection has been connected to a specific input block (important for some mathematical operations) if it has a specific number
         """
-        if self.__num_order != None:
+        # Created once the lines are drawn again
+        if self.__num_order != None and not self.__is_released:
             num_order_x, num_order_y = self.__start_block.get_connection_grid_start(self.__start_direction)
             
             if self.__start_direction == "LEFT":
@@ -227,6 +276,9 @@ class GUIConnection:
             
             self.__num_order_indicator = GUICircleIndicator(self.__view, num_order_x, num_order_y, NUM_ORDER_CIRCLE_RADIUS, NUM_ORDER_CIRCLE_COLOR, NUM_ORDER_CIRCLE_OUTLINE, self.__num_order)
             
+            if not self.__is_detail_shown:
+                self.__num_order_indicator.set_shown(False)
+            
     def attempt_to_remove_number_indicator(self):
         """
         Removes indicator for which order the connection has been connected to a specific input block if such an indicator exists
@@ -260,14 +312,19 @@ class GUIConnection:
             
             # Draw a dashed line if an external connection
             if self.__is_external:
-                line = self.__view.get_canvas().create_line(from_x, from_y, to_x, to_y, fill=CONNECTION_COLOR, width=CONNECTION_WIDTH, dash=CONNECTION_DASH, tags=(TAG_CONNECTION_LINE,))
+                line = self.__view.get_canvas().create_line(from_x, from_y, to_x, to_y, fill=CONNECTION_COLOR, width=CONNECTION_WIDTH, dash=CONNECTION_DASH, tags=(TAG_CONNECTION_LINE, TAG_CONTENT))
             else:
-                line = self.__view.get_canvas().create_line(from_x, from_y, to_x, to_y, fill=CONNECTION_COLOR, width=CONNECTION_WIDTH, tags=(TAG_CONNECTION_LINE,))
+                line = self.__view.get_canvas().create_line(from_x, from_y, to_x, to_y, fill=CONNECTION_COLOR, width=CONNECTION_WIDTH, tags=(TAG_CONNECTION_LINE, TAG_CONTENT))
                 
             self.__lines.append(line)
             
+        self.__is_released = False
         self.attempt_to_create_number_indicator()
         
+        # New lines and corners follow whether the connection is currently shown
+        if not self.__is_shown:
+            self.set_shown(False)
+        
     def positions_dot_product(self, current_position, final_position):
         """
         current_position: Tuple (x, y, direction)
@@ -449,6 +506,8 @@ class GUIConnection:
                     
             self.remove_corners()
             self.remove_lines()
+            self.__view.remove_culling_cells(self)
+            self.__view.set_changed()
             
     def save_state(self):
         saved_states = {"start_block": str(self.__start_block), \
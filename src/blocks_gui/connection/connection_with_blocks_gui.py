@@ -8,7 +8,7 @@ class GUIConnectionWithBlocks(GUIConnection):
     """
     Manages directional connection with already attached triangle blocks found in setup views
     """
-    def __init__(self, model, view, *, start_coordinate=None, end_coordinate=None, input_scalars=None, input_scalars_indicator_coordinate=None):
+    def __init__(self, model, view, *, start_coordinate=None, end_coordinate=None, start_setup_class_gui=None, end_setup_class_gui=None, sides=("RIGHT", "LEFT"), input_scalars=None, input_scalars_indicator_coordinate=None):
         self.__model = model
         self.__view = view
         self.__input_scalars = (1,)
@@ -19,18 +19,30 @@ class GUIConnectionWithBlocks(GUIConnection):
         super().__init__(model, view, start_block, "RIGHT", end_block=end_block, end_direction="LEFT")
         self.__is_deleted = False
         
+        # Attach start block directly to specified setup class
+        if start_setup_class_gui != None:
+            start_block.put_down_next_to(start_setup_class_gui, sides[0])
+            
         # Move start block to specified coordinate
-        if start_coordinate != None:
+        elif start_coordinate != None:
             start_block.move_block(start_coordinate[0] - start_block.get_x(), \
                                    start_coordinate[1] - start_block.get_y())
             start_block.put_down_block()
             
+        # Attach end block directly to specified setup class
+        if end_setup_class_gui != None:
+            end_block.put_down_next_to(end_setup_class_gui, sides[1])
+            
         # Move end block to specified coordinate
-        if end_coordinate != None:
+        elif end_coordinate != None:
             end_block.move_block(end_coordinate[0] - end_block.get_x(), \
                                  end_coordinate[1] - end_block.get_y())
             end_block.put_down_block()
             
+        # Deleted when attaching, as the setup classes were already connected
+        if self.__is_deleted:
+            return
+            
         if input_scalars != None:
             self.set_input_scalars(input_scalars)
             
@@ -39,14 +51,8 @@ class GUIConnectionWithBlocks(GUIConnection):
                                                       input_scalars_indicator_coordinate[1] - self.__input_scalars_indicator.get_y())
 
         
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
-        
-        if self.__input_scalars_indicator != None:
-            self.__input_scalars_indicator.scale(new_length_unit, last_length_unit)
-            
-    def create_new_lines(self, mouse_location=None):
-        super().create_new_lines()
+    def create_new_lines(self, mouse_location=None, *, affects_values=True):
+        super().create_new_lines(affects_values=affects_values)
         
         self.update_input_scalars_indicator()
         
@@ -55,6 +61,18 @@ class GUIConnectionWithBlocks(GUIConnection):
         
         if only_moved and self.__input_scalars_indicator != None:
             self.__input_scalars_indicator.move_block(move_x, move_y)
+            
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        
+        if self.__input_scalars_indicator != None:
+            self.__input_scalars_indicator.set_shown(self.is_detail_shown())
+            
+    def set_released(self, is_released):
+        super().set_released(is_released)
+        
+        if self.__input_scalars_indicator != None:
+            self.__input_scalars_indicator.set_released(is_released)
     
     def open_options(self):
         return Options.connection_with_blocks(self.__model, self.__view, self)
@@ -133,6 +151,7 @@ class GUIConnectionWithBlocks(GUIConnection):
             end_setup_class_gui.get_setup_class().set_input_setup_class(start_setup_class_gui.get_setup_class(), input_scalars) # Update input scalars
             
         self.update_input_scalars_indicator()
+        self.get_view().set_changed()
         
     def reset_input_scalars(self):
         self.set_input_scalars([1])
@@ -155,6 +174,12 @@ class GUIConnectionWithBlocks(GUIConnection):
             self.__input_scalars_indicator = GUIConnectionScalarsIndicator(self.__model, self.__view, self)
             self.correct_scalars_indicator_location()
             
+            if not self.is_detail_shown():
+                self.__input_scalars_indicator.set_shown(False)
+                
+            if self.is_released():
+                self.__input_scalars_indicator.set_released(True)
+            
     def correct_scalars_indicator_location(self):
         """
         Adjusts the position of the input scalars indicator to align with the grid, if the indicator exists
@@ -233,7 +258,7 @@ class GUIConnectionWithBlocks(GUIConnection):
         return allowed_directions
         
     def is_deleted(self):
-        return self.__is_deleted()
+        return self.__is_deleted
         
     def delete(self):
         if not self.__is_deleted:
@@ -244,17 +269,17 @@ class GUIConnectionWithBlocks(GUIConnection):
                 
             self.remove_corners()
             self.remove_lines()
+            self.__view.remove_culling_cells(self)
             self.__view.remove_connection_with_blocks(self)
             
             self.get_start_block().delete()
             self.get_end_block().delete()
             
-    def save_state(self):
-        saved_states = {"start_block": self.get_start_block().save_state(), "end_block": self.get_end_block().save_state(), "input_scalars": self.__input_scalars}
-        
+    def get_saved_input_scalars_coordinate(self):
+        """
+        Returns the coordinate of the input scalars indicator that is saved, or None if no indicator is shown
+        """
         if self.__input_scalars_indicator == None:
-            saved_states["input_scalars_indicator_coordinate"] = None
-        else:
-            saved_states["input_scalars_indicator_coordinate"] = self.get_input_scalars_coordinate()
+            return None
             
-        return saved_states
+        return self.get_input_scalars_coordinate()
@@ -2,7 +2,7 @@ import tkinter as tk
 import tkinter.font as tkfont
 import numpy as np
 from circle_indicator_gui import GUICircleIndicator
-from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid, get_actual_coordinates_after_scale, distance_to_closest_grid_intersection, get_font, get_text_that_fits, delete_all
+from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid, distance_to_closest_grid_intersection, get_text_that_fits, get_font, delete_all
 from default_coordinate_functions import get_block_start_coordinates
 from config import *
 
@@ -14,33 +14,34 @@ class GUIBlock:
         self.__model = model
         self.__view = view
         self.__pressable_items = pressable_items
-        self.__x = x
-        self.__y = y
+        self.__ignore_zoom = ignore_zoom
+        
+        # Blocks that are not fixed on the screen store their coordinate relative to the offset of the view, so that panning only needs to move the items on the canvas
+        if ignore_zoom:
+            self.__x = x
+            self.__y = y
+        else:
+            self.__x = x - view.get_offset()[0]
+            self.__y = y - view.get_offset()[1]
+            
         self.__width = width
         self.__height = height
-        self.__ignore_zoom = ignore_zoom
         self.__shapes_highlight = []
         self.__attached_blocks = [] # Blocks that are attached to this one, also affected by moving, scaling, highlighting, etc
         
+        self.__bind_left = bind_left
+        self.__bind_right = bind_right
         self.__draggable = bind_left == MOUSE_DRAG
         self.__pick_up_actual_coordinate = (0, 0)
         
-        canvas = view.get_canvas()
-        
-        # Bind mouse actions to the block
         for pressable_item in self.__pressable_items:
-            if bind_left in (MOUSE_PRESS, MOUSE_DRAG):
-                canvas.tag_bind(pressable_item, MOUSE_LEFT_PRESS, self.left_pressed)
-                
-            if bind_left == MOUSE_DRAG:
-                canvas.tag_bind(pressable_item, MOUSE_LEFT_DRAG, self.left_dragged)
-                canvas.tag_bind(pressable_item, MOUSE_LEFT_RELEASE, self.left_released)
-                
-            if bind_right == MOUSE_PRESS:
-                canvas.tag_bind(pressable_item, MOUSE_RIGHT_PRESS, self.right_pressed)
-                
+            self.bind_pressable_item(pressable_item)
+            
         self.__was_dragged = False
         self.__is_deleted = False
+        self.__is_shown = True # Whether the items of the block are shown, where blocks outside the visible part of the view are hidden
+        self.__is_detail_shown = True # Whether text and attached blocks are shown, which is not the case at low zoom levels
+        self.__is_released = False # Whether items of the block have been deleted as it is far outside the visible part of the view, which are recreated when it comes closer
         
         from connection_blocks_gui import GUIConnectionCorner
         
@@ -48,6 +49,36 @@ class GUIBlock:
         if not isinstance(self, GUIConnectionCorner):
             view.update_shown_order()
             
+        # Blocks that are fixed on the screen, such as buttons and options, are not saved
+        if not ignore_zoom:
+            view.set_changed()
+            
+    def bind_pressable_item(self, pressable_item):
+        """
+        Binds mouse actions of the block to one of its items
+        """
+        canvas = self.get_canvas()
+        
+        if not self.__ignore_zoom:
+            canvas.addtag_withtag(TAG_CONTENT, pressable_item)
+            
+        if self.__bind_left in (MOUSE_PRESS, MOUSE_DRAG):
+            canvas.tag_bind(pressable_item, MOUSE_LEFT_PRESS, self.left_pressed)
+            
+        if self.__bind_left == MOUSE_DRAG:
+            canvas.tag_bind(pressable_item, MOUSE_LEFT_DRAG, self.left_dragged)
+            canvas.tag_bind(pressable_item, MOUSE_LEFT_RELEASE, self.left_released)
+            
+        if self.__bind_right == MOUSE_PRESS:
+            canvas.tag_bind(pressable_item, MOUSE_RIGHT_PRESS, self.right_pressed)
+            
+    def replace_pressable_item(self, pressable_item, new_pressable_item):
+        """
+        Replaces one of the items of the block with a new one, such as when it is recreated after having been released
+        """
+        self.__pressable_items[self.__pressable_items.index(pressable_item)] = new_pressable_item
+        self.bind_pressable_item(new_pressable_item)
+        
     def left_pressed(self, event):
         """
         Pressing the left mouse button on the block
@@ -112,35 +143,6 @@ class GUIBlock:
     def right_pressed(self, event):
         pass
         
-    def scale(self, new_length_unit, last_length_unit):
-        """
-        Scales the block, typical when zooming
-        """
-        for pressable_item in self.__pressable_items + self.__shapes_highlight:
-            item_type = self.get_canvas().type(pressable_item)
-            adjusted_actual_coordinates = get_actual_coordinates_after_scale(self.get_canvas().coords(pressable_item), new_length_unit, last_length_unit)
-            
-            # Scales different items on the canvas differently
-            if item_type == "rectangle":
-                x1, y1, x2, y2 = adjusted_actual_coordinates
-                self.get_canvas().coords(pressable_item, x1, y1, x2, y2)
-                
-            elif item_type == "polygon":
-                x1, y1, x2, y2, x3, y3 = adjusted_actual_coordinates
-                self.get_canvas().coords(pressable_item, x1, y1, x2, y2, x3, y3)
-                
-            elif item_type == "text":
-                x, y = adjusted_actual_coordinates
-                has_line_break = "\n" in self.get_canvas().itemcget(pressable_item, "text")
-                
-                self.get_canvas().coords(pressable_item, x, y)
-                self.get_canvas().itemconfig(pressable_item, font=get_font(new_length_unit, \
-                                                                           canvas_and_label=(self.get_canvas(), pressable_item), \
-                                                                           has_line_break=has_line_break))
-                
-        for attached_block in self.__attached_blocks:
-            attached_block.scale(new_length_unit, last_length_unit)
-            
     def highlight(self, color, *, highlight_border_width=HIGHLIGHT_BORDER_WIDTH, update_shown_order=True, highlight_tags=()):
         """
         Create a highlight around the block
@@ -162,6 +164,9 @@ class GUIBlock:
                                                           fill=color, \
                                                           tags=highlight_tags)
                 
+                if not self.__ignore_zoom:
+                    self.get_canvas().addtag_withtag(TAG_CONTENT, rect)
+                
                 self.__shapes_highlight.append(rect)
                 
             elif item_type == "polygon":
@@ -181,12 +186,19 @@ class GUIBlock:
                 x1, y1, x2, y2, x3, y3 = new_actual_coordinate_pairs
                 triangle = self.get_canvas().create_polygon(x1, y1, x2, y2, x3, y3, width=0, fill=color)
                 
+                if not self.__ignore_zoom:
+                    self.get_canvas().addtag_withtag(TAG_CONTENT, triangle)
+                
                 self.__shapes_highlight.append(triangle)
                 
         if highlight_tags == ():
             for shape in self.__shapes_highlight:
                 self.get_canvas().tag_lower(shape)
                 
+        if not self.__is_shown:
+            for shape in self.__shapes_highlight:
+                self.get_canvas().itemconfig(shape, state="hidden")
+                
         for attached_block in self.__attached_blocks:
             attached_block.highlight(color, highlight_border_width=highlight_border_width, update_shown_order=False, highlight_tags=highlight_tags)
             
@@ -217,7 +229,7 @@ class GUIBlock:
         """
         Snaps the block to align with the grid
         """
-        move_x, move_y = distance_to_closest_grid_intersection(self.__view, self.__x, self.__y)
+        move_x, move_y = distance_to_closest_grid_intersection(self.__view, self.get_x(), self.get_y())
         
         self.move_block(move_x, move_y)
          
@@ -241,9 +253,13 @@ class GUIBlock:
             for shape_highlight in self.__shapes_highlight:
                 self.get_canvas().move(shape_highlight, move_actual_x, move_actual_y)
                 
-            self.__x = round(self.__x + move_x, DECIMALS_WHEN_ROUNDING)
-            self.__y = round(self.__y + move_y, DECIMALS_WHEN_ROUNDING)
+            self.__x += move_x
+            self.__y += move_y
             
+            # Moving blocks does not change the calculated values
+            if not self.__ignore_zoom:
+                self.__view.set_changed(False)
+                
         for block in self.__attached_blocks:
             if block != self:
                 block.move_block(move_x, move_y)
@@ -252,19 +268,21 @@ class GUIBlock:
         """
         Returns the grid coordinate that a connection line should start from
         """
+        block_x, block_y = self.get_x(), self.get_y()
+        
         # Center of block as default
-        x = self.__x + int(0.5 * self.__width)
-        y = self.__y + int(0.5 * self.__height)
+        x = block_x + int(0.5 * self.__width)
+        y = block_y + int(0.5 * self.__height)
         
         # Correct one of the values to get the correct coordinate considering the direction which the line goes out from the block
         if direction == "UP":
-            y = self.__y - 1
+            y = block_y - 1
         elif direction == "DOWN":
-            y = self.__y + int(self.__height + 0.98) # Round up to make sure blocks less than one length unit selects the correct coordinate
+            y = block_y + int(self.__height + 0.98) # Round up to make sure blocks less than one length unit selects the correct coordinate
         elif direction == "LEFT":
-            x = self.__x - 1
+            x = block_x - 1
         elif direction == "RIGHT":
-            x = self.__x + int(self.__width + 0.98)
+            x = block_x + int(self.__width + 0.98)
             
         return x, y
         
@@ -272,19 +290,21 @@ class GUIBlock:
         """
         Returns the pixel coordinate that a connection line should start from
         """
+        block_x, block_y = self.get_x(), self.get_y()
+        
         # Center of block as default
-        x = self.__x + 0.5 * self.__width
-        y = self.__y + 0.5 * self.__height
+        x = block_x + 0.5 * self.__width
+        y = block_y + 0.5 * self.__height
         
         # Correct one of the values to get the correct coordinate considering the direction which the line goes out from the block
         if direction == "UP":
-            y = self.__y
+            y = block_y
         elif direction == "DOWN":
-            y = self.__y + self.__height # Round up to make sure blocks less than one length unit selects the correct coordinate
+            y = block_y + self.__height # Round up to make sure blocks less than one length unit selects the correct coordinate
         elif direction == "LEFT":
-            x = self.__x
+            x = block_x
         elif direction == "RIGHT":
-            x = self.__x + self.__width
+            x = block_x + self.__width
             
         actual_x, actual_y = convert_grid_coordinate_to_actual(x, y, self.__view.get_length_unit())
         
@@ -300,10 +320,16 @@ class GUIBlock:
         return self.__view.get_canvas()
         
     def get_x(self):
-        return self.__x
+        if self.__ignore_zoom:
+            return self.__x
+            
+        return round(self.__x + self.__view.get_offset()[0], DECIMALS_WHEN_ROUNDING)
         
     def get_y(self):
-        return self.__y
+        if self.__ignore_zoom:
+            return self.__y
+            
+        return round(self.__y + self.__view.get_offset()[1], DECIMALS_WHEN_ROUNDING)
         
     def get_width(self):
         return self.__width
@@ -323,6 +349,12 @@ class GUIBlock:
     def add_attached_block(self, block):
         self.__attached_blocks.append(block)
         
+        if not self.__is_detail_shown:
+            block.set_shown(False)
+            
+        if self.__is_released:
+            block.set_released(True)
+        
     def remove_attached_block(self, block):
         self.__attached_blocks.remove(block)
         
@@ -344,6 +376,76 @@ class GUIBlock:
             
         return direction
         
+    def is_shown(self):
+        return self.__is_shown
+        
+    def is_detail_shown(self):
+        return self.__is_detail_shown
+        
+    def get_detail_items(self):
+        """
+        Returns the items on the canvas that are hidden at low zoom levels even if the block is shown
+        """
+        return []
+        
+    def set_shown(self, is_shown, is_detail_shown=None):
+        """
+        Shows or hides the items of the block and all blocks attached to it, such as when it leaves the visible part of the view
+        
+        is_detail_shown: Whether text and attached blocks are shown, which is the same as is_shown if None
+        """
+        if is_detail_shown == None:
+            is_detail_shown = is_shown
+            
+        self.__is_shown = is_shown
+        self.__is_detail_shown = is_detail_shown
+        detail_items = self.get_detail_items()
+        
+        for item in self.__pressable_items + self.__shapes_highlight:
+            if item in detail_items:
+                is_item_shown = is_detail_shown
+            else:
+                is_item_shown = is_shown
+                
+            self.get_canvas().itemconfig(item, state="normal" if is_item_shown else "hidden")
+            
+        for attached_block in self.__attached_blocks:
+            if attached_block != self:
+                attached_block.set_shown(is_detail_shown)
+                
+    def is_released(self):
+        return self.__is_released
+        
+    def set_released(self, is_released):
+        """
+        Releases the items of the block and all blocks attached to it that are recreated when needed again, such as when it is far outside the visible part of the view
+        """
+        self.__is_released = is_released
+        
+        for attached_block in self.__attached_blocks:
+            if attached_block != self and attached_block.is_released() != is_released:
+                attached_block.set_released(is_released)
+                
+    def is_text_fitting_postponed(self):
+        """
+        Returns whether fitting text to the block should be postponed, in which case fit_pending_text is called later on
+        """
+        # Fitted once all blocks have been built
+        if self.__model.is_bulk_building():
+            self.__model.postpone_text_fitting(self)
+            return True
+            
+        # Fitted if the view is visited
+        if not self.__view.has_been_shown():
+            self.__view.postpone_text_fitting(self)
+            return True
+            
+        # Fitted when the block is shown again
+        return not self.__is_detail_shown
+        
+    def fit_pending_text(self):
+        pass
+        
     def is_deleted(self):
         return self.__is_deleted
         
@@ -351,6 +453,9 @@ class GUIBlock:
         self.__is_deleted = True
         self.get_view().unselect_item(self)
         
+        if not self.__ignore_zoom:
+            self.__view.set_changed()
+        
         delete_all(self.__attached_blocks)
         
         for pressable_items in self.__pressable_items:
@@ -359,7 +464,7 @@ class GUIBlock:
         GUIBlock.unhighlight(self)
         
     def save_state(self):
-        return {"x": self.__x, "y": self.__y}
+        return {"x": self.get_x(), "y": self.get_y()}
         
 class GUIModelingBlock(GUIBlock):
     """
@@ -407,6 +512,10 @@ class GUIModelingBlock(GUIBlock):
             
         super().__init__(model, view, pressable_items, x, y, width, height, ignore_zoom=ignore_zoom, bind_left=bind_left, bind_right=bind_right)
         self.__text = text
+        self.__is_bold = False
+        self.__text_when_shown = None # Text and whether it is bold that is fitted to the block once it is shown again
+        self.__label_text_x = label_text_x - x # Relative to the block, used when recreating the label after it has been released
+        self.__tags_text = tags_text
         
         if text_width != None:
             self.__text_width = text_width
@@ -444,6 +553,17 @@ class GUIModelingBlock(GUIBlock):
         """
         Sets the text on the block
         """
+        self.__is_bold = is_bold
+        
+        if self.is_text_fitting_postponed():
+            self.__text = text
+            self.__text_when_shown = (text, is_bold)
+            
+            # Only fitting the text is postponed, where whether it is bold is shown right away
+            font = get_font(self.get_length_unit(), canvas_and_label=(self.get_canvas(), self.__label_text))[:2]
+            self.get_canvas().itemconfig(self.__label_text, font=font + ("bold",) if is_bold else font)
+            return
+            
         text, font = get_text_that_fits(self.get_canvas(), self.__label_text, text, self.__text_width, is_bold, self.get_length_unit())
         
         self.__text = text
@@ -452,9 +572,49 @@ class GUIModelingBlock(GUIBlock):
     def get_text_width(self):
         return self.__text_width
         
+    def get_detail_items(self):
+        return [self.__label_text]
+        
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        self.fit_pending_text()
+        
+    def set_released(self, is_released):
+        if is_released == self.is_released():
+            return
+            
+        super().set_released(is_released)
+        canvas = self.get_canvas()
+        
+        if is_released:
+            # Fitted again once the block is shown
+            if self.__text_when_shown == None:
+                self.__text_when_shown = (self.__text, self.__is_bold)
+                
+            canvas.delete(self.__label_text)
+            
+        else:
+            actual_x, actual_y = convert_grid_coordinate_to_actual(self.get_x()+self.__label_text_x, self.get_y()+self.get_height()/2, self.get_length_unit())
+            font = get_font(self.get_length_unit())
+            label_text = canvas.create_text(actual_x, actual_y, text="", font=font + ("bold",) if self.__is_bold else font, anchor="center", justify="center", state="hidden", tags=self.__tags_text)
+            
+            self.replace_pressable_item(self.__label_text, label_text)
+            self.__label_text = label_text
+            
+    def fit_pending_text(self):
+        """
+        Fits any text that was set while the text was hidden or while building many blocks at once
+        """
+        if self.__text_when_shown != None:
+            text, is_bold = self.__text_when_shown
+            self.__text_when_shown = None
+            self.set_text(text, is_bold)
+            
     def set_fill_color(self, fill_color):
         self.get_canvas().itemconfig(self.__rect, fill=fill_color)
-        self.get_canvas().update_idletasks() # Ensure that the color is changed immediately and not after other
+        
+        if not self.get_model().is_bulk_building():
+            self.get_canvas().update_idletasks() # Ensure that the color is changed immediately and not after other
         
 class GUIClass(GUIModelingBlock):
     """
@@ -475,11 +635,17 @@ class GUIClass(GUIModelingBlock):
         if self.__linked_group_indicator != None:
             self.__linked_group_indicator.move(move_x, move_y)
             
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        
+        if self.__linked_group_indicator != None:
+            self.__linked_group_indicator.set_shown(self.is_detail_shown())
+            
+    def set_released(self, is_released):
+        super().set_released(is_released)
         
         if self.__linked_group_indicator != None:
-            self.__linked_group_indicator.scale(new_length_unit, last_length_unit)
+            self.__linked_group_indicator.set_released(is_released)
             
     def is_linked(self):
         return self.__linked_group_number != None
@@ -490,6 +656,7 @@ class GUIClass(GUIModelingBlock):
     def set_linked_group_number(self, linked_group_number):
         self.__linked_group_number = linked_group_number
         self.update_linked_group_indicator()
+        self.get_view().set_changed(False)
                 
     def update_linked_group_indicator(self):
         # Remove any existing indicator
@@ -510,6 +677,12 @@ class GUIClass(GUIModelingBlock):
             # Update existing one
             else:
                 self.__linked_group_indicator.create(self.__linked_group_number)
+                
+            if not self.is_detail_shown():
+                self.__linked_group_indicator.set_shown(False)
+                
+            if self.is_released():
+                self.__linked_group_indicator.set_released(True)
         else:
             self.__linked_group_indicator = None
             
@@ -1,6 +1,6 @@
 import tkinter as tk
 from general_gui import GUIModelingBlock
-from helper_functions_general import convert_grid_coordinate_to_actual, get_actual_coordinates_after_scale, get_font
+from helper_functions_general import convert_grid_coordinate_to_actual, get_font
 from config import *
 
 class PressableEntry(GUIModelingBlock):
@@ -28,6 +28,10 @@ class PressableEntry(GUIModelingBlock):
         
         # Create an Entry if it does not exist
         if self.__entry_window == None:
+            # Any pending font update after zooming would otherwise also resize the new Entry
+            if not self.ignores_zoom():
+                self.get_view().update_fonts()
+                
             actual_width, actual_height = self.get_entry_size()
             actual_x, actual_y = convert_grid_coordinate_to_actual(self.get_x(), self.get_y(), self.get_length_unit())
             
@@ -39,6 +43,10 @@ class PressableEntry(GUIModelingBlock):
                                                                    anchor="nw", \
                                                                    width=actual_width, \
                                                                    height=actual_height)
+            
+            if not self.ignores_zoom():
+                self.get_canvas().addtag_withtag(TAG_CONTENT, self.__entry_window)
+                self.get_canvas().addtag_withtag(TAG_ENTRY_WINDOW, self.__entry_window)
                                                                    
             self.set_text("") # To ensure that the text on the block does not show underneath the Entry
             
@@ -60,19 +68,13 @@ class PressableEntry(GUIModelingBlock):
             
             self.get_canvas().coords(self.__entry_window, new_actual_x, new_actual_y)
             
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        
+        # The Entry field is only kept while its text is shown
+        if not self.is_detail_shown():
+            self.remove_entry()
         
-        if self.__entry_window != None:
-            actual_width, actual_height = self.get_entry_size()
-            actual_x, actual_y = get_actual_coordinates_after_scale(self.get_view().get_canvas().coords(self.__entry_window), \
-                                                                                                        new_length_unit, \
-                                                                                                        last_length_unit)
-            
-            self.__entry.config(font=get_font(self.get_length_unit()))
-            self.get_view().get_canvas().coords(self.__entry_window, (actual_x, actual_y))
-            self.get_view().get_canvas().itemconfig(self.__entry_window, width=actual_width, height=actual_height)
-            
     def remove_entry(self):
         """
         Removes the Entry field that appeared
@@ -1,6 +1,5 @@
 from general_gui import GUIModelingBlock
 from helper_functions_general import convert_grid_coordinate_to_actual, get_font, get_text_that_fits
-from pressable_entry import PressableEntry
 from config import *
 
 class GUISetupAttribute(GUIModelingBlock):
@@ -40,7 +39,11 @@ class GUISetupAttribute(GUIModelingBlock):
                          additional_pressable_items=[self.__label_value], \
                          bind_left=MOUSE_PRESS)
         
-        self.__entry_value = None # Manual entry field
+        self.__value_cell = None # Rectangle behind a manually entered value, which is edited through the Entry field of the view when pressed
+        self.__entered_text = None # Manually entered value as text
+        self.__entered_value = None # Manually entered value restored from a save, or None if it should be converted from the text, such as after being edited
+        self.__displayed_value_when_shown = None # Text and color of the calculated value that is fitted to the block once it is shown again
+        self.__displayed_value = None # Value, whether it is an override value, and whether it is being refined that was last displayed, or None if something else has been displayed since
         
         configuration_attribute_gui.add_setup_attribute_gui(self)
         self.update_text()
@@ -55,6 +58,11 @@ class GUISetupAttribute(GUIModelingBlock):
             self.display_calculated_value()
             
     def left_pressed(self, event):
+        # Pressing a manually entered value edits it instead of selecting the attribute
+        if self.__value_cell != None and event.x >= self.get_canvas().coords(self.__value_cell)[0]:
+            self.edit_entered_value()
+            return
+            
         super().left_pressed(event)
         self.set_input_attributes_highlight(True)
          
@@ -96,23 +104,25 @@ class GUISetupAttribute(GUIModelingBlock):
         """
         Switches to no manual input
         """
-        if self.__entry_value != None:
-            self.remove_attached_block(self.__entry_value)
-            self.__entry_value.delete()
-            self.__entry_value = None
+        if self.__value_cell != None:
+            self.get_view().close_value_entry(self)
+            self.get_canvas().delete(self.__value_cell)
+            self.__value_cell = None
+            self.__entered_text = None
+            self.__entered_value = None
             
             # Reset any manually entered value
             if clear_value:
                 self.__setup_attribute.clear_value()
                 self.set_displayed_value("-")
+                self.get_view().set_changed(affects_blocks=False)
                 
     def switch_to_value_entry(self, clear_value=True):
         """
         Switches to manual entry input field
         """
-        if self.__entry_value == None:
-            self.__entry_value = PressableEntry(self.get_model(), self.get_view(), self.get_x()+ATTRIBUTE_WIDTH, self.get_y(), SETUP_WIDTH_ADDITION, self.get_height(), lambda: self.update_linked_entry_text())
-            self.add_attached_block(self.__entry_value)
+        if self.__value_cell == None:
+            self.create_value_cell()
             
             # Reset any calculated value as the input now should be entered manually, where a default value is entered
             if clear_value:
@@ -124,15 +134,75 @@ class GUISetupAttribute(GUIModelingBlock):
                     value = "Value"
                     
                 self.__setup_attribute.set_value((value,))
+                self.get_view().set_changed(affects_blocks=False)
                 
             self.display_calculated_value()
             
+    def create_value_cell(self):
+        """
+        Creates the rectangle that a manually entered value is shown on
+        """
+        actual_x1, actual_y1 = convert_grid_coordinate_to_actual(self.get_x()+ATTRIBUTE_WIDTH, self.get_y(), self.get_length_unit())
+        actual_x2, actual_y2 = convert_grid_coordinate_to_actual(self.get_x()+ATTRIBUTE_WIDTH+SETUP_WIDTH_ADDITION, self.get_y()+self.get_height(), self.get_length_unit())
+        
+        self.__value_cell = self.get_canvas().create_rectangle(actual_x1, \
+                                                               actual_y1, \
+                                                               actual_x2, \
+                                                               actual_y2, \
+                                                               width=OUTLINE_WIDTH, \
+                                                               outline=OUTLINE_COLOR, \
+                                                               fill=ENTRY_COLOR, \
+                                                               state="normal" if self.is_detail_shown() else "hidden", \
+                                                               tags=(TAG_CONTENT,))
+        
+        self.get_canvas().tag_bind(self.__value_cell, MOUSE_LEFT_PRESS, self.left_pressed)
+        self.get_canvas().tag_raise(self.__label_value, self.__value_cell)
+        
+    def edit_entered_value(self):
+        """
+        Attaches the Entry field of the view on top of the manually entered value
+        """
+        actual_x1, actual_y1, actual_x2, actual_y2 = self.get_canvas().coords(self.__value_cell)
+        
+        self.get_view().open_value_entry(self, \
+                                         actual_x1 + OUTLINE_WIDTH, \
+                                         actual_y1 + OUTLINE_WIDTH, \
+                                         actual_x2 - actual_x1 - OUTLINE_WIDTH, \
+                                         actual_y2 - actual_y1 - OUTLINE_WIDTH * 2, \
+                                         self.__entered_text)
+        
+        self.get_canvas().itemconfig(self.__label_value, text="") # To ensure that the value does not show underneath the Entry
+        
+    def write_entered_value(self, text):
+        """
+        Stores the text written in the Entry field of the view while it is attached to this setup attribute
+        """
+        self.__entered_text = text
+        self.__entered_value = None
+        self.__displayed_value = None
+        self.update_linked_entry_text()
+        self.get_view().set_changed(affects_blocks=False)
+        
+    def show_entered_value(self):
+        """
+        Shows the manually entered value again after the Entry field of the view has been removed
+        """
+        if self.__value_cell != None:
+            self.set_displayed_value(self.__entered_text)
+            
     def update_linked_entry_text(self):
         for linked_setup_attribute_gui in self.get_model().get_linked_setup_attributes_gui(self):
-        	linked_setup_attribute_gui.set_displayed_value(self.__entry_value.get_entry_text())
-        	
+            linked_setup_attribute_gui.set_entered_text(self.__entered_text)
+            
+    def set_entered_text(self, text):
+        """
+        Sets the manually entered value as text, such as when it has been edited in a linked copy, where the value is converted from the text
+        """
+        self.__entered_value = None
+        self.set_displayed_value(text)
+            
     def has_manually_entered_value(self):
-        return self.__entry_value != None
+        return self.__value_cell != None
         
     def get_setup_attribute(self):
         return self.__setup_attribute
@@ -144,7 +214,10 @@ class GUISetupAttribute(GUIModelingBlock):
         """
         Sets the value of the setup attribute to that entered in the entry
         """
-        self.__setup_attribute.set_value(convert_string_to_value(self.__entry_value.get_entry_text()))
+        if self.__entered_value != None:
+            self.__setup_attribute.set_value(self.__entered_value)
+        else:
+            self.__setup_attribute.set_value(convert_string_to_value(self.__entered_text))
         
     def set_displayed_value(self, text, color=None):
         """
@@ -156,24 +229,120 @@ class GUISetupAttribute(GUIModelingBlock):
         if text == None:
             text = "ERROR"
             
-        # Set value in Label
-        if self.__entry_value == None:
-            text, font = get_text_that_fits(self.get_canvas(), self.__label_value, text, self.get_text_width(), False, self.get_length_unit())
-            self.get_view().get_canvas().itemconfig(self.__label_value, text=text, font=font, fill=color)
+        self.__displayed_value = None
+        
+        text_width = self.get_text_width()
+        
+        # Manually entered value, where any attached Entry field would otherwise show an outdated value
+        if self.__value_cell != None:
+            self.get_view().close_value_entry(self, show_entered_value=False) # The value is displayed below instead
+            self.__entered_text = text
+            text_width = SETUP_WIDTH_ADDITION
+            
+        if self.is_text_fitting_postponed():
+            self.__displayed_value_when_shown = (text, color)
+            return
             
-        # Set value in Entry
+        text, font = get_text_that_fits(self.get_canvas(), self.__label_value, text, text_width, False, self.get_length_unit())
+        self.get_view().get_canvas().itemconfig(self.__label_value, text=text, font=font, fill=color)
+            
+    def get_detail_items(self):
+        return super().get_detail_items() + [self.__label_value]
+        
+    def move_block(self, move_x, move_y):
+        super().move_block(move_x, move_y)
+        
+        if self.__value_cell != None and (move_x != 0 or move_y != 0):
+            self.get_view().close_value_entry(self) # The Entry field is not moved together with the block
+            self.get_canvas().move(self.__value_cell, *convert_grid_coordinate_to_actual(move_x, move_y, self.get_length_unit()))
+            
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        
+        if self.__value_cell != None:
+            self.get_canvas().itemconfig(self.__value_cell, state="normal" if self.is_detail_shown() else "hidden")
+            
+            # The Entry field is only kept while the value is shown
+            if not self.is_detail_shown():
+                self.get_view().close_value_entry(self)
+                
+    def set_released(self, is_released):
+        if is_released == self.is_released():
+            return
+            
+        super().set_released(is_released)
+        canvas = self.get_canvas()
+        
+        if is_released:
+            # Fitted again once the attribute is shown, where a manually entered value is kept as it was entered
+            if self.__displayed_value_when_shown == None:
+                text = self.__entered_text if self.__value_cell != None else canvas.itemcget(self.__label_value, "text")
+                self.__displayed_value_when_shown = (text, canvas.itemcget(self.__label_value, "fill"))
+                
+            canvas.delete(self.__label_value)
+            
+            # Whether the value cell exists still tells whether the value is entered manually
+            if self.__value_cell != None:
+                canvas.delete(self.__value_cell)
+                
         else:
-            self.__entry_value.set_entry_text(text)
+            actual_x, actual_y = convert_grid_coordinate_to_actual(self.get_x()+ATTRIBUTE_WIDTH+SETUP_WIDTH_ADDITION/2, self.get_y()+self.get_height()/2, self.get_length_unit())
+            label_value = canvas.create_text(actual_x, actual_y, text="", font=get_font(self.get_length_unit()), anchor="center", justify="center", state="hidden")
+            
+            self.replace_pressable_item(self.__label_value, label_value)
+            self.__label_value = label_value
+            
+            if self.__value_cell != None:
+                canvas.delete(self.__value_cell) # Any value cell created while released
+                self.create_value_cell()
+                
+    def fit_pending_text(self):
+        super().fit_pending_text()
+        
+        if self.__displayed_value_when_shown != None:
+            text, color = self.__displayed_value_when_shown
+            displayed_value = self.__displayed_value
+            self.__displayed_value_when_shown = None
+            self.set_displayed_value(text, color)
+            self.__displayed_value = displayed_value # The same value is still displayed, only fitted now
             
     def display_calculated_value(self):
         """
         Updates the currently shown value to match the calculated value, where an override value is shown if it exists
         """
-        if self.__setup_attribute.has_override_value():
+        value_to_display = self.get_value_to_display()
+        value, is_override_value, is_refining = value_to_display
+        text = convert_value_to_string(value)
+        
+        if is_override_value:
             self.switch_to_value_label(False)
-            self.set_displayed_value(convert_value_to_string(self.__setup_attribute.get_override_value()), "red")
+            self.set_displayed_value(text, "red")
         else:
-            self.set_displayed_value(convert_value_to_string(self.__setup_attribute.get_value()))
+            # Marks estimates that are still being refined with more samples
+            if is_refining and text != None:
+                text = REFINING_VALUE_MARKER + text
+                
+            self.set_displayed_value(text)
+            
+        self.__displayed_value = value_to_display
+        
+    def get_value_to_display(self):
+        """
+        Returns the value that should be displayed, whether it is an override value, and whether it is an estimate that is still being refined
+        """
+        if self.__setup_attribute.has_override_value():
+            return self.__setup_attribute.get_override_value(), True, False
+            
+        return self.__setup_attribute.get_value(), False, self.get_model().is_refining_value(self.__setup_attribute)
+        
+    def has_displayed_value_changed(self):
+        """
+        Returns whether the value that should be displayed differs from the one last displayed
+        """
+        try:
+            return self.get_value_to_display() != self.__displayed_value
+        except:
+            return True # Values that can not be compared, such as ones containing NumPy arrays
             
     def attempt_to_reset_override_value(self):
         """
@@ -181,6 +350,7 @@ class GUISetupAttribute(GUIModelingBlock):
         """
         if self.__setup_attribute.has_override_value():
             self.__setup_attribute.reset_override_value()
+            self.get_model().set_values_outdated()
             
             # Update the displayed value for all linked copies
             for setup_attribute_gui in [self] + self.get_model().get_linked_setup_attributes_gui(self):
@@ -199,16 +369,28 @@ class GUISetupAttribute(GUIModelingBlock):
         self.set_text(text, is_bold)
         
     def delete(self):
+        if self.__value_cell != None:
+            self.get_view().close_value_entry(self)
+            self.get_canvas().delete(self.__value_cell)
+            
         super().delete()
         
         self.__configuration_attribute_gui.remove_setup_attribute_gui(self)
         self.__setup_class_gui.remove_setup_attribute_gui(self)
         
-    def save_state(self):
-        return super().save_state() | {"value": self.__setup_attribute.get_value()}
-
+    def restore_value(self, value):
+        """
+        Sets a saved value directly, where a manually entered value is not converted back from the shown text when calculating
+        """
+        self.__setup_attribute.set_value(value)
+        self.display_calculated_value()
+        
+        # Kept until the value is edited, also when the shown text is only fitted once the view is shown
+        if self.__value_cell != None:
+            self.__entered_value = value
+            
     # Additions by Lukas Gamard 25/04/03
     def set_entry_value(self, value):
-        if not self.__entry_value:
-            self.__entry_value = PressableEntry(self.get_model(), self.get_view(), self.get_x()+ATTRIBUTE_WIDTH, self.get_y(), SETUP_WIDTH_ADDITION, self.get_height(), lambda: self.update_linked_entry_text())
-        self.__entry_value.set_entry_text(value)
\ No newline at end of file
+        if self.__value_cell == None:
+            self.switch_to_value_entry(False)
+        self.set_entered_text(value)
\ No newline at end of file
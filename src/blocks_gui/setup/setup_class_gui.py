@@ -1,9 +1,9 @@
 import tkinter as tk
-import numpy as np
 from general_gui import GUIClass
 from setup_attribute_gui import GUISetupAttribute
 from circle_indicator_gui import GUICircleIndicator
 from options import Options
+from helper_functions_general import get_grid_cell
 from config import *
 import logging
 
@@ -17,6 +17,7 @@ class GUISetupClass(GUIClass):
         self.__setup_class = setup_class
         self.__configuration_class_gui = configuration_class_gui
         self.__setup_attributes_gui = []
+        self.__setup_attributes_gui_per_setup_attribute = {} # Used for finding the GUI versions of connected setup attributes without going through all GUI setup attributes
         self.__connections = [] # Directional connections between setup classes
         self.__script_marker_indicators = [] # Indicators created by scripts
         
@@ -55,51 +56,85 @@ class GUISetupClass(GUIClass):
         for script_marker_indicator in self.__script_marker_indicators:
             script_marker_indicator.move(move_x, move_y)
             
-    def scale(self, new_length_unit, last_length_unit):
-        super().scale(new_length_unit, last_length_unit)
+        self.update_cells()
+        
+    def set_shown(self, is_shown, is_detail_shown=None):
+        super().set_shown(is_shown, is_detail_shown)
+        
+        for script_marker_indicator in self.__script_marker_indicators:
+            script_marker_indicator.set_shown(self.is_detail_shown())
+            
+    def set_released(self, is_released):
+        super().set_released(is_released)
         
         for script_marker_indicator in self.__script_marker_indicators:
-            script_marker_indicator.scale(new_length_unit, last_length_unit)
+            script_marker_indicator.set_released(is_released)
             
+    def update_cells(self):
+        """
+        Updates the grid cells that the view uses to find this setup class, such as after it has moved or got another attribute
+        """
+        view = self.get_view()
+        view.update_adjacent_cells(self)
+        
+        # Include the indicators above and to the right of the class
+        bottom_block = self if len(self.__setup_attributes_gui) == 0 else self.__setup_attributes_gui[-1]
+        view.update_culling_cells(self, self.get_x(), self.get_y() - 1, self.get_x() + self.get_width() + 1, bottom_block.get_y() + bottom_block.get_height())
+        
     def is_adjacent(self, coordinates):
         """
         Returns whether any of the specified grid coordinates are adjacent to this block, and in such cases returns the direction which the adjacent coordinates goes out from the block
         """
-        # Above or below
+        adjacent_cells = self.get_adjacent_cells()
+        
         for coordinate in coordinates:
-            coordinate_to_check = np.array(coordinate)
+            cell = get_grid_cell(self.get_view(), coordinate[0], coordinate[1])
             
-            for i in range(self.get_width()):
-                coordinate_up = np.array((self.get_x() + i, self.get_y() - 1))
+            if cell in adjacent_cells:
+                return True, adjacent_cells[cell]
                 
-                # Above class
-                if np.linalg.norm(coordinate_to_check - coordinate_up) < 0.5:
-                    return True, "UP"
-                    
-                if len(self.__setup_attributes_gui) == 0:
-                    coordinate_down = np.array((self.get_x() + i, self.get_y() + self.get_height()))
-                else:
-                    last_attribute = self.__setup_attributes_gui[-1]
-                    coordinate_down = np.array((last_attribute.get_x() + i, last_attribute.get_y() + last_attribute.get_height()))
-                    
-                # Below last attribute
-                if np.linalg.norm(coordinate_to_check - coordinate_down) < 0.5:
-                    return True, "DOWN"
-                    
-        # Sides of class
-        is_adjacent_side, direction = super().is_adjacent(coordinates)
+        return False, ""
+        
+    def get_adjacent_cells(self):
+        """
+        Returns a dictionary (Key: Grid cell, Value: Direction out from the block) with all grid cells adjacent to this block, including its setup attributes
+        """
+        view = self.get_view()
+        adjacent_cells = {}
         
-        if is_adjacent_side:
-            return True, direction 
+        if len(self.__setup_attributes_gui) == 0:
+            bottom_block = self
+        else:
+            bottom_block = self.__setup_attributes_gui[-1]
             
-        for i, attribute in enumerate(self.__setup_attributes_gui):
-            # Sides of attribute
-            is_adjacent_side, direction = attribute.is_adjacent(coordinates)
+        # Above class and below last attribute
+        for i in range(self.get_width()):
+            adjacent_cells[get_grid_cell(view, self.get_x() + i, self.get_y() - 1)] = "UP"
+            adjacent_cells.setdefault(get_grid_cell(view, bottom_block.get_x() + i, bottom_block.get_y() + bottom_block.get_height()), "DOWN")
             
-            if is_adjacent_side:
-                return True, direction
+        # Sides of class and attributes
+        for block in [self] + self.__setup_attributes_gui:
+            for i in range(block.get_height()):
+                adjacent_cells.setdefault(get_grid_cell(view, block.get_x() - 1, block.get_y() + i), "LEFT")
+                adjacent_cells.setdefault(get_grid_cell(view, block.get_x() + block.get_width(), block.get_y() + i), "RIGHT")
                 
-        return False, ""
+        return adjacent_cells
+        
+    def get_side_coordinate(self, side):
+        """
+        Returns the grid coordinate next to the specified side of the setup class where the triangle block of a connection can be attached
+        """
+        if side == "UP":
+            return self.get_x() + self.get_width() // 2, self.get_y() - 1
+            
+        elif side == "DOWN":
+            bottom_block = self if len(self.__setup_attributes_gui) == 0 else self.__setup_attributes_gui[-1]
+            return self.get_x() + self.get_width() // 2, bottom_block.get_y() + bottom_block.get_height()
+            
+        elif side == "LEFT":
+            return self.get_x() - 1, self.get_y()
+            
+        return self.get_x() + self.get_width(), self.get_y()
         
     def create_setup_attribute_gui(self, setup_attribute, configuration_attribute_gui):
         """
@@ -112,8 +147,11 @@ class GUISetupClass(GUIClass):
                                                 configuration_attribute_gui)
         
         self.__setup_attributes_gui.append(setup_attribute_gui)
+        self.__setup_attributes_gui_per_setup_attribute[setup_attribute] = setup_attribute_gui
         self.add_attached_block(setup_attribute_gui)
         
+        self.update_cells()
+        
         return setup_attribute_gui
         
     def update_setup_attribute_gui_order(self):
@@ -132,26 +170,31 @@ class GUISetupClass(GUIClass):
             
         self.__setup_attributes_gui = sorted_setup_attributes_gui
         
+        self.update_cells()
+        
     def get_connected_setup_attributes_gui(self, setup_attribute):
         """
         Returns all GUI setup attributes that the specified setup attribute currently takes as input
         """
         connected_setup_attributes_gui = []
+        connected_setup_classes_gui = {} # Key: Setup class, Value: List of connected GUI setup classes with that setup class
         
+        for connected_setup_class_gui in self.get_connected_setup_classes_gui() + [self]:
+            connected_setup_classes_gui.setdefault(connected_setup_class_gui.get_setup_class(), []).append(connected_setup_class_gui)
+            
         for connected_setup_attribute in setup_attribute.get_connected_setup_attributes():
-            for connected_setup_class_gui in self.get_connected_setup_classes_gui() + [self]:
-                # Found the setup class that has the currently sought connected setup attribute
-                if connected_setup_attribute.has_setup_class(connected_setup_class_gui.get_setup_class()):
-                    if not connected_setup_attribute.is_hidden():
-                        for i, setup_attribute_gui in enumerate(connected_setup_class_gui.get_setup_attributes_gui()):
-                            if setup_attribute_gui.get_setup_attribute() == connected_setup_attribute:
-                                connected_setup_attributes_gui.append(connected_setup_class_gui.get_setup_attributes_gui()[i])
-                                break
-                                
-                    # Adds the attributes connected to the hidden one
-                    else:
-                        connected_setup_attributes_gui += connected_setup_class_gui.get_connected_setup_attributes_gui(connected_setup_attribute)
+            # Go through the setup classes that have the currently sought connected setup attribute
+            for connected_setup_class_gui in connected_setup_classes_gui.get(connected_setup_attribute.get_setup_class(), []):
+                if not connected_setup_attribute.is_hidden():
+                    connected_setup_attribute_gui = connected_setup_class_gui.get_setup_attribute_gui(connected_setup_attribute)
+                    
+                    if connected_setup_attribute_gui != None:
+                        connected_setup_attributes_gui.append(connected_setup_attribute_gui)
                         
+                # Adds the attributes connected to the hidden one
+                else:
+                    connected_setup_attributes_gui += connected_setup_class_gui.get_connected_setup_attributes_gui(connected_setup_attribute)
+                    
         return connected_setup_attributes_gui
         
     def get_setup_class(self):
@@ -163,15 +206,26 @@ class GUISetupClass(GUIClass):
     def get_setup_attributes_gui(self):
         return self.__setup_attributes_gui
         
+    def get_setup_attribute_gui(self, setup_attribute):
+        """
+        Returns the GUI version of a setup attribute of this setup class, or None if it is not shown
+        """
+        return self.__setup_attributes_gui_per_setup_attribute.get(setup_attribute)
+        
     def remove_setup_attribute_gui(self, setup_attribute_gui_to_remove):
         index_first_move_up = self.__setup_attributes_gui.index(setup_attribute_gui_to_remove)
         self.__setup_attributes_gui.remove(setup_attribute_gui_to_remove)
+        self.__setup_attributes_gui_per_setup_attribute.pop(setup_attribute_gui_to_remove.get_setup_attribute(), None)
         self.remove_attached_block(setup_attribute_gui_to_remove)
         
         # Move up all GUI setup attributes after the removed one
         for setup_attribute_gui in self.__setup_attributes_gui[index_first_move_up:]:
             setup_attribute_gui.move_block(0, -ATTRIBUTE_HEIGHT)
             
+        # The setup class is removed from the view separately when it is deleted
+        if not self.is_deleted():
+            self.update_cells()
+            
     def add_connection(self, connection):
         self.__connections.append(connection)
         
@@ -205,6 +259,12 @@ class GUISetupClass(GUIClass):
                                                                   color, \
                                                                   SCRIPT_MARKER_CIRCLE_OUTLINE, text))
         
+        if not self.is_detail_shown():
+            self.__script_marker_indicators[-1].set_shown(False)
+            
+        if self.is_released():
+            self.__script_marker_indicators[-1].set_released(True)
+            
         # Add to linked copies
         if update_linked:
             for linked_setup_class_gui in self.get_model().get_linked_setup_classes_gui(self):
@@ -245,9 +305,16 @@ class GUISetupClass(GUIClass):
         Calculates and shows the values of all setup attributes of this setup class
         """
         self.__setup_class.calculate_values()
+        self.display_changed_values()
         
+    def display_changed_values(self):
+        """
+        Shows the values of setup attributes that have changed since they were last shown
+        """
         for setup_attribute_gui in self.__setup_attributes_gui:
-            setup_attribute_gui.display_calculated_value()
+            if setup_attribute_gui.has_displayed_value_changed():
+                self.get_model().postpone_displaying_value(setup_attribute_gui)
+                self.get_view().set_changed(False, affects_blocks=False) # The calculated values are saved
             
     def reset_calculated_values(self):
         """
@@ -281,6 +348,10 @@ class GUISetupClass(GUIClass):
         self.__setup_class.set_instance_name(name)
         self.update_text()
         
+        # The name is saved in the views of all linked copies
+        for setup_class_gui in [self] + self.get_model().get_linked_setup_classes_gui(self):
+            setup_class_gui.get_view().set_changed(False)
+        
     def update_text(self, update_linked=True):
         """
         Updates the displayed text according to the set configuration class and setup class names
@@ -296,11 +367,3 @@ class GUISetupClass(GUIClass):
         
         self.__configuration_class_gui.remove_setup_class_gui(self)
         self.get_view().remove_setup_class_gui(self)
-        
-    def save_state(self):
-        saved_states = super().save_state() | {"name": self.get_name(), "configuration_class_gui": str(self.__configuration_class_gui), "setup_attributes_gui": []}
-        
-        for setup_attribute_gui in self.__setup_attributes_gui:
-            saved_states["setup_attributes_gui"].append(setup_attribute_gui.save_state())
-            
-        return saved_states
@@ -1,5 +1,7 @@
 import numpy as np
-import tkinter.font as tkfont
+from collections import OrderedDict
+
+fitted_texts = OrderedDict() # Key: (Font family, text, maximum pixel width, whether bold, length unit), Value: Tuple (text with any line break, font), shared by all views
 
 def convert_value_to_string(value):
     """
@@ -65,29 +67,6 @@ def convert_actual_coordinate_to_grid(actual_x, actual_y, length_unit):
     
     return grid_x, grid_y
     
-def get_actual_coordinates_after_scale(actual_coordinates_before_scale, new_length_unit, last_length_unit):
-    """
-    actual_coordinates_before_scale: A sequence of x and y values (for example, a tuple (x1, y1, x2, y2)) before the coordinate was scaled
-    new_length_unit: The length unit before the scaling
-    last_length_unit: The length unit after the scaling
-    
-    Converts the pixel values before scaling (such as zooming a view) to the corresponding ones after the scaling
-    """
-    adjusted_actual_coordinates = []
-    
-    for i in range(0, len(actual_coordinates_before_scale), 2):
-        previous_actual_x = actual_coordinates_before_scale[i]
-        previous_actual_y = actual_coordinates_before_scale[i+1]
-        
-        # Convert to grid coordinates using the length unit before the scaling
-        previous_grid_x, previous_grid_y = convert_actual_coordinate_to_grid(previous_actual_x, previous_actual_y, last_length_unit)
-        
-        # Convert the grid coordinates back to pixel coordinates using the new length unit after the zoom
-        for value in convert_grid_coordinate_to_actual(previous_grid_x, previous_grid_y, new_length_unit):
-            adjusted_actual_coordinates.append(value)
-            
-    return adjusted_actual_coordinates
-    
 def distance_to_closest_grid_intersection(view, grid_x, grid_y):
     """
     Find the distance from a grid coordinate to the closest grid intersection considering the offset of the grid due to panning/zooming
@@ -108,6 +87,15 @@ def distance_to_closest_grid_intersection(view, grid_x, grid_y):
         
     return grid_distance_x, grid_distance_y
     
+def get_grid_cell(view, grid_x, grid_y):
+    """
+    Get the integer grid cell that a grid coordinate is closest to considering the offset of the view due to panning/zooming, used as key when looking up blocks by position
+    The cell of a block does not change when panning/zooming
+    """
+    offset_x, offset_y = view.get_offset()
+    
+    return round(grid_x - offset_x), round(grid_y - offset_y)
+    
 def get_grid_mid_x(view, grid_x):
     """
     Get the x coordinate in the middle of the current grid square considering the offset of the grid due to panning/zooming
@@ -211,18 +199,38 @@ def get_text_that_fits(canvas, label, text, text_width, is_bold, length_unit):
     """
     Returns the text and its corresponding font required for the specified text to fit within the specified grid text width
     """
-    from config import OUTLINE_WIDTH
+    from config import OUTLINE_WIDTH, FITTED_TEXTS_CACHE_SIZE
     
     actual_maximum_text_width = convert_grid_coordinate_to_actual(text_width, 0, length_unit)[0] - 2 * OUTLINE_WIDTH
-    font = get_font(length_unit, canvas_and_label=(canvas, label))
+    font_family = get_font(length_unit, canvas_and_label=(canvas, label))[0]
+    
+    # The same texts are fitted repeatedly, such as for linked copies, default values, and after zooming
+    key = (font_family, text, actual_maximum_text_width, is_bold, length_unit)
+    
+    if key in fitted_texts:
+        fitted_texts.move_to_end(key)
+        return fitted_texts[key]
+        
+    fitted_text = fit_text(canvas, font_family, text, actual_maximum_text_width, is_bold, length_unit)
+    fitted_texts[key] = fitted_text
+    
+    if len(fitted_texts) > FITTED_TEXTS_CACHE_SIZE:
+        fitted_texts.popitem(last=False) # Remove the least recently used
+        
+    return fitted_text
+    
+def fit_text(canvas, font_family, text, actual_maximum_text_width, is_bold, length_unit):
+    """
+    Returns the text with a line break if it is wider than the specified pixel width, together with its corresponding font
+    """
+    font = (font_family, get_font(length_unit)[1])
     
     if is_bold:
         font = (font[0], font[1], "bold")
-        actual_text_width = tkfont.Font(family=font[0], size=font[1], weight=font[2]).measure(text)
-    else:
-        font = (font[0], font[1])
-        actual_text_width = tkfont.Font(family=font[0], size=font[1]).measure(text)
         
+    # Measure directly from the font description rather than creating a new font object for every text
+    actual_text_width = int(canvas.tk.call("font", "measure", font, text))
+    
     # Should add line break and lower font size
     if actual_text_width >= actual_maximum_text_width:
         has_line_break_text = True
@@ -246,12 +254,10 @@ def get_text_that_fits(canvas, label, text, text_width, is_bold, length_unit):
     else:
         has_line_break_text = False
         
-    font = get_font(length_unit, canvas_and_label=(canvas, label), has_line_break=has_line_break_text)
+    font = (font_family, get_font(length_unit, has_line_break=has_line_break_text)[1])
     
     if is_bold:
         font = (font[0], font[1], "bold")
-    else:
-        font = (font[0], font[1])
         
     return text, font
     
@@ -1,8 +1,15 @@
 import os
+from contextlib import contextmanager
 from configuration_view import ConfigurationView
 from setup_view import SetupView
+from view_navigator import ViewNavigator
+from class_palette import ClassPalette
 from setup_attribute_gui import GUISetupAttribute
 from connection_gui import GUIConnection
+from background_calculation import BackgroundCalculation
+from save_file import SaveFile
+from autosave import Autosave
+from script_registry import ScriptRegistry
 from helper_functions_general import delete_all
 from config import *
 
@@ -10,7 +17,7 @@ class Model:
     """
     Class that tracks all views and other objects that spans multiple views
     """
-    def __init__(self, root, *, force_new_save=False, num_configuration_views=1, num_setup_views=3):
+    def __init__(self, root, *, force_new_save=False, metamodel_only=False, num_configuration_views=1, num_setup_views=3):
         self.__root = root
         self.__configuration_views = []
         self.__setup_views = []
@@ -18,51 +25,90 @@ class Model:
         
         self.__currently_pressed_keys = set()
         
+        # Work that is postponed while building many blocks at once
+        self.__is_bulk_building = False
+        self.__views_to_update_shown_order = set()
+        self.__blocks_to_fit_text = set()
+        
+        # Setup attributes whose calculated value has changed, which are all shown at once when the GUI is idle
+        self.__setup_attributes_gui_to_display = set()
+        self.__display_values_id = None
+        
+        self.__background_calculation = None # Calculation that is currently running in another thread
+        self.__are_values_changed_during_calculation = False # Whether values have been outdated since the calculation in another thread started, which it may not have included
+        
+        # Saving only writes what has changed since the last save
+        self.__save_file = SaveFile(SAVE_FILE_PATH)
+        self.__are_values_current = False # Whether the calculated values are up to date with all changes to the views
+        self.__saved_view_order = None # Tuples (whether configuration view, name) of the views in the order they were last written to the save file
+        self.__num_block_changes = 0 # Number of times blocks or views have been added, removed, renamed or moved, used to tell whether anything found from them is outdated
+        self.__autosave = Autosave(self, is_enabled=not metamodel_only) # Generated models would otherwise be recovered instead of the save of the user
+        
+        self.__script_registry = ScriptRegistry(self) # Scripts run by the buttons of all setup views
+        
         self.__linked_configuration_groups_per_number = {}
         self.__linked_setup_groups_per_number = {}
+        self.__mapping_configuration_class_gui = {} # Used to map configuration class IDs from the saves to newly created ones, also when setup views are restored later
         
         self.__root.title("Canvas")
-        self.__root.geometry(f"{settings.get_canvas_width()}x{settings.get_canvas_height()}")
+        self.__root.geometry(f"{settings.get_canvas_width() + CLASS_PALETTE_WIDTH + VIEW_NAVIGATOR_WIDTH}x{settings.get_canvas_height()}")
         self.__root.rowconfigure(0, weight=1)
-        self.__root.columnconfigure(0, weight=1)
+        self.__root.columnconfigure(1, weight=1)
         
-        excluded_setup_views = []
+        # Shared list of classes that can be added to setup views, shown to the left of the views
+        self.__class_palette = ClassPalette(self)
+        self.__class_palette.grid(row=0, column=0, sticky="ns")
         
+        # Shared list of views shown to the right of the views
+        self.__view_navigator = ViewNavigator(self)
+        self.__view_navigator.grid(row=0, column=2, sticky="ns")
+        
+        views_to_restore = [] # Tuples (whether configuration view, name, whether excluded from calculations, function returning the saved state)
+        autosave_to_recover = Autosave.get_save_file_to_recover() if not (force_new_save or metamodel_only) else None
+        
+        # Only the configuration views of the save, such as when the setup views are generated, which are read once and then kept in memory
+        if metamodel_only:
+            views_to_restore = [(True, view_name, False, lambda saved_state=saved_state: saved_state) for view_name, saved_state in self.__save_file.read_configuration_views()]
+            
         # Create new views
-        if not os.path.exists(FILE_PATHS_SAVES_PATH) or force_new_save:
+        elif not (self.__save_file.exists() or os.path.exists(FILE_PATHS_SAVES_PATH) or autosave_to_recover != None) or force_new_save:
             for i in range(num_configuration_views):
                 self.create_view(True, "Metamodel")
                 
             for i in range(num_setup_views):
                 self.create_view(False, f"System {i+1}")
                 
+        # Unsaved changes from a session that was not closed normally, which are all written the next time they are saved
+        elif autosave_to_recover != None:
+            print("Recovering unsaved changes from the last autosave, as the program was not closed normally")
+            views_to_restore = autosave_to_recover.read_views_on_demand()
+            
         # Restore saved views
         else:
-            with open(FILE_PATHS_SAVES_PATH, "r") as file_with_paths:
-                mapping_configuration_class_gui = {} # Used to map configuration class IDs from the saves to newly created ones
+            views_to_restore = self.__save_file.read_views_on_demand()
+            
+            # Older saves, such as with one file per view, are written in full in the current format the next time they are saved
+            if self.__save_file.get_format_version() == SAVE_FORMAT_VERSION:
+                self.__saved_view_order = []
                 
-                for line in file_with_paths:
-                    file_path = line.strip()
-                    view_directory, view_name = os.path.split(file_path)
-                    view_name = view_name.replace(".pickle", "")
+        with self.bulk_build():
+            for is_configuration_view, view_name, is_excluded, read_saved_state in views_to_restore:
+                if self.__saved_view_order != None:
+                    self.__saved_view_order.append((is_configuration_view, view_name))
                     
-                    view_directory = os.path.split(view_directory)[1]
+                view = self.create_view(is_configuration_view, view_name)
+                
+                # Restore saved configuration view, which all setup views are built from
+                if is_configuration_view:
+                    saved_state = read_saved_state()
                     
-                    # Restore saved configuration view
-                    if view_directory == CONFIGURATION_SAVES_DIRECTORY:
-                        configuration_view = self.create_view(True, view_name)
-                        mapping_configuration_class_gui.update(configuration_view.restore_save(file_path, self.__linked_configuration_groups_per_number))
-                        
-                    # Restore saved setup view
-                    elif view_directory == SETUP_SAVES_DIRECTORY:
-                        setup_view = self.create_view(False, view_name)
-                        is_excluded = setup_view.restore_save(file_path, mapping_configuration_class_gui, self.__linked_setup_groups_per_number)
+                    # Views whose save could not be found are kept empty
+                    if saved_state != None:
+                        self.__mapping_configuration_class_gui.update(view.restore_save(saved_state, self.__linked_configuration_groups_per_number))
                         
-                        if is_excluded:
-                            excluded_setup_views.append(setup_view)
-                            
-                for view in self.__configuration_views + self.__setup_views:
-                    view.update_shown_order()
+                # Setup views are only read and restored once they are needed, such as when first shown, as many are never visited
+                else:
+                    view.set_save_to_restore(read_saved_state, is_excluded)
                     
         # Attempt to find and set a suitable default view
         if len(self.__configuration_views) > 0:
@@ -71,13 +117,24 @@ class Model:
         elif len(self.__setup_views) > 0:
             self.change_view(self.__setup_views[0])
             
-        for setup_view in excluded_setup_views:
-            setup_view.set_excluded(True)
-            
         root.bind("<KeyPress>", self.on_key_press)
         root.bind("<KeyRelease>", self.on_key_release)
+        root.protocol("WM_DELETE_WINDOW", self.close)
         
-        self.calculate_values()
+        # Values are calculated before saving, so they are only calculated again for other kinds of saves, as calculating restores all setup views
+        if self.__saved_view_order != None:
+            self.__are_values_current = True
+            
+        # There are no values to calculate without setup views
+        elif not metamodel_only:
+            self.calculate_values()
+            
+        # Restored views do not differ from their saves
+        if self.__saved_view_order != None:
+            for view in self.__configuration_views + self.__setup_views:
+                view.set_saved()
+                
+        self.__autosave.schedule()
         
     def on_key_press(self, event):
         """
@@ -129,20 +186,61 @@ class Model:
     def is_currently_pressing_key(self, key):
         return key.lower() in self.__currently_pressed_keys
         
-    def create_add_to_setup_buttons(self, configuration_class_gui):
+    @contextmanager
+    def bulk_build(self):
         """
-        Creates and adds the button used to create a setup version of a configuration class to each existing setup view
+        Used in a with statement when creating many blocks at once, such as when generating or restoring a model, where the shown order of items and fitting texts to blocks are only updated once at the end
         """
-        for existing_setup_view in self.__setup_views:
-            existing_setup_view.create_add_to_setup_button(configuration_class_gui)
+        # Already building in bulk, such as a nested session
+        if self.__is_bulk_building:
+            yield self
+            return
             
-    def remove_add_to_setup_buttons(self, to_setup_buttons):
+        self.__is_bulk_building = True
+        
+        try:
+            yield self
+            
+        finally:
+            self.__is_bulk_building = False
+            
+            for block in self.__blocks_to_fit_text:
+                if not block.is_deleted():
+                    block.fit_pending_text()
+                    
+            for view in self.__views_to_update_shown_order:
+                view.update_shown_order()
+                
+            self.__blocks_to_fit_text.clear()
+            self.__views_to_update_shown_order.clear()
+            
+    def is_bulk_building(self):
+        return self.__is_bulk_building
+        
+    def postpone_shown_order(self, view):
+        self.__views_to_update_shown_order.add(view)
+        
+    def postpone_text_fitting(self, block):
+        self.__blocks_to_fit_text.add(block)
+        
+    def postpone_displaying_value(self, setup_attribute_gui):
         """
-        Removes the button used to create a setup version of a configuration class from each existing setup view, typically due to the configuration class being deleted
+        Shows the calculated value of a setup attribute once the GUI is idle, together with all other values calculated until then
         """
-        for to_setup_button in to_setup_buttons:
-            to_setup_button.get_view().remove_add_to_setup_button(to_setup_button)
+        self.__setup_attributes_gui_to_display.add(setup_attribute_gui)
+        
+        if self.__display_values_id == None:
+            self.__display_values_id = self.__root.after_idle(self.display_pending_values)
             
+    def display_pending_values(self):
+        self.__display_values_id = None
+        
+        for setup_attribute_gui in self.__setup_attributes_gui_to_display:
+            if not setup_attribute_gui.is_deleted():
+                setup_attribute_gui.display_calculated_value()
+                
+        self.__setup_attributes_gui_to_display.clear()
+        
     def get_linked_configuration_classes_gui(self, configuration_class_gui):
         """
         Returns a list of all configuration classes that are linked copies of the specified one
@@ -215,6 +313,12 @@ class Model:
         """
         Creates a linked copy of a setup class in a specified view
         """
+        # The number of a new linked group could otherwise already be used in the save of a setup view that has not been restored
+        if setup_class_gui_to_copy.get_linked_group_number() == None and linked_group_number == None:
+            self.restore_all_setup_views()
+            
+        self.restore_setup_view(view_to_copy_to)
+        
         # Create a new linked group if it does not exist
         self.attempt_to_create_linked_group(setup_class_gui_to_copy, view_to_copy_to, self.__linked_setup_groups_per_number, linked_group_number)
         
@@ -263,7 +367,10 @@ class Model:
             linked_groups_per_number = self.__linked_configuration_groups_per_number
         else:
             linked_groups_per_number = self.__linked_setup_groups_per_number
-        
+            
+            # Group numbers can change below, which the saves of setup views that have not been restored would not follow
+            self.restore_all_setup_views()
+            
         linked_groups_per_number[linked_group_number].remove(linked_class_gui)
         
         # Should remove group as there is at most only one class in it
@@ -287,6 +394,12 @@ class Model:
     def get_root(self):
         return self.__root
         
+    def get_view_navigator(self):
+        return self.__view_navigator
+        
+    def get_class_palette(self):
+        return self.__class_palette
+        
     def get_configuration_views(self):
         return self.__configuration_views
         
@@ -295,7 +408,7 @@ class Model:
         
     def swap_view_places(self, view_to_move, move_up):
         """
-        Switches the order that two views are stored and the order their buttons appear based on whether a specified view should move up or down
+        Switches the order that two views are stored and the order they appear in the list of views based on whether a specified view should move up or down
         """
         views_to_consider_moving = []
         
@@ -315,63 +428,38 @@ class Model:
             
         # Swap views if there is a view to swap position with
         if (move_up and view_index > 0) or (not move_up and view_index < len(views_to_consider_moving) - 1):
-            for view in self.__configuration_views + self.__setup_views:
-                view.move_change_view_button(views_to_consider_moving[view_index], move_up)
-                view.move_change_view_button(views_to_consider_moving[view_to_swap_with_index], not move_up)
-                
-            views_to_consider_moving[view_index], views_to_consider_moving[view_to_swap_with_index] = views_to_consider_moving[view_to_swap_with_index], views_to_consider_moving[view_index]
+            self.__view_navigator.swap_views(views_to_consider_moving[view_index], views_to_consider_moving[view_to_swap_with_index])
+            self.set_blocks_changed()
             
-    def update_add_to_setup_button_order(self):
-        for setup_view in self.__setup_views:
-            setup_view.update_add_to_setup_button_order()
+            views_to_consider_moving[view_index], views_to_consider_moving[view_to_swap_with_index] = views_to_consider_moving[view_to_swap_with_index], views_to_consider_moving[view_index]
             
     def create_view(self, is_configuration_view, view_name):
         """
-        Creates a new view, including buttons to navigate to the new view from existing ones
+        Creates a new view and adds it to the list of views
         """
         if is_configuration_view:
             new_view = ConfigurationView(self, view_name)
         else:
             new_view = SetupView(self, view_name)
             
-        new_view.grid(row=0, column=0, sticky="nswe")
+        new_view.grid(row=0, column=1, sticky="nswe")
         
-        # Add button to change to other view from the new view
-        for configuration_view in self.__configuration_views:
-            new_view.add_change_view_button(configuration_view, True)
-            
-        for setup_view in self.__setup_views:
-            new_view.add_change_view_button(setup_view, False)
-            
         # Add the new view to the list of existing ones
         if is_configuration_view:
             self.__configuration_views.append(new_view)
         else:
             self.__setup_views.append(new_view)
             
-        # Add button to change to the new view from existing views
-        for view in self.__configuration_views + self.__setup_views:
-            view.add_change_view_button(new_view, is_configuration_view)
-            
-        # If setup view, add buttons to add classes from configuration views to the setup view 
-        if not is_configuration_view:
-            seen_configuration_classes = set() # To ensure a button for every linked copy of a configuration class is not added
-            
-            for configuration_view in self.__configuration_views:
-                for configuration_class_gui in configuration_view.get_configuration_classes_gui():
-                    configuration_class = configuration_class_gui.get_configuration_class()
-                    
-                    if configuration_class not in seen_configuration_classes:
-                        new_view.create_add_to_setup_button(configuration_class_gui)
-                        seen_configuration_classes.add(configuration_class_gui.get_configuration_class())
-                        
+        self.__view_navigator.add_view(new_view, is_configuration_view)
+        self.set_blocks_changed()
+        
         self.change_view(self.__current_view)
         
         return new_view
         
     def delete_view(self, view_to_delete):
         """
-        Deletes a view and removes the buttons to navigate to it from the remaining views
+        Deletes a view and removes it from the list of views
         """
         # Check that there will be at least one view left
         if len(self.__configuration_views) + len(self.__setup_views) <= 1:
@@ -380,17 +468,9 @@ class Model:
             
         view_to_delete.delete()
         
-        # Remove button to change to the deleted view from all other views
-        for view in self.__configuration_views + self.__setup_views:
-            if view != view_to_delete:
-                view.remove_change_view_button(view_to_delete)
-                
-        # Remove reference to button to convert each configuration class to a setup class from each configuration class
-        for configuration_view in self.__configuration_views:
-            if configuration_view != view_to_delete:
-                for configuration_class_gui in configuration_view.get_configuration_classes_gui():
-                    configuration_class_gui.remove_to_setup_button(view_to_delete)
-                    
+        self.__view_navigator.remove_view(view_to_delete)
+        self.set_blocks_changed()
+        
         # Remove reference to view
         if view_to_delete in self.__configuration_views:
             self.__configuration_views.remove(view_to_delete)
@@ -422,9 +502,41 @@ class Model:
         if view == None:
             return
             
+        if isinstance(view, SetupView):
+            self.restore_setup_view(view)
+            
         self.__current_view = view
+        view.prepare_to_show()
         view.tkraise()
         
+        self.__view_navigator.set_current_view(view)
+        
+    def restore_setup_view(self, setup_view):
+        """
+        Creates the blocks of a setup view whose save has not been restored yet, which is only done once the view is needed, such as when it is first shown
+        """
+        if setup_view.is_restored():
+            return
+            
+        # Creating the blocks of the save changes neither the save nor the calculated values
+        has_unsaved_changes = setup_view.has_unsaved_changes()
+        are_values_current = self.__are_values_current
+        
+        with self.bulk_build():
+            setup_view.restore_pending_save(self.__mapping_configuration_class_gui, self.__linked_setup_groups_per_number)
+            
+        if not has_unsaved_changes:
+            setup_view.set_saved()
+            
+        self.__are_values_current = are_values_current
+        
+    def restore_all_setup_views(self):
+        """
+        Restores all setup views that have not been restored yet, such as before calculating values or changing configurations, which need all setup classes
+        """
+        for setup_view in self.__setup_views:
+            self.restore_setup_view(setup_view)
+            
     def get_num_configuration_classes(self):
         """
         Returns the total number of configuration classes across all configuration views
@@ -440,6 +552,8 @@ class Model:
         """
         Resets any changes or additions made by scripts to all setup views
         """
+        self.restore_all_setup_views()
+        
         for setup_view in self.__setup_views:
             for setup_class_gui in setup_view.get_setup_classes_gui():
                 setup_class_gui.reset_changes_by_scripts()
@@ -450,6 +564,96 @@ class Model:
         """
         Calculates the values of setup attributes
         """
+        self.cancel_background_calculation()
+        self.reset_calculated_values()
+        
+        # Calculates the values of any attribute that had its value reset
+        for setup_view in self.__setup_views:
+            for setup_class_gui in setup_view.get_setup_classes_gui():
+                if not setup_view.is_excluded():
+                    setup_class_gui.calculate_values()
+                    
+        self.__are_values_current = True
+        
+    def set_blocks_changed(self):
+        """
+        Marks that blocks or views have changed in a way that can change which blocks scripts find, such as adding, removing or renaming them
+        """
+        self.__num_block_changes += 1
+        
+    def get_num_block_changes(self):
+        return self.__num_block_changes
+        
+    def set_values_outdated(self):
+        """
+        Marks that the calculated values need to be calculated again before saving, such as after editing a view
+        """
+        self.__are_values_current = False
+        self.__are_values_changed_during_calculation = True
+        
+    def calculate_values_in_background(self, progressive=False):
+        """
+        Calculates the values of setup attributes in another thread, where values are shown as they are calculated
+        
+        progressive: Whether values are first estimated with few samples, and then refined with more samples while marked as being refined
+        """
+        self.cancel_background_calculation()
+        self.reset_calculated_values()
+        self.__are_values_changed_during_calculation = False
+        
+        setup_classes_gui = {} # Key: Setup class, Value: List of GUI setup classes, which are several for linked copies
+        
+        for setup_view in self.__setup_views:
+            if not setup_view.is_excluded():
+                for setup_class_gui in setup_view.get_setup_classes_gui():
+                    setup_classes_gui.setdefault(setup_class_gui.get_setup_class(), []).append(setup_class_gui)
+                    
+        self.__background_calculation = BackgroundCalculation(self, setup_classes_gui, progressive=progressive)
+        self.__background_calculation.start()
+        self.show_calculation_progress(0)
+        
+    def is_calculating_in_background(self):
+        return self.__background_calculation != None
+        
+    def is_refining_value(self, setup_attribute):
+        """
+        Returns whether the value of a setup attribute is an estimate that is currently being refined with more samples
+        """
+        return self.__background_calculation != None and self.__background_calculation.is_refining(setup_attribute)
+        
+    def cancel_background_calculation(self):
+        """
+        Stops any calculation running in another thread, where values that have already been shown are kept
+        """
+        if self.__background_calculation != None:
+            self.__background_calculation.cancel()
+            self.finish_background_calculation()
+            
+    def finish_background_calculation(self, is_complete=False):
+        """
+        is_complete: Whether all values were calculated with the full number of samples, and not cancelled or stopped by an error
+        """
+        self.__background_calculation = None
+        self.show_calculation_progress(None)
+        
+        # The values are the same as if calculated by calculate_values, unless something changed during the calculation
+        if is_complete and not self.__are_values_changed_during_calculation:
+            self.__are_values_current = True
+        
+    def show_calculation_progress(self, progress):
+        """
+        Shows the progress of a calculation running in another thread on the calculate button of each setup view, or the default text if None
+        """
+        for setup_view in self.__setup_views:
+            setup_view.show_calculation_progress(progress)
+            
+    def reset_calculated_values(self):
+        """
+        Resets the values that should be calculated again, and warns about duplicate names
+        All setup views are restored first, as values are calculated across all of them
+        """
+        self.restore_all_setup_views()
+        
         seen_instances = {} # Key: Instance name, Value: List of GUI setup classes
         seen_linked_groups = set()
         
@@ -487,24 +691,11 @@ class Model:
                         
                     print(f"\t\t{setup_class_gui.get_view().get_name()}{text_linked_group}")
                     
-        # Calculates the values of any attribute that had its value reset
-        for setup_view in self.__setup_views:
-            for setup_class_gui in setup_view.get_setup_classes_gui():
-                if not setup_view.is_excluded():
-                    setup_class_gui.calculate_values()
-                    
     """
     def get_setup_view_names(self):
         return [view.get_name() for view in self.__setup_views]
     """
     
-    def set_text_change_view_buttons(self, view_with_changed_name, text):
-        """
-        Sets the text shown on all buttons changing to the specified view in all views
-        """
-        for view in self.__configuration_views + self.__setup_views:
-            view.set_text_change_view_button(view_with_changed_name, text)
-            
     def update_duplicate_view_name(self, view, existing_view_names):
         """
         Adds a number to the name of the specified view if it overlaps with snother view
@@ -516,31 +707,58 @@ class Model:
         
     def save(self):
         """
-        Saves all configuration and setup views
+        Saves the configuration and setup views that have changed since they were last saved
         """
-        self.calculate_values()
-        
-        for directory in [CONFIGURATION_SAVES_DIRECTORY, SETUP_SAVES_DIRECTORY]:
-            os.makedirs(os.path.join(SAVES_PATH, directory), exist_ok=True)
+        # Calculated values are saved, but only need to be calculated again if something has changed since they were last calculated
+        if not self.__are_values_current:
+            self.calculate_values()
             
         configuration_view_names = set()
         setup_view_names = set()
         
-        # Create file where the path and view type of each saved view is stored, also storing the order of the views
-        with open(FILE_PATHS_SAVES_PATH, "w") as file_with_paths:
-            # Need to store configuration views first as they need to be restored before setup views so that they can use the configurations
-            for configuration_view in self.__configuration_views:
-                self.update_duplicate_view_name(configuration_view, configuration_view_names)
-                configuration_view_names.add(configuration_view.get_name())
-                
-                file_path = configuration_view.save()
-                file_with_paths.write(f"{file_path}\n")
-                
-            for setup_view in self.__setup_views:
-                self.update_duplicate_view_name(setup_view, setup_view_names)
-                setup_view_names.add(setup_view.get_name())
+        view_order = [] # Tuples (whether configuration view, name) of all views in the order they are shown
+        saved_states = {} # Key: Tuple (whether configuration view, name), Value: Saved state of a view that has changed
+        changed_views = []
+        
+        # Need to store configuration views first as they need to be restored before setup views so that they can use the configurations
+        for is_configuration_view, views, view_names in [(True, self.__configuration_views, configuration_view_names), (False, self.__setup_views, setup_view_names)]:
+            for view in views:
+                self.update_duplicate_view_name(view, view_names)
+                view_names.add(view.get_name())
                 
-                file_path = setup_view.save()
-                file_with_paths.write(f"{file_path}\n")
+                view_order.append((is_configuration_view, view.get_name()))
                 
+                if view.has_unsaved_changes():
+                    saved_states[view_order[-1]] = view.get_saved_state()
+                    changed_views.append(view)
+                    
+        if view_order == self.__saved_view_order:
+            self.__save_file.write(saved_states)
+        else:
+            self.__save_file.write(saved_states, view_order)
+            self.__saved_view_order = view_order
+            
+        for view in changed_views:
+            view.set_saved()
+            
+        # Snapshots of unsaved changes are no longer needed once the changes are saved
+        self.__autosave.remove_snapshots()
+        
         settings.save()
+        
+    def get_save_file(self):
+        return self.__save_file
+        
+    def get_autosave(self):
+        return self.__autosave
+        
+    def get_script_registry(self):
+        return self.__script_registry
+        
+    def close(self):
+        """
+        When closing the window, where any unsaved changes are discarded
+        """
+        self.cancel_background_calculation()
+        self.__autosave.stop()
+        self.__root.destroy()
@@ -55,7 +55,7 @@ class Options:
         entry_text = tk.StringVar()
         options.add_entry(0, 0, "Name:", view.get_name(), lambda: view.set_name(entry_text.get()), entry_text)
         
-        options.add_move_buttons(0, 1, "Move view button:", lambda: model.swap_view_places(view, True), lambda: model.swap_view_places(view, False))
+        options.add_move_buttons(0, 1, "Move in list of views:", lambda: model.swap_view_places(view, True), lambda: model.swap_view_places(view, False))
         
         current_column = 2
         
@@ -78,14 +78,17 @@ class Options:
         """
         Options for general settings to the program
         """
-        options = Options(model, view, 2, 2, "General settings")
+        options = Options(model, view, 2, 3, "General settings")
         
         entry_text = tk.StringVar()
-        options.add_entry(0, 0, "Number of samples when sampling distributions:", settings.get_num_samples(), lambda: set_num_samples(entry_text.get()), entry_text)
+        options.add_entry(0, 0, "Number of samples when sampling distributions:", settings.get_num_samples(), lambda: set_num_samples(model, entry_text.get()), entry_text)
         
         options.add_label(0, 1, "Warn for duplicate class instance names:")
         options.add_toggle_button(1, 1, "Print warnings", settings.warns_duplicate_names(), lambda: settings.set_warn_duplicate_names(True), lambda: settings.set_warn_duplicate_names(False))
         
+        entry_text_autosave = tk.StringVar()
+        options.add_entry(0, 2, "Seconds between autosaves (0 to turn off):", settings.get_autosave_interval(), lambda: set_autosave_interval(model, entry_text_autosave.get()), entry_text_autosave)
+        
     @staticmethod
     def configuration_class(model, view, configuration_class_gui, configuration_views):
         """
@@ -308,8 +311,18 @@ def set_setup_scalars(connection, input_scalars_string):
     except:
         connection.reset_input_scalars()
 
-def set_num_samples(num_samples_string):
+def set_num_samples(model, num_samples_string):
     try:
         settings.set_num_samples(abs(int(num_samples_string)))
     except:
         settings.set_num_samples(1)
+        
+    model.set_values_outdated()
+    
+def set_autosave_interval(model, autosave_interval_string):
+    try:
+        settings.set_autosave_interval(abs(int(autosave_interval_string)))
+    except:
+        print(f"Error: Could not set the seconds between autosaves to {autosave_interval_string}, as it is not a whole number")
+        
+    model.get_autosave().schedule()
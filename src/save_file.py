@@ -0,0 +1,282 @@
+import os
+import io
+import json
+import pickle
+import sqlite3
+import pathlib
+import itertools
+from contextlib import closing
+from config import *
+
+class SaveFile:
+    """
+    Single file that all views of a save are stored in, where each view is a separate record so that views can be read and written individually
+    """
+    __configuration_views_per_save = {} # Key: Tuple (file path, time of last change), Value: List of tuples (name, saved state) of the configuration views in the save
+    
+    def __init__(self, file_path):
+        self.__file_path = file_path
+        
+    def exists(self):
+        return os.path.exists(self.__file_path)
+        
+    def connect(self):
+        """
+        Opens a read-only connection to the save file, which must exist, so that reading a save never changes it
+        """
+        return sqlite3.connect(pathlib.Path(self.__file_path).absolute().as_uri() + "?mode=ro", uri=True)
+        
+    def connect_to_write(self):
+        """
+        Opens a connection to the save file, creating the file and its tables if they do not exist yet
+        """
+        connection = sqlite3.connect(self.__file_path)
+        connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS views (is_configuration_view INTEGER, name TEXT, position INTEGER, is_excluded INTEGER, state BLOB, PRIMARY KEY (is_configuration_view, name))")
+        
+        # Save files from before whether setup views are excluded was stored outside of their states, which is only filled in once they are written again
+        if not SaveFile.has_excluded_column(connection):
+            connection.execute("ALTER TABLE views ADD COLUMN is_excluded INTEGER")
+            
+        return connection
+        
+    @staticmethod
+    def has_excluded_column(connection):
+        """
+        Returns whether the save file of the connection stores whether setup views are excluded outside of their states
+        """
+        return "is_excluded" in [column[1] for column in connection.execute("PRAGMA table_info(views)")]
+        
+    def get_format_version(self):
+        """
+        Returns the format version that the views in the save file are stored in, or None if there is no save file
+        """
+        if not self.exists():
+            return None
+            
+        with closing(self.connect()) as connection:
+            format_version = connection.execute("SELECT value FROM metadata WHERE key = 'format_version'").fetchone()
+            
+        if format_version == None:
+            return None
+            
+        return int(format_version[0])
+        
+    def read_views(self):
+        """
+        Yields tuples (whether configuration view, name, saved state) of the views in the order they are shown, where only the order is read up front and each view is read once it is needed
+        Saves from before the single save file are read from the files of each view instead
+        """
+        if not self.exists():
+            for is_configuration_view, name, saved_state in self.read_views_per_file():
+                yield is_configuration_view, name, self.convert_legacy_state(is_configuration_view, saved_state)
+                
+            return
+            
+        format_version = self.get_format_version()
+        
+        if format_version != None and format_version > SAVE_FORMAT_VERSION:
+            print(f"Warning: The save was made by a newer version of the program (format version {format_version}), and might not be restored correctly")
+            
+        with closing(self.connect()) as connection:
+            view_order = connection.execute("SELECT is_configuration_view, name FROM views WHERE position IS NOT NULL ORDER BY position").fetchall()
+            
+            for is_configuration_view, name in view_order:
+                state = connection.execute("SELECT state FROM views WHERE is_configuration_view = ? AND name = ?", (is_configuration_view, name)).fetchone()[0]
+                yield bool(is_configuration_view), name, self.convert_state(format_version, is_configuration_view, state)
+                
+    def read_views_on_demand(self):
+        """
+        Returns a list of tuples (whether configuration view, name, whether excluded from calculations, function returning the saved state) of the views in the order they are shown
+        Only the order of saves in the current format is read up front, where each view is read once its function is called, while older saves are read in full
+        """
+        if self.get_format_version() == SAVE_FORMAT_VERSION:
+            with closing(self.connect()) as connection:
+                # Save files from before whether setup views are excluded was stored outside of their states are read in full below
+                if SaveFile.has_excluded_column(connection):
+                    view_order = connection.execute("SELECT is_configuration_view, name, is_excluded FROM views WHERE position IS NOT NULL ORDER BY position").fetchall()
+                    
+                    return [(bool(is_configuration_view), name, bool(is_excluded), lambda is_configuration_view=is_configuration_view, name=name: self.read_view(is_configuration_view, name)) \
+                            for is_configuration_view, name, is_excluded in view_order]
+                            
+        return [(is_configuration_view, name, not is_configuration_view and saved_state != None and saved_state["is_excluded"], lambda saved_state=saved_state: saved_state) \
+                for is_configuration_view, name, saved_state in self.read_views()]
+                
+    def read_view(self, is_configuration_view, name):
+        """
+        Returns the saved state of a single view, or None if it is not in the save file
+        """
+        if not self.exists():
+            return None
+            
+        with closing(self.connect()) as connection:
+            format_version = connection.execute("SELECT value FROM metadata WHERE key = 'format_version'").fetchone()
+            state = connection.execute("SELECT state FROM views WHERE is_configuration_view = ? AND name = ?", (is_configuration_view, name)).fetchone()
+            
+        if format_version == None or state == None:
+            return None
+            
+        return self.convert_state(int(format_version[0]), is_configuration_view, state[0])
+        
+    @staticmethod
+    def convert_state(format_version, is_configuration_view, state):
+        """
+        Converts the record of a view in the save file to its saved state
+        """
+        # The first version of the save file stored the views the same way as the files of each view
+        if format_version == 1:
+            return SaveFile.convert_legacy_state(is_configuration_view, LegacyUnpickler(io.BytesIO(state)).load())
+            
+        return json.loads(state)
+        
+    def read_configuration_views(self):
+        """
+        Returns a list of tuples (name, saved state) of the configuration views in the order they are shown, which is kept in memory so that the same save is only read once, such as when creating many models from the same metamodel
+        """
+        # Saves from before the single save file are identified by the file listing their views
+        file_path = self.__file_path if self.exists() else FILE_PATHS_SAVES_PATH
+        
+        if not os.path.exists(file_path):
+            print(f"Error: Could not find a save to read the configuration views from at {self.__file_path}")
+            return []
+            
+        save_key = (os.path.abspath(file_path), os.path.getmtime(file_path))
+        
+        if save_key not in SaveFile.__configuration_views_per_save:
+            # Configuration views are always stored before setup views, so the setup views are never read
+            configuration_views = itertools.takewhile(lambda view: view[0], self.read_views())
+            SaveFile.__configuration_views_per_save[save_key] = [(name, saved_state) for is_configuration_view, name, saved_state in configuration_views if saved_state != None]
+            
+        return SaveFile.__configuration_views_per_save[save_key]
+        
+    @staticmethod
+    def read_views_per_file():
+        """
+        Yields the same as read_views, but from a save with one file per view and a file listing the order of the views, where the saved states are in the format of that save
+        """
+        with open(FILE_PATHS_SAVES_PATH, "r") as file_with_paths:
+            file_paths = [line.strip() for line in file_with_paths]
+            
+        for file_path in file_paths:
+            view_directory, view_name = os.path.split(file_path)
+            view_name = view_name.replace(".pickle", "")
+            
+            view_directory = os.path.split(view_directory)[1]
+            
+            if view_directory not in (CONFIGURATION_SAVES_DIRECTORY, SETUP_SAVES_DIRECTORY):
+                continue
+                
+            is_configuration_view = view_directory == CONFIGURATION_SAVES_DIRECTORY
+            saved_state = None
+            
+            try:
+                with open(os.path.join(SAVES_PATH, file_path), "rb") as file_pickle:
+                    saved_state = LegacyUnpickler(file_pickle).load()
+            except FileNotFoundError as e:
+                print(f"Could not find {'configuration' if is_configuration_view else 'setup'} view {file_path}: {e}")
+                
+            yield is_configuration_view, view_name, saved_state
+            
+    @staticmethod
+    def convert_legacy_state(is_configuration_view, saved_state):
+        """
+        Converts the saved state of a view from how it was stored before the current format, where views were stored as tuples of blocks
+        """
+        if saved_state == None:
+            return None
+            
+        # Types were stored as the classes themselves, and inputs without a calculation type sometimes as empty strings
+        if is_configuration_view:
+            grid_offset, saved_states_configuration_classes_gui, saved_states_configuration_inputs_gui = saved_state
+            
+            for saved_states_configuration_class_gui in saved_states_configuration_classes_gui:
+                for saved_states_configuration_attribute_gui in saved_states_configuration_class_gui["configuration_attributes_gui"]:
+                    saved_states_configuration_attribute_gui["value_type"] = saved_states_configuration_attribute_gui["value_type"].__name__
+                    
+            for saved_states_configuration_input_gui in saved_states_configuration_inputs_gui:
+                calculation_type = saved_states_configuration_input_gui["calculation_type"]
+                saved_states_configuration_input_gui["calculation_type"] = calculation_type.__name__ if calculation_type not in (None, "") else None
+                
+            return {"grid_offset": grid_offset, "configuration_classes_gui": saved_states_configuration_classes_gui, "configuration_inputs_gui": saved_states_configuration_inputs_gui}
+            
+        # Setup classes and connections were stored as one dictionary per block instead of as columns
+        grid_offset, is_excluded, saved_states_setup_classes_gui, saved_states_connections_with_blocks = saved_state
+        
+        setup_classes = {"x": [saved_states["x"] for saved_states in saved_states_setup_classes_gui], \
+                         "y": [saved_states["y"] for saved_states in saved_states_setup_classes_gui], \
+                         "name": [saved_states["name"] for saved_states in saved_states_setup_classes_gui], \
+                         "configuration_class_gui": [saved_states["configuration_class_gui"] for saved_states in saved_states_setup_classes_gui], \
+                         "linked_group_number": [saved_states["linked_group_number"] for saved_states in saved_states_setup_classes_gui], \
+                         "values": [[saved_states_setup_attribute_gui["value"] for saved_states_setup_attribute_gui in saved_states["setup_attributes_gui"]] for saved_states in saved_states_setup_classes_gui]}
+        
+        connections_with_blocks = {"start": [(saved_states["start_block"]["x"], saved_states["start_block"]["y"]) for saved_states in saved_states_connections_with_blocks], \
+                                   "end": [(saved_states["end_block"]["x"], saved_states["end_block"]["y"]) for saved_states in saved_states_connections_with_blocks], \
+                                   "input_scalars": [saved_states["input_scalars"] for saved_states in saved_states_connections_with_blocks], \
+                                   "input_scalars_indicator": [saved_states["input_scalars_indicator_coordinate"] for saved_states in saved_states_connections_with_blocks]}
+        
+        return {"grid_offset": grid_offset, "is_excluded": is_excluded, "setup_classes": setup_classes, "connections_with_blocks": connections_with_blocks}
+        
+    def write(self, saved_states, view_order=None, *, records_to_copy=None, save_file_to_copy_from=None):
+        """
+        Writes the specified views in a single transaction, so that an interrupted save leaves the previous save intact
+        
+        saved_states: Dictionary (Key: Tuple (whether configuration view, name), Value: Saved state) of the views that should be written
+        view_order: List of tuples (whether configuration view, name) of all views in the order they are shown, or None if the order has not changed
+        records_to_copy: Dictionary (Key: Tuple (whether configuration view, name), Value: Tuple (name in save_file_to_copy_from, whether excluded from calculations)) of views that are copied as they are stored in save_file_to_copy_from without being read
+        """
+        os.makedirs(os.path.dirname(self.__file_path), exist_ok=True)
+        copied_records = []
+        
+        if records_to_copy and save_file_to_copy_from.exists():
+            with closing(save_file_to_copy_from.connect()) as connection:
+                for (is_configuration_view, name), (name_to_copy, is_excluded) in records_to_copy.items():
+                    state = connection.execute("SELECT state FROM views WHERE is_configuration_view = ? AND name = ?", (is_configuration_view, name_to_copy)).fetchone()
+                    
+                    # Views whose record could not be found are left out
+                    if state != None:
+                        copied_records.append((is_configuration_view, name, is_excluded, state[0]))
+                        
+        with closing(self.connect_to_write()) as connection:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('format_version', ?)", (str(SAVE_FORMAT_VERSION),))
+                
+                # Whether setup views are excluded is also stored outside of their states, so that it is known before they are read
+                for (is_configuration_view, name), saved_state in saved_states.items():
+                    connection.execute("INSERT INTO views (is_configuration_view, name, is_excluded, state) VALUES (?, ?, ?, ?) ON CONFLICT (is_configuration_view, name) DO UPDATE SET is_excluded = excluded.is_excluded, state = excluded.state", \
+                                       (is_configuration_view, name, saved_state.get("is_excluded"), json.dumps(saved_state, default=convert_to_json_value)))
+                                       
+                connection.executemany("INSERT INTO views (is_configuration_view, name, is_excluded, state) VALUES (?, ?, ?, ?) ON CONFLICT (is_configuration_view, name) DO UPDATE SET is_excluded = excluded.is_excluded, state = excluded.state", \
+                                       copied_records)
+                                       
+                # Views that are no longer shown keep their records without a position, so that deleted views can be recovered
+                if view_order != None:
+                    connection.execute("UPDATE views SET position = NULL")
+                    connection.executemany("UPDATE views SET position = ? WHERE is_configuration_view = ? AND name = ?", \
+                                           [(position, is_configuration_view, name) for position, (is_configuration_view, name) in enumerate(view_order)])
+                                           
+def convert_to_json_value(value):
+    """
+    Converts values that JSON can not store by itself, such as NumPy numbers in calculated values
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+        
+    raise TypeError(f"Could not save {value} of type {type(value).__name__}")
+    
+class LegacyUnpickler(pickle.Unpickler):
+    """
+    Reads saves from before the current format, where only the types that those saves contain can be loaded so that reading a save can not run any other code
+    """
+    ALLOWED_CLASSES = {("numpy", "dtype"), ("numpy.core.multiarray", "scalar"), ("numpy._core.multiarray", "scalar")}
+    
+    def find_class(self, module, name):
+        if module == "general_calculations" and name in VALUE_TYPES_PER_NAME:
+            return VALUE_TYPES_PER_NAME[name]
+            
+        if module == "general_calculations" and name in CALCULATION_TYPES_PER_NAME:
+            return CALCULATION_TYPES_PER_NAME[name]
+            
+        if (module, name) in LegacyUnpickler.ALLOWED_CLASSES:
+            return super().find_class(module, name)
+            
+        raise pickle.UnpicklingError(f"The save contains {module}.{name}, which is not allowed in a save")
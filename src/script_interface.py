@@ -1,3 +1,4 @@
+import numbers
 import numpy as np
 from helper_functions_general import convert_value_to_string, convert_string_to_value
     
@@ -80,6 +81,23 @@ class ScriptInterface:
             
         return attributes_values
         
+    def get_attribute_table(self, class_type, view=None):
+        """
+        Returns a tuple (class instance names, columns) with the displayed values of all instances of a class type, where columns is a dictionary with attribute names as keys and the values of that attribute for each class instance, in the same order as the names, as values
+        Columns where all values are numbers with the same number of values are two-dimensional NumPy arrays with one row per class instance, while other columns are lists of tuples
+        """
+        self.__script_helper.check_type([class_type, view], str)
+        setup_classes_gui = self.__script_helper.get_setup_classes_gui(view, class_type)
+        
+        class_instance_names = [setup_class_gui.get_name() for setup_class_gui in setup_classes_gui]
+        columns = {}
+        
+        for i, attribute_name in enumerate(self.get_attribute_names(class_type)):
+            values = [setup_class_gui.get_setup_attributes_gui()[i].get_setup_attribute().get_current_value() for setup_class_gui in setup_classes_gui]
+            columns[attribute_name] = self.__script_helper.convert_values_to_column(values)
+            
+        return class_instance_names, columns
+        
     def convert_value_to_string(self, attribute_value):
         """
         Converts the specified tuple attribute value into a formatted string
@@ -100,6 +118,36 @@ class ScriptInterface:
         for setup_attribute_gui in self.__script_helper.get_setup_attributes_gui(view, class_type, class_instance, attribute):
             setup_attribute_gui.get_setup_attribute().set_override_value(override_value)
             
+        self.__model.set_values_outdated()
+        
+    def override_attribute_table(self, override_values, class_type, attribute, *, class_instances=None, view=None):
+        """
+        Overrides the displayed values of an attribute for many class instances at once, where each override value is either a string (as if it was entered through an entry field), a number, or a sequence of values such as a row of a two-dimensional NumPy array
+        Numbers in a sequence are used directly and other values in it are kept as they are, so a column from get_attribute_table can be passed back
+        
+        class_instances: Names of the class instances to override, in the same order as the override values, where None overrides all class instances in the order of get_attribute_table
+        """
+        self.__script_helper.check_type([class_type, attribute, view], str)
+        
+        if class_instances == None:
+            setup_classes_gui_per_value = [[setup_class_gui] for setup_class_gui in self.__script_helper.get_setup_classes_gui(view, class_type)]
+        else:
+            self.__script_helper.check_type(class_instances, str)
+            setup_classes_gui_per_value = [self.__script_helper.get_instances_setup_class_gui(view, class_type, class_instance) for class_instance in class_instances]
+            
+        if len(override_values) != len(setup_classes_gui_per_value):
+            raise ValueError(f"Expected {len(setup_classes_gui_per_value)} override values, but got {len(override_values)}")
+            
+        for override_value, setup_classes_gui in zip(override_values, setup_classes_gui_per_value):
+            override_value = self.__script_helper.convert_to_override_value(override_value)
+            
+            for setup_class_gui in setup_classes_gui:
+                for setup_attribute_gui in setup_class_gui.get_setup_attributes_gui():
+                    if setup_attribute_gui.get_name() == attribute:
+                        setup_attribute_gui.get_setup_attribute().set_override_value(override_value)
+                        
+        self.__model.set_values_outdated()
+        
     def reset_override_attribute_values(self, *, class_type=None, class_instance=None, attribute=None, view=None):
         """
         Resets any override value of matching attributes
@@ -132,93 +180,105 @@ class ScriptInterface:
         self.__model.reset_script_changes()
         
 class ScriptHelper:
+    """
+    Finds the blocks that scripts ask for through an index of the setup classes in all setup views, which is built once it is first needed and built again once blocks or views have changed
+    """
     def __init__(self, model):
         self.__model = model
-        self.__cache = {} # To improve performance when getting the same elements multiple times
+        self.__num_block_changes = None # Number of block changes in the model when the index was built, None if it has not been built
         
-    def get_from_cache(self, identifier):
-        if identifier in self.__cache:
-            return self.__cache[identifier]
-            
-        return None
-        
-    def get_setup_views(self, view):
-        cache_result = self.get_from_cache(view)
+        # Each setup class is indexed under every combination of its view name, class type and instance name, where None in a key matches all
+        self.__setup_classes_gui_per_key = {} # Key: Tuple (view, class_type, class_instance), Value: List of GUI setup classes, only including one of any linked copies
+        self.__cache = {} # Key: Tuple (view, class_type, class_instance, attribute), Value: List of GUI setup attributes that have already been found
         
-        if cache_result != None:
-            return cache_result
+    def update_index(self):
+        """
+        Builds the index again if blocks or views have changed since it was last built
+        """
+        if self.__num_block_changes == self.__model.get_num_block_changes():
+            return
             
-        setup_views = []
+        # Scripts can find setup classes in all setup views, which can only be unrestored before the index is first built
+        self.__model.restore_all_setup_views()
+        
+        setup_classes_gui_per_key = {} # Key: Tuple (view, class_type, class_instance), Value: Dictionary (Key: Setup class, Value: First GUI setup class found of it)
         
         for setup_view in self.__model.get_setup_views():
-            if view in (None, setup_view.get_name()):
-                if not setup_view.is_excluded():
-                    setup_views.append(setup_view)
-                    
-        return setup_views
+            if not setup_view.is_excluded():
+                for setup_class_gui in setup_view.get_setup_classes_gui():
+                    for view in (None, setup_view.get_name()):
+                        for class_type in (None, setup_class_gui.get_configuration_name()):
+                            for class_instance in (None, setup_class_gui.get_name()):
+                                setup_classes_gui_per_key.setdefault((view, class_type, class_instance), {}).setdefault(setup_class_gui.get_setup_class(), setup_class_gui)
+                                
+        self.__setup_classes_gui_per_key = {key: list(setup_classes_gui.values()) for key, setup_classes_gui in setup_classes_gui_per_key.items()}
+        self.__cache = {}
+        self.__num_block_changes = self.__model.get_num_block_changes()
         
     def get_setup_classes_gui(self, view, class_type):
-        cache_result = self.get_from_cache((view, class_type))
-        
-        if cache_result != None:
-            return cache_result
-            
-        setup_classes_gui = []
-        seen_setup_classes = set()
-        
-        for setup_view in self.get_setup_views(view):
-            for setup_class_gui in setup_view.get_setup_classes_gui():
-                if class_type in (None, setup_class_gui.get_configuration_name()):
-                    setup_class = setup_class_gui.get_setup_class()
-                    
-                    if not setup_class in seen_setup_classes:
-                        setup_classes_gui.append(setup_class_gui)
-                        seen_setup_classes.add(setup_class)
-                        
-        return setup_classes_gui
+        return self.get_instances_setup_class_gui(view, class_type, None)
         
     def get_first_setup_class_gui(self, class_type):
-        cache_result = self.get_from_cache(class_type)
+        setup_classes_gui = self.get_setup_classes_gui(None, class_type)
         
-        if cache_result != None:
-            return cache_result
+        if len(setup_classes_gui) == 0:
+            return None
             
-        for setup_view in self.get_setup_views(None):
-            for setup_class_gui in setup_view.get_setup_classes_gui():
-                if class_type in (None, setup_class_gui.get_configuration_name()):
-                    return setup_class_gui
-                    
-        return None
+        return setup_classes_gui[0]
         
     def get_instances_setup_class_gui(self, view, class_type, class_instance):
-        cache_result = self.get_from_cache((view, class_type, class_instance))
+        self.update_index()
         
-        if cache_result != None:
-            return cache_result
-            
-        instance_setup_classes_gui = []
-        
-        for setup_class_gui in self.get_setup_classes_gui(view, class_type):
-            if class_type in (None, setup_class_gui.get_configuration_name()) and class_instance in (None, setup_class_gui.get_name()):
-                instance_setup_classes_gui.append(setup_class_gui)
-                
-        return instance_setup_classes_gui
+        return self.__setup_classes_gui_per_key.get((view, class_type, class_instance), [])
         
     def get_setup_attributes_gui(self, view, class_type, class_instance, attribute):
-        cache_result = self.get_from_cache((view, class_type, class_instance, attribute))
+        self.update_index()
+        key = (view, class_type, class_instance, attribute)
         
-        if cache_result != None:
-            return cache_result
+        if key not in self.__cache:
+            setup_attributes_gui = []
             
-        setup_attributes_gui = []
-        
-        for setup_class_gui in self.get_instances_setup_class_gui(view, class_type, class_instance):
-            if class_instance in (None, setup_class_gui.get_name()):
+            for setup_class_gui in self.__setup_classes_gui_per_key.get((view, class_type, class_instance), []):
                 for setup_attribute_gui in setup_class_gui.get_setup_attributes_gui():
                     if attribute in (None, setup_attribute_gui.get_name()):
                         setup_attributes_gui.append(setup_attribute_gui)
                         
-        return setup_attributes_gui
+            self.__cache[key] = setup_attributes_gui
+            
+        return self.__cache[key]
+        
+    def convert_values_to_column(self, values):
+        """
+        Returns the values as a two-dimensional NumPy array if they all are numbers with the same number of values, otherwise the list of values
+        """
+        # Strings are kept as they are, even if they look like numbers
+        if not all(isinstance(value, tuple) and all(isinstance(element, numbers.Number) for element in value) for value in values):
+            return values
+            
+        if len(set(len(value) for value in values)) != 1:
+            return values
+            
+        return np.array(values, dtype=float)
+        
+    def convert_to_override_value(self, override_value):
+        """
+        Converts an override value to a tuple value, where a string is converted as if it was entered through an entry field, and numbers in a sequence are converted directly while other values in it are kept as they are
+        """
+        if isinstance(override_value, str):
+            return convert_string_to_value(override_value)
+            
+        if isinstance(override_value, numbers.Number):
+            return (float(override_value),)
+            
+        row = np.asarray(override_value)
+        
+        if row.ndim != 1:
+            raise TypeError(f"Expected a string, number or sequence of values, but {override_value} was {type(override_value)}")
+            
+        if np.issubdtype(row.dtype, np.number):
+            return tuple(row.astype(float).tolist())
+            
+        return tuple(float(value) if isinstance(value, numbers.Number) else value for value in override_value)
         
     def check_type(self, list_to_check, type_to_check):
         """
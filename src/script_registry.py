@@ -0,0 +1,55 @@
+import os
+import importlib.util
+from script_interface import ScriptInterface
+from config import *
+
+class ScriptRegistry:
+    """
+    Scripts shared by the run script buttons of all setup views, where each script is only loaded once and loaded again when its file has changed
+    """
+    def __init__(self, model, directory=SCRIPTS_PATH):
+        self.__directory = directory
+        self.__script_interface = ScriptInterface(model) # Shared by all scripts
+        self.__script_names = None # Found once it is first needed
+        self.__scripts_per_name = {} # Key: Script name, Value: Tuple (time of last change of the file, module of the script)
+        
+    def get_script_names(self):
+        """
+        Returns the names of all scripts that a button should be added for
+        """
+        if self.__script_names == None:
+            self.__script_names = []
+            
+            for file_name_full in os.listdir(self.__directory):
+                # Find all .py files
+                if file_name_full.strip()[-3:] == ".py":
+                    file_name = file_name_full.strip().replace(".py", "")
+                    
+                    # Skip the template file
+                    if file_name != "SCRIPT_TEMPLATE":
+                        self.__script_names.append(file_name)
+                        
+        return self.__script_names
+        
+    def get_script_module(self, script_name):
+        """
+        Returns the module of the script, which is only imported again if the file has changed since it was last imported
+        """
+        file_path = os.path.join(self.__directory, f"{script_name}.py")
+        file_time = os.path.getmtime(file_path)
+        loaded_file_time, script_module = self.__scripts_per_name.get(script_name, (None, None))
+        
+        if loaded_file_time != file_time:
+            spec = importlib.util.spec_from_file_location(script_name, file_path)
+            script_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(script_module)
+            
+            self.__scripts_per_name[script_name] = (file_time, script_module)
+            
+        return script_module
+        
+    def run_script(self, script_name):
+        self.get_script_module(script_name).script_control(self.__script_interface)
+        
+    def get_script_interface(self):
+        return self.__script_interface
@@ -0,0 +1,82 @@
+import tkinter as tk
+from setup_view import SetupView
+from config import *
+
+class ClassPalette(tk.Frame):
+    """
+    Single list of all configuration classes, shown next to the canvases, that is used to add setup versions of the classes to the current setup view
+    """
+    def __init__(self, model):
+        super().__init__(model.get_root(), width=CLASS_PALETTE_WIDTH, bg=CHANGE_VIEW_HEADER_COLOR)
+        self.__model = model
+        self.__configuration_classes_gui = [] # One GUI configuration class per configuration class, sorted by name
+        
+        self.grid_propagate(False)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+        
+        tk.Label(self, text="Add to system:", font=FONT, bg=CHANGE_VIEW_HEADER_COLOR).grid(row=0, column=0, columnspan=2, sticky="w")
+        
+        self.__listbox = tk.Listbox(self, font=FONT, bg=ADD_TO_SETUP_COLOR, activestyle="none", exportselection=False)
+        scrollbar = tk.Scrollbar(self, orient="vertical", command=self.__listbox.yview)
+        self.__listbox.config(yscrollcommand=scrollbar.set)
+        self.__listbox.bind("<<ListboxSelect>>", lambda event: self.on_select())
+        
+        self.__listbox.grid(row=1, column=0, sticky="nswe")
+        scrollbar.grid(row=1, column=1, sticky="ns")
+        
+    def on_select(self):
+        """
+        When pressing a class in the list, which adds a setup version of it to the current setup view
+        """
+        selected_indices = self.__listbox.curselection()
+        self.__listbox.selection_clear(0, tk.END)
+        
+        current_view = self.__model.get_current_view()
+        
+        if len(selected_indices) > 0 and isinstance(current_view, SetupView):
+            current_view.create_setup_class_gui(configuration_class_gui=self.__configuration_classes_gui[selected_indices[0]])
+            
+    def get_configuration_classes_gui(self):
+        return self.__configuration_classes_gui
+        
+    def get_shown_texts(self):
+        return list(self.__listbox.get(0, tk.END))
+        
+    def add_configuration_class_gui(self, configuration_class_gui):
+        """
+        Adds a configuration class at its sorted position in the list
+        """
+        index = 0
+        
+        while index < len(self.__configuration_classes_gui) and self.__configuration_classes_gui[index].get_name() <= configuration_class_gui.get_name():
+            index += 1
+            
+        self.__configuration_classes_gui.insert(index, configuration_class_gui)
+        self.__listbox.insert(index, configuration_class_gui.get_name())
+        
+    def remove_configuration_class_gui(self, configuration_class_gui):
+        """
+        Removes a configuration class from the list, typically due to the configuration class being deleted
+        """
+        if configuration_class_gui in self.__configuration_classes_gui:
+            self.__listbox.delete(self.__configuration_classes_gui.index(configuration_class_gui))
+            self.__configuration_classes_gui.remove(configuration_class_gui)
+            
+    def replace_configuration_class_gui(self, configuration_class_gui_to_replace, configuration_class_gui):
+        """
+        Replaces the GUI configuration class used when adding setup versions, such as when deleting one out of multiple linked copies
+        """
+        if configuration_class_gui_to_replace in self.__configuration_classes_gui:
+            self.__configuration_classes_gui[self.__configuration_classes_gui.index(configuration_class_gui_to_replace)] = configuration_class_gui
+            
+    def update_order(self):
+        """
+        Updates the stored and displayed order of the classes, such as after a class has changed name
+        """
+        self.__configuration_classes_gui.sort(key=lambda configuration_class_gui: configuration_class_gui.get_name())
+        
+        self.__listbox.delete(0, tk.END)
+        
+        for configuration_class_gui in self.__configuration_classes_gui:
+            self.__listbox.insert(tk.END, configuration_class_gui.get_name())
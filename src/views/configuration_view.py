@@ -1,5 +1,3 @@
-import os
-import pickle
 from view import View
 from configuration_class_gui import GUIConfigurationClass
 from configuration_input_gui import GUIConfigurationInput
@@ -30,7 +28,7 @@ class ConfigurationView(View):
         # Create new
         if configuration_class_gui_to_copy == None:
             configuration_class_gui = GUIConfigurationClass.new(self.get_model(), self, position)
-            self.get_model().create_add_to_setup_buttons(configuration_class_gui) # Add buttons to add the setup class version
+            self.get_model().get_class_palette().add_configuration_class_gui(configuration_class_gui) # Allow adding the setup class version
             
         # Create linked copy
         else:
@@ -99,106 +97,97 @@ class ConfigurationView(View):
         
         return movable_items
         
-    def save(self):
+    def get_saved_state(self):
         """
-        Saves the state of the view
+        Returns the state of the view that is saved
         """
         # Save the state of all blocks
         saved_states_configuration_classes_gui = [class_gui.save_state() for class_gui in self.__configuration_classes_gui]
         saved_states_configuration_inputs_gui = [input_gui.save_state() for input_gui in self.__configuration_inputs_gui]
         
-        file_path = os.path.join(CONFIGURATION_SAVES_DIRECTORY, f"{self.get_name()}.pickle")
+        return {"grid_offset": self.get_grid_offset(), "configuration_classes_gui": saved_states_configuration_classes_gui, "configuration_inputs_gui": saved_states_configuration_inputs_gui}
         
-        # Save grid offset and block states to file
-        with open(os.path.join(SAVES_PATH, file_path), "wb") as file_pickle:
-            pickle.dump((self.get_grid_offset(), saved_states_configuration_classes_gui, saved_states_configuration_inputs_gui), file_pickle)
-            
-        return file_path
-        
-    def restore_save(self, file_path, linked_groups_per_number):
+    def restore_save(self, saved_state, linked_groups_per_number):
         """
         Adds blocks and configures this view according to a previous save
         
-        file_path: Path to the file save
+        saved_state: State of the view, as returned by get_saved_state when saving
         linked_groups_per_number: Dictionary (Key: Group number, Value: List of GUI configuration classes) for configuation class copies linked to each other
         
         Returns mapping between IDs of blocks from the save to those recreated in this new view instance
         """
-        try:
-            with open(os.path.join(SAVES_PATH, file_path), "rb") as file_pickle:
-                grid_offset, saved_states_configuration_classes_gui, saved_states_configuration_inputs_gui = pickle.load(file_pickle)
-                self.set_grid_offset(grid_offset[0], grid_offset[1])
-                
-                mapping_configuration_class_gui = {} # Maps class IDs of GUI configuration classes from previous save to the IDs of the newly created classes
-                mapping_configuration_attribute_gui = {} # Maps class IDs of GUI configuration attributes from previous save to the IDs of the newly created classes
+        grid_offset = saved_state["grid_offset"]
+        self.set_grid_offset(grid_offset[0], grid_offset[1])
+        
+        saved_states_configuration_classes_gui = saved_state["configuration_classes_gui"]
+        saved_states_configuration_inputs_gui = saved_state["configuration_inputs_gui"]
+        
+        mapping_configuration_class_gui = {} # Maps class IDs of GUI configuration classes from previous save to the IDs of the newly created classes
+        mapping_configuration_attribute_gui = {} # Maps class IDs of GUI configuration attributes from previous save to the IDs of the newly created classes
+        
+        # Restore configuration classes
+        for saved_states_configuration_class_gui in saved_states_configuration_classes_gui:
+            linked_group_number = saved_states_configuration_class_gui["linked_group_number"]
+            position = (saved_states_configuration_class_gui["x"], saved_states_configuration_class_gui["y"])
+            
+            # Should bind to already existing configuration class
+            if linked_group_number != None and linked_group_number in linked_groups_per_number:
+                configuration_class_gui = self.get_model().create_linked_configuration_class_gui(linked_groups_per_number[linked_group_number][0], \
+                                                                                                 self, \
+                                                                                                 linked_group_number=linked_group_number, \
+                                                                                                 position=position)
+            else:
+                configuration_class_gui = self.create_configuration_class_gui(position=position)
                 
-                # Restore configuration classes
-                for saved_states_configuration_class_gui in saved_states_configuration_classes_gui:
-                    linked_group_number = saved_states_configuration_class_gui["linked_group_number"]
-                    position = (saved_states_configuration_class_gui["x"], saved_states_configuration_class_gui["y"])
-                    
-                    # Should bind to already existing configuration class
-                    if linked_group_number != None and linked_group_number in linked_groups_per_number:
-                        configuration_class_gui = self.get_model().create_linked_configuration_class_gui(linked_groups_per_number[linked_group_number][0], \
-                                                                                                         self, \
-                                                                                                         linked_group_number=linked_group_number, \
-                                                                                                         position=position)
-                    else:
-                        configuration_class_gui = self.create_configuration_class_gui(position=position)
-                        
-                        if linked_group_number != None:
-                            linked_groups_per_number[linked_group_number] = [configuration_class_gui]
-                            
-                        # Set configuration class data
-                        configuration_class_gui.set_name(saved_states_configuration_class_gui["name"])
-                        
-                        # Restore configuration attributes
-                        for saved_states_configuration_attribute_gui in saved_states_configuration_class_gui["configuration_attributes_gui"]:
-                            # Create configuration attribute
-                            configuration_class_gui.create_attribute()
-                            configuration_attribute_gui = configuration_class_gui.get_configuration_attributes_gui()[-1]
-                            
-                            # Set configuration attribute data
-                            configuration_attribute_gui.set_name(saved_states_configuration_attribute_gui["name"])
-                            configuration_attribute_gui.set_value_type(saved_states_configuration_attribute_gui["value_type"])
-                            configuration_attribute_gui.set_input_scalar(saved_states_configuration_attribute_gui["input_scalar"])
-                            configuration_attribute_gui.set_input_offset(saved_states_configuration_attribute_gui["input_offset"])
-                            configuration_attribute_gui.set_hidden(saved_states_configuration_attribute_gui["is_hidden"])
-                            
-                    mapping_configuration_class_gui[saved_states_configuration_class_gui["configuration_class_gui"]] = configuration_class_gui
+                if linked_group_number != None:
+                    linked_groups_per_number[linked_group_number] = [configuration_class_gui]
                     
-                    for saved_states_configuration_attribute_gui, configuration_attribute_gui in zip(saved_states_configuration_class_gui["configuration_attributes_gui"], configuration_class_gui.get_configuration_attributes_gui()):
-                        mapping_configuration_attribute_gui[saved_states_configuration_attribute_gui["configuration_attribute_gui"]] = configuration_attribute_gui
-                    
-                # Restore configuration inputs
-                for saved_states_configuration_input_gui in saved_states_configuration_inputs_gui:
-                    # Create configuration input
-                    configuration_input_gui = self.create_configuration_input_gui(position=(saved_states_configuration_input_gui["x"], saved_states_configuration_input_gui["y"]))
+                # Set configuration class data
+                configuration_class_gui.set_name(saved_states_configuration_class_gui["name"])
+                
+                # Restore configuration attributes
+                for saved_states_configuration_attribute_gui in saved_states_configuration_class_gui["configuration_attributes_gui"]:
+                    # Create configuration attribute
+                    configuration_class_gui.create_attribute()
+                    configuration_attribute_gui = configuration_class_gui.get_configuration_attributes_gui()[-1]
                     
-                    # Set configuration input data
-                    configuration_input_gui.attempt_to_attach_to_attribute()
-                    calculation_type = saved_states_configuration_input_gui["calculation_type"]
+                    # Set configuration attribute data
+                    configuration_attribute_gui.set_name(saved_states_configuration_attribute_gui["name"])
+                    configuration_attribute_gui.set_value_type(VALUE_TYPES_PER_NAME[saved_states_configuration_attribute_gui["value_type"]])
+                    configuration_attribute_gui.set_input_scalar(saved_states_configuration_attribute_gui["input_scalar"])
+                    configuration_attribute_gui.set_input_offset(saved_states_configuration_attribute_gui["input_offset"])
+                    configuration_attribute_gui.set_hidden(saved_states_configuration_attribute_gui["is_hidden"])
                     
-                    if calculation_type != "":
-                        configuration_input_gui.set_calculation_type(calculation_type)
-                        
-                    # Restore configuration connections
-                    for saved_states_connection in saved_states_configuration_input_gui["connections"]:
-                        connection = GUIConnection(self.get_model(), \
-                                                   self, \
-                                                   mapping_configuration_attribute_gui[saved_states_connection["start_block"]], \
-                                                   saved_states_connection["start_direction"], \
-                                                   end_block=configuration_input_gui, \
-                                                   end_direction=saved_states_connection["end_direction"], \
-                                                   corner_coordinates=saved_states_connection["corner_coordinates"], \
-                                                   is_external=saved_states_connection["is_external"])
-                        
-                return mapping_configuration_class_gui
-                
-        except FileNotFoundError as e:
-            print(f"Could not find configuration view {file_path}: {e}")
+            mapping_configuration_class_gui[saved_states_configuration_class_gui["configuration_class_gui"]] = configuration_class_gui
+            configuration_class_gui.set_save_id(saved_states_configuration_class_gui["configuration_class_gui"])
+            
+            for saved_states_configuration_attribute_gui, configuration_attribute_gui in zip(saved_states_configuration_class_gui["configuration_attributes_gui"], configuration_class_gui.get_configuration_attributes_gui()):
+                mapping_configuration_attribute_gui[saved_states_configuration_attribute_gui["configuration_attribute_gui"]] = configuration_attribute_gui
             
-        return {}
+        # Restore configuration inputs
+        for saved_states_configuration_input_gui in saved_states_configuration_inputs_gui:
+            # Create configuration input
+            configuration_input_gui = self.create_configuration_input_gui(position=(saved_states_configuration_input_gui["x"], saved_states_configuration_input_gui["y"]))
+            
+            # Set configuration input data
+            configuration_input_gui.attempt_to_attach_to_attribute()
+            calculation_type = saved_states_configuration_input_gui["calculation_type"]
+            
+            if calculation_type != None:
+                configuration_input_gui.set_calculation_type(CALCULATION_TYPES_PER_NAME[calculation_type])
+                
+            # Restore configuration connections
+            for saved_states_connection in saved_states_configuration_input_gui["connections"]:
+                connection = GUIConnection(self.get_model(), \
+                                           self, \
+                                           mapping_configuration_attribute_gui[saved_states_connection["start_block"]], \
+                                           saved_states_connection["start_direction"], \
+                                           end_block=configuration_input_gui, \
+                                           end_direction=saved_states_connection["end_direction"], \
+                                           corner_coordinates=saved_states_connection["corner_coordinates"], \
+                                           is_external=saved_states_connection["is_external"])
+                
+        return mapping_configuration_class_gui
         
     def delete(self):
         delete_all(self.__configuration_classes_gui)
@@ -1,11 +1,9 @@
-import os
-import pickle
 from view import View
 from setup_class_gui import GUISetupClass
 from buttons_gui import TouchButton
 from connection_gui import GUIConnection
 from connection_with_blocks_gui import GUIConnectionWithBlocks
-from helper_functions_general import delete_all
+from helper_functions_general import delete_all, get_grid_cell
 from config import *
 import logging
 
@@ -17,8 +15,13 @@ class SetupView(View):
         super().__init__(model, name)
         self.__setup_classes_gui = []
         self.__connections_with_blocks = []
-        self.__to_setup_buttons = []
         self.__is_excluded = False
+        self.__read_save_to_restore = None # Function reading the save of the view if its blocks have not been created yet, which is only done once the view is needed
+        self.__saved_state_to_restore = None # Save returned by that function, kept once it has been read
+        
+        # Spatial index used to find which setup class a connection is put down next to without checking every setup class
+        self.__adjacent_setup_classes_gui = {} # Key: Grid cell, Value: Dictionary (Key: GUI setup class, Value: Direction out from the setup class)
+        self.__adjacent_cells_per_setup_class_gui = {} # Key: GUI setup class, Value: Grid cells currently adjacent to it
         
         self.__create_connection_button = TouchButton.create_connection(model, self)
         self.__calculate_value_button = TouchButton.calculate_values(model, self)
@@ -26,18 +29,12 @@ class SetupView(View):
         self.__run_script_buttons = []
         
         # Add buttons to run scripts
-        for file_name_full in os.listdir(SCRIPTS_PATH):
-            # Find all .py files
-            if file_name_full.strip()[-3:] == ".py":
-                file_name = file_name_full.strip().replace(".py", "")
+        for script_name in model.get_script_registry().get_script_names():
+            # If at least one script, add a button for resetting any changes made by scripts
+            if len(self.__run_script_buttons) == 0:
+                self.__run_script_buttons.append(TouchButton.clear_script(model, self))
                 
-                # Skip the template file
-                if file_name != "SCRIPT_TEMPLATE":
-                    # If at least one script, add a button for resetting any changes made by scripts
-                    if len(self.__run_script_buttons) == 0:
-                        self.__run_script_buttons.append(TouchButton.clear_script(model, self))
-                        
-                    self.__run_script_buttons.append(TouchButton.run_script(model, self, SCRIPTS_PATH, file_name, len(self.__run_script_buttons)))
+            self.__run_script_buttons.append(TouchButton.run_script(model, self, script_name, len(self.__run_script_buttons)))
                     
     def on_resize(self, event):
         """
@@ -51,6 +48,15 @@ class SetupView(View):
         for run_script_button in self.__run_script_buttons:
             run_script_button.move_block(move_x, move_y)
             
+    def show_calculation_progress(self, progress):
+        """
+        Shows the progress of a calculation running in another thread on the calculate button, which cancels the calculation if pressed
+        """
+        if progress == None:
+            self.__calculate_value_button.set_text(CALCULATE_VALUES_TEXT)
+        else:
+            self.__calculate_value_button.set_text(f"Cancel ({progress}%)")
+            
     def create_copy(self):
         """
         Creates a new setup view and sets it up to match this one
@@ -76,7 +82,7 @@ class SetupView(View):
                 
                 for setup_attribute_gui, setup_attribute_gui_copy in zip(setup_class_gui.get_setup_attributes_gui(), \
                                                                          setup_class_gui_copy.get_setup_attributes_gui()):
-                    setup_attribute_gui_copy.set_displayed_value(convert_value_to_string(setup_attribute_gui.get_setup_attribute().get_value()))
+                    setup_attribute_gui_copy.restore_value(setup_attribute_gui.get_setup_attribute().get_value())
                     
         for connection_with_blocks in self.__connections_with_blocks:
             start_block = connection_with_blocks.get_start_block()
@@ -105,6 +111,7 @@ class SetupView(View):
             setup_class_gui = GUISetupClass.new(self.get_model(), self, configuration_class_gui, position)
             
         self.__setup_classes_gui.append(setup_class_gui)
+        setup_class_gui.update_cells()
         
         return setup_class_gui
         
@@ -113,6 +120,43 @@ class SetupView(View):
         
     def remove_setup_class_gui(self, setup_class_gui):
         self.__setup_classes_gui.remove(setup_class_gui)
+        self.remove_adjacent_cells(setup_class_gui)
+        self.remove_culling_cells(setup_class_gui)
+        
+    def update_adjacent_cells(self, setup_class_gui):
+        """
+        Updates the grid cells that a GUI setup class is adjacent to, such as after it has moved or got another attribute
+        """
+        self.remove_adjacent_cells(setup_class_gui)
+        
+        adjacent_cells = setup_class_gui.get_adjacent_cells()
+        
+        for cell, direction in adjacent_cells.items():
+            if cell not in self.__adjacent_setup_classes_gui:
+                self.__adjacent_setup_classes_gui[cell] = {}
+                
+            self.__adjacent_setup_classes_gui[cell][setup_class_gui] = direction
+            
+        self.__adjacent_cells_per_setup_class_gui[setup_class_gui] = adjacent_cells
+        
+    def remove_adjacent_cells(self, setup_class_gui):
+        """
+        Removes a GUI setup class from the spatial index
+        """
+        for cell in self.__adjacent_cells_per_setup_class_gui.pop(setup_class_gui, {}):
+            del self.__adjacent_setup_classes_gui[cell][setup_class_gui]
+            
+            if len(self.__adjacent_setup_classes_gui[cell]) == 0:
+                del self.__adjacent_setup_classes_gui[cell]
+                
+    def get_adjacent_setup_class_gui(self, x, y):
+        """
+        Returns a GUI setup class adjacent to the specified grid coordinate and the direction out from it, or (None, "") if there is none
+        """
+        for setup_class_gui, direction in self.__adjacent_setup_classes_gui.get(get_grid_cell(self, x, y), {}).items():
+            return setup_class_gui, direction
+            
+        return None, ""
         
     def get_movable_items(self):
         """
@@ -146,7 +190,7 @@ class SetupView(View):
                     
         return matching_setup_classes_gui
         
-    def create_connection_with_blocks(self, *, start_coordinate=None, end_coordinate=None, input_scalars=None, input_scalars_indicator_coordinate=None):
+    def create_connection_with_blocks(self, *, start_coordinate=None, end_coordinate=None, start_setup_class_gui=None, end_setup_class_gui=None, sides=("RIGHT", "LEFT"), input_scalars=None, input_scalars_indicator_coordinate=None):
         """
         Creates a new directional connection with already attached triangle blocks on either side
         """
@@ -154,51 +198,48 @@ class SetupView(View):
                                                          self, \
                                                          start_coordinate=start_coordinate, \
                                                          end_coordinate=end_coordinate, \
+                                                         start_setup_class_gui=start_setup_class_gui, \
+                                                         end_setup_class_gui=end_setup_class_gui, \
+                                                         sides=sides, \
                                                          input_scalars=input_scalars, \
                                                          input_scalars_indicator_coordinate=input_scalars_indicator_coordinate)
+        
+        # Connections between setup classes that are already connected are deleted when attached
+        if connection_with_blocks.is_deleted():
+            return None
+            
         self.__connections_with_blocks.append(connection_with_blocks)
         
         return connection_with_blocks
         
-    def remove_connection_with_blocks(self, connection):
-        """
-        Remove directional connection with attached triangle blocks on either side
+    def connect(self, start_setup_class_gui, end_setup_class_gui, *, sides=("RIGHT", "LEFT"), input_scalars=None):
         """
-        self.__connections_with_blocks.remove(connection)
+        Creates a directional connection from one GUI setup class in the view to another, attaching it directly instead of searching for the classes by coordinate
         
-    def create_add_to_setup_button(self, configuration_class_gui):
-        """
-        Creates a button for adding a class from a configuration view to this setup view
-        """
-        self.__to_setup_buttons.append(TouchButton.add_to_setup(self.get_model(), self, configuration_class_gui, len(self.__to_setup_buttons)))
-        self.update_add_to_setup_button_order()
+        sides: Side of the start and end setup class, respectively, that the connection is attached to
         
-    def remove_add_to_setup_button(self, to_setup_button):
-        """
-        Removes a specified button adding a class from a configuration view to this setup view, typically due to removing the configuration class
+        Returns the connection, or None if the setup classes can not be connected, such as when they already are
         """
-        to_setup_button.delete()
-        
-        button_index = self.__to_setup_buttons.index(to_setup_button)
-        self.__to_setup_buttons.remove(to_setup_button)
-        
-        # Move up all buttons after the removed button
-        for to_setup_button_to_move in self.__to_setup_buttons[button_index:]:
-            to_setup_button_to_move.move_block(0, -ADD_TO_SETUP_HEIGHT)
+        if start_setup_class_gui.get_view() != self or end_setup_class_gui.get_view() != self:
+            print("Error: Both setup classes need to be in the view to be connected")
+            return None
             
-    def update_add_to_setup_button_order(self):
+        if start_setup_class_gui.get_setup_class() in end_setup_class_gui.get_setup_class().get_input_setup_classes():
+            print("Error: The setup classes are already connected")
+            return None
+            
+        return self.create_connection_with_blocks(start_setup_class_gui=start_setup_class_gui, \
+                                                  end_setup_class_gui=end_setup_class_gui, \
+                                                  sides=sides, \
+                                                  input_scalars=input_scalars)
+        
+    def remove_connection_with_blocks(self, connection):
         """
-        Updates the stored and displayed order of buttons creating a setup class from a configuration class
+        Remove directional connection with attached triangle blocks on either side
         """
-        to_setup_buttons_with_index = list(enumerate(self.__to_setup_buttons)) # List of tuples (index, to_setup_button)
-        sorted_to_setup_buttons = sorted(to_setup_buttons_with_index, key=lambda x: x[1].get_text())
-        
-        for i, to_setup_button_with_index in enumerate(sorted_to_setup_buttons):
-            previous_index, to_setup_button = to_setup_button_with_index
-            
-            to_setup_button.move_block(0, (i - previous_index) * CHANGE_VIEW_HEIGHT)
-            
-        self.__to_setup_buttons = [to_setup_button for _, to_setup_button in sorted_to_setup_buttons]
+        # Connections that are deleted while being created were never added
+        if connection in self.__connections_with_blocks:
+            self.__connections_with_blocks.remove(connection)
         
     def is_excluded(self):
         """
@@ -218,95 +259,163 @@ class SetupView(View):
         else:
             self.set_background_color(VIEW_BACKGROUND_COLOR)
             
-        # Change color on the button changing to this view from other views
-        for setup_view in self.get_model().get_configuration_views() + self.get_model().get_setup_views():
-            if setup_view != self:
-                if is_excluded:
-                    setup_view.set_color_change_view_button(self, VIEW_EXCLUDED_COLOR)
-                else:
-                    setup_view.set_color_change_view_button(self, CHANGE_VIEW_COLOR)
-                    
+        # Change color of this view in the list of views
+        self.get_model().get_view_navigator().update_view(self)
+        self.set_changed()
+        self.update_excluded_connections()
+        
+    def update_excluded_connections(self):
+        """
+        Disables the connections in the view from calculations if the view is excluded, and enables them otherwise
+        """
         for connection_with_blocks in self.__connections_with_blocks:
             # Disable connections in the view
-            if is_excluded:
+            if self.__is_excluded:
                 connection_with_blocks.get_start_block().attempt_to_disable_calculation_connection()
             # Enable connections in the view
             else:
                 connection_with_blocks.get_start_block().attempt_to_enable_calculation_connection()
                 
-    def save(self):
+    def is_restored(self):
+        """
+        Returns whether the blocks of the view have been created, which is not the case for saved views that have not been needed yet
+        """
+        return self.__read_save_to_restore == None
+        
+    def set_save_to_restore(self, read_saved_state, is_excluded):
         """
-        Saves the state of the view
+        Configures this view according to a previous save, where the save is only read and its blocks created by restore_pending_save once the view is needed
+        
+        read_saved_state: Function returning the saved state of the view, or None if the save could not be found
+        """
+        self.set_excluded(is_excluded)
+        self.__read_save_to_restore = read_saved_state
+        
+    def read_save_to_restore(self):
         """
-        # Save the state of all blocks
-        saved_states_setup_classes_gui = [class_gui.save_state() for class_gui in self.__setup_classes_gui]
-        saved_states_connections_with_blocks = [connection.save_state() for connection in self.__connections_with_blocks]
+        Returns the save set by set_save_to_restore, which is only read once
+        """
+        if self.__saved_state_to_restore == None:
+            self.__saved_state_to_restore = self.__read_save_to_restore()
+            
+        return self.__saved_state_to_restore
         
-        file_path = os.path.join(SETUP_SAVES_DIRECTORY, f"{self.get_name()}.pickle")
+    def has_unread_save(self):
+        return not self.is_restored() and self.__saved_state_to_restore == None
+        
+    def restore_pending_save(self, mapping_configuration_class_gui, linked_groups_per_number):
+        """
+        Creates the blocks of the save set by set_save_to_restore, see restore_save
+        """
+        saved_state = self.read_save_to_restore()
+        self.__read_save_to_restore = None
+        self.__saved_state_to_restore = None
+        
+        # Views whose save could not be found are kept empty
+        if saved_state != None:
+            self.restore_save(saved_state, mapping_configuration_class_gui, linked_groups_per_number)
+            self.update_excluded_connections() # Whether the view is excluded may have changed since the save
+            
+    def set_name(self, name):
+        # The save is read while it is still stored under the name of this view, which another view could be saved under once renamed
+        if not self.is_restored():
+            self.read_save_to_restore()
+            
+        super().set_name(name)
+        
+    def get_saved_state(self):
+        """
+        Returns the state of the view that is saved, where the blocks are stored as columns with one entry per block
+        """
+        # The blocks of the save have not been created, and can not have changed
+        if not self.is_restored():
+            saved_state = self.read_save_to_restore()
+            
+            # Views whose save could not be found are empty once restored, which is saved as below
+            if saved_state != None:
+                return saved_state | {"is_excluded": self.__is_excluded}
+                
+        setup_classes = {"x": [], "y": [], "name": [], "configuration_class_gui": [], "linked_group_number": [], "values": []}
+        connections_with_blocks = {"start": [], "end": [], "input_scalars": [], "input_scalars_indicator": []}
         
-        # Save grid offset and block states to file
-        with open(os.path.join(SAVES_PATH, file_path), "wb") as file_pickle:
-            pickle.dump((self.get_grid_offset(), self.is_excluded(), saved_states_setup_classes_gui, saved_states_connections_with_blocks), file_pickle)
+        for setup_class_gui in self.__setup_classes_gui:
+            setup_classes["x"].append(setup_class_gui.get_x())
+            setup_classes["y"].append(setup_class_gui.get_y())
+            setup_classes["name"].append(setup_class_gui.get_name())
+            setup_classes["configuration_class_gui"].append(setup_class_gui.get_configuration_class_gui().get_save_id())
+            setup_classes["linked_group_number"].append(setup_class_gui.get_linked_group_number())
+            setup_classes["values"].append([setup_attribute_gui.get_setup_attribute().get_value() for setup_attribute_gui in setup_class_gui.get_setup_attributes_gui()])
+            
+        for connection_with_blocks in self.__connections_with_blocks:
+            start_block = connection_with_blocks.get_start_block()
+            end_block = connection_with_blocks.get_end_block()
+            
+            connections_with_blocks["start"].append((start_block.get_x(), start_block.get_y()))
+            connections_with_blocks["end"].append((end_block.get_x(), end_block.get_y()))
+            connections_with_blocks["input_scalars"].append(connection_with_blocks.get_input_scalars())
+            connections_with_blocks["input_scalars_indicator"].append(connection_with_blocks.get_saved_input_scalars_coordinate())
             
-        return file_path
+        return {"grid_offset": self.get_grid_offset(), "is_excluded": self.is_excluded(), "setup_classes": setup_classes, "connections_with_blocks": connections_with_blocks}
         
-    def restore_save(self, file_path, mapping_configuration_class_gui, linked_groups_per_number):
+    def restore_save(self, saved_state, mapping_configuration_class_gui, linked_groups_per_number):
         """
         Adds blocks and configures this view according to a previous save
         
-        file_path: Path to the file save
+        saved_state: State of the view, as returned by get_saved_state when saving
         mapping_configuration_class_gui: Mapping between IDs of blocks from the save to those recreated in this new view instance
         linked_groups_per_number: Dictionary (Key: Group number, Value: List of GUI setup classes) for setup class copies linked to each other
-        """
-        is_excluded = False
         
-        try:
-            with open(os.path.join(SAVES_PATH, file_path), "rb") as file_pickle:
-                grid_offset, is_excluded, saved_states_setup_classes_gui, saved_states_connections_with_blocks = pickle.load(file_pickle)
-                self.set_grid_offset(grid_offset[0], grid_offset[1])
+        Returns whether the view is excluded from calculations
+        """
+        grid_offset = saved_state["grid_offset"]
+        self.set_grid_offset(grid_offset[0], grid_offset[1])
+        
+        setup_classes = saved_state["setup_classes"]
+        connections_with_blocks = saved_state["connections_with_blocks"]
+        
+        # Restore setup classes
+        for x, y, name, configuration_class_gui_id, linked_group_number, values in zip(setup_classes["x"], \
+                                                                                       setup_classes["y"], \
+                                                                                       setup_classes["name"], \
+                                                                                       setup_classes["configuration_class_gui"], \
+                                                                                       setup_classes["linked_group_number"], \
+                                                                                       setup_classes["values"]):
+            # Should bind to already existing setup class
+            if linked_group_number != None and linked_group_number in linked_groups_per_number:
+                setup_class_gui = self.get_model().create_linked_setup_class_gui(linked_groups_per_number[linked_group_number][0], \
+                                                                                 self, \
+                                                                                 linked_group_number=linked_group_number, \
+                                                                                 position=(x, y))
                 
-                # Restore setup classes
-                for saved_states_setup_class_gui in saved_states_setup_classes_gui:
-                    position = (saved_states_setup_class_gui["x"], saved_states_setup_class_gui["y"])
-                    linked_group_number = saved_states_setup_class_gui["linked_group_number"]
-                    
-                    # Should bind to already existing setup class
-                    if linked_group_number != None and linked_group_number in linked_groups_per_number:
-                        setup_class_gui = self.get_model().create_linked_setup_class_gui(linked_groups_per_number[linked_group_number][0], \
-                                                                                         self, \
-                                                                                         linked_group_number=linked_group_number, \
-                                                                                         position=position)
-                        
-                    else:
-                        configuration_class_gui = mapping_configuration_class_gui[saved_states_setup_class_gui["configuration_class_gui"]]
-                        setup_class_gui = self.create_setup_class_gui(configuration_class_gui=configuration_class_gui, position=position)
-                        
-                        if linked_group_number != None:
-                            linked_groups_per_number[linked_group_number] = [setup_class_gui]
-                        
-                    # Set setup class data
-                    setup_class_gui.set_name(saved_states_setup_class_gui["name"])
+                # The name and values are shared with the linked copies that are already restored, which may have been edited since the save if this view is restored later
+                for setup_attribute_gui in setup_class_gui.get_setup_attributes_gui():
+                    setup_attribute_gui.restore_value(setup_attribute_gui.get_setup_attribute().get_value())
                     
-                    for saved_states_setup_attribute_gui, setup_attribute_gui in zip(saved_states_setup_class_gui["setup_attributes_gui"], setup_class_gui.get_setup_attributes_gui()):
-                        setup_attribute_gui.set_displayed_value(convert_value_to_string(saved_states_setup_attribute_gui["value"]))
-                        
-                # Restore setup connections
-                for saved_states_connection_with_blocks in saved_states_connections_with_blocks:
-                    saved_states_start_block = saved_states_connection_with_blocks["start_block"]
-                    saved_states_end_block = saved_states_connection_with_blocks["end_block"]
-                    
-                    start_coordinate = (saved_states_start_block["x"], saved_states_start_block["y"])
-                    end_coordinate = (saved_states_end_block["x"], saved_states_end_block["y"])
-                    
-                    connection_with_blocks = self.create_connection_with_blocks(start_coordinate=start_coordinate, \
-                                                                                end_coordinate=end_coordinate, \
-                                                                                input_scalars=saved_states_connection_with_blocks["input_scalars"], \
-                                                                                input_scalars_indicator_coordinate=saved_states_connection_with_blocks["input_scalars_indicator_coordinate"])
-                    
-        except FileNotFoundError as e:
-            print(f"Could not find setup view {file_path}: {e}")
+                continue
+                
+            setup_class_gui = self.create_setup_class_gui(configuration_class_gui=mapping_configuration_class_gui[configuration_class_gui_id], position=(x, y))
+            
+            if linked_group_number != None:
+                linked_groups_per_number[linked_group_number] = [setup_class_gui]
+                
+            # Set setup class data
+            setup_class_gui.set_name(name)
+            
+            # Values are set directly instead of as text, where they are tuples that are stored as lists
+            for value, setup_attribute_gui in zip(values, setup_class_gui.get_setup_attributes_gui()):
+                setup_attribute_gui.restore_value(tuple(value) if value != None else None)
+                
+        # Restore setup connections
+        for start_coordinate, end_coordinate, input_scalars, input_scalars_indicator_coordinate in zip(connections_with_blocks["start"], \
+                                                                                                      connections_with_blocks["end"], \
+                                                                                                      connections_with_blocks["input_scalars"], \
+                                                                                                      connections_with_blocks["input_scalars_indicator"]):
+            self.create_connection_with_blocks(start_coordinate=start_coordinate, \
+                                               end_coordinate=end_coordinate, \
+                                               input_scalars=tuple(input_scalars), \
+                                               input_scalars_indicator_coordinate=input_scalars_indicator_coordinate)
             
-        return is_excluded
+        return saved_state["is_excluded"]
         
     def delete(self):
         delete_all(self.__setup_classes_gui)
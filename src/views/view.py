@@ -1,10 +1,9 @@
 import tkinter as tk
-from general_gui import GUIModelingBlock
+import math
 from buttons_gui import TouchButton
 from connection_with_blocks_gui import GUIConnectionWithBlocks
 from options import Options
-from helper_functions_general import convert_actual_coordinate_to_grid
-from default_coordinate_functions import get_change_configuration_view_start_coordinate, get_change_setup_view_start_coordinate
+from helper_functions_general import convert_actual_coordinate_to_grid, convert_grid_coordinate_to_actual, get_font
 from config import *
 
 class View(tk.Frame):
@@ -15,32 +14,44 @@ class View(tk.Frame):
         super().__init__()
         self.__model = model
         self.__name = name
-        self.__view_headers = [] # Title headers above the configuration and setup view buttons
-        self.__configuration_change_view_buttons = {} # View and corresponding button
-        self.__setup_change_view_buttons = {} # View and corersponding button
         self.__selected_items = set() # Items that are highlighted by pressing on them
         
         self.__is_panning = False
         self.__is_zooming = False
         self.__panning_last_mouse_coordinate = (0, 0)
         self.__length_unit_difference = 0 # How much the length unit has been changed from LENGTH_UNIT
-        self.__grid_offset = (0, 0) # How much items are offset from the grid in the range [0, 1) due to panning/zooming
+        self.__offset = (0, 0) # How much all items have been moved due to panning/zooming, which items on the canvas with TAG_CONTENT are positioned relative to
+        self.__font_length_unit = LENGTH_UNIT # Length unit that the fonts on the canvas currently correspond to
+        self.__font_update_id = None # Pending update of the fonts after zooming
+        
+        # Work that is only needed once the view is visited, which many generated views never are
+        self.__has_been_shown = False
+        self.__blocks_to_fit_text = set()
+        self.__is_shown_order_outdated = False
         
         self.__canvas = tk.Canvas(self, width=settings.get_canvas_width(), height=settings.get_canvas_height(), bg=VIEW_BACKGROUND_COLOR)
         self.__canvas_size = (settings.get_canvas_width(), settings.get_canvas_height())
-        self.__add_change_configuration_view_button = TouchButton.add_view(model, self, True)
-        self.__add_change_setup_view_button = TouchButton.add_view(model, self, False)
+        
+        # Blocks and connections outside the visible part of the view are hidden, where they are found through the culling cells they overlap
+        self.__culled_blocks = {} # Key: Culling cell, Value: Set of blocks overlapping the cell
+        self.__culling_cells_per_block = {} # Key: Block, Value: Culling cells it overlaps
+        self.__visible_culling_cells = self.get_visible_culling_cells()
+        self.__kept_culling_cells = self.get_visible_culling_cells(CULLING_RELEASE_MARGIN) # Items of blocks outside these cells are released
+        
         self.__save_button = TouchButton.save(model, self)
         self.__settings_button = TouchButton.settings(model, self)
         
         self.__currently_open_options = None
         
-        # Add the headers above the buttons that change between views
-        for text, position in [("Metamodel:", get_change_configuration_view_start_coordinate(LENGTH_UNIT)), ("System:", get_change_setup_view_start_coordinate(LENGTH_UNIT))]:
-            x, y = position
-            y -= CHANGE_VIEW_HEIGHT
-            self.__view_headers.append(GUIModelingBlock(model, self, text, CHANGE_VIEW_WIDTH, CHANGE_VIEW_HEIGHT, CHANGE_VIEW_HEADER_COLOR, position=(x, y), ignore_zoom=True, tags_rect=(TAG_BUTTON,), tags_text=(TAG_BUTTON_TEXT,)))
-            
+        # Single Entry field that is attached to the block whose value is edited, created the first time a value is edited in the view
+        self.__value_entry = None
+        self.__value_entry_text = None
+        self.__value_entry_window = None
+        self.__value_entry_block = None
+        
+        self.__has_unsaved_changes = True # Whether anything that is saved has changed since the view was last saved
+        self.__num_changes = 0 # Number of times anything that is saved has changed, used to tell whether the view has changed since a previous point
+        
         self.__canvas.bind(MOUSE_LEFT_PRESS, self.pan_start)
         self.__canvas.bind(MOUSE_LEFT_DRAG, self.pan_move)
         self.__canvas.bind(MOUSE_LEFT_RELEASE, self.pan_stop)
@@ -85,11 +96,8 @@ class View(tk.Frame):
             # How much to move each item
             move_x, move_y = convert_actual_coordinate_to_grid(event.x-self.__panning_last_mouse_coordinate[0], event.y-self.__panning_last_mouse_coordinate[1], self.get_length_unit())
             
-            self.update_grid_offset(move_x, move_y)
+            self.move_content(move_x, move_y)
             
-            for movable_item in self.get_movable_items():
-                movable_item.move_block(move_x, move_y)
-                
             self.__panning_last_mouse_coordinate = (event.x, event.y)
             
     def pan_stop(self, event):
@@ -115,6 +123,7 @@ class View(tk.Frame):
         self.__is_zooming = True
         
         last_length_unit = self.get_length_unit()
+        was_low_detail = self.is_low_detail()
         self.__length_unit_difference += length_unit_difference
         
         scale_origin_x, scale_origin_y = convert_actual_coordinate_to_grid(event.x, event.y, self.get_length_unit()) # Zoom around where the mouse is
@@ -123,14 +132,180 @@ class View(tk.Frame):
         move_x = scale_origin_x * length_unit_change
         move_y = scale_origin_y * length_unit_change
         
-        self.update_grid_offset(move_x, move_y)
+        # Scaling around the canvas origin keeps the grid coordinates of all items the same
+        scale_factor = self.get_length_unit() / last_length_unit
+        self.__canvas.scale(TAG_CONTENT, 0, 0, scale_factor, scale_factor)
+        
+        self.move_content(move_x, move_y) # Moves all components on the grid to simulate zooming in at the coordinates of the mouse
         
-        for movable_item in self.get_movable_items():
-            movable_item.scale(self.get_length_unit(), last_length_unit) # Scales the size of the grid and all its components
-            movable_item.move_block(move_x, move_y) # Moves all components on the grid to simulate zooming in at the coordinates of the mouse
+        if self.is_low_detail() != was_low_detail:
+            self.update_detail()
             
+        # Only update the fonts once the mouse wheel has stopped
+        if self.__font_update_id != None:
+            self.after_cancel(self.__font_update_id)
+            
+        self.__font_update_id = self.after(ZOOM_FONT_UPDATE_DELAY, self.update_fonts)
+        
         self.__is_zooming = False
         
+    def update_fonts(self):
+        """
+        Updates the fonts of all text and entry fields to the current zoom level, which is not done when scaling the items on the canvas
+        """
+        if self.__font_update_id != None:
+            self.after_cancel(self.__font_update_id)
+            self.__font_update_id = None
+            
+        if self.__font_length_unit == self.get_length_unit():
+            return
+            
+        scale_factor = self.get_length_unit() / self.__font_length_unit
+        self.__font_length_unit = self.get_length_unit()
+        
+        for item in self.__canvas.find_withtag(TAG_CONTENT):
+            if self.__canvas.type(item) == "text":
+                has_line_break = "\n" in self.__canvas.itemcget(item, "text")
+                self.__canvas.itemconfig(item, font=get_font(self.get_length_unit(), canvas_and_label=(self.__canvas, item), has_line_break=has_line_break))
+                
+        # Entry fields are not resized when scaling the canvas
+        for entry_window in self.__canvas.find_withtag(TAG_ENTRY_WINDOW):
+            entry = self.nametowidget(self.__canvas.itemcget(entry_window, "window"))
+            entry.config(font=get_font(self.get_length_unit()))
+            
+            self.__canvas.itemconfig(entry_window, width=float(self.__canvas.itemcget(entry_window, "width")) * scale_factor, \
+                                                   height=float(self.__canvas.itemcget(entry_window, "height")) * scale_factor)
+            
+    def move_content(self, move_x, move_y):
+        """
+        Moves everything except buttons and options in the view, where blocks derive their coordinates from the offset so that only a single move of the items on the canvas is needed
+        """
+        self.update_grid_offset(move_x, move_y)
+        self.__canvas.move(TAG_CONTENT, *convert_grid_coordinate_to_actual(move_x, move_y, self.get_length_unit()))
+        
+        self.update_culling()
+        
+    def get_culling_cell(self, x, y):
+        """
+        Returns the culling cell that a grid coordinate is in, which does not change when panning
+        """
+        return math.floor((x - self.__offset[0]) / CULLING_CELL_SIZE), math.floor((y - self.__offset[1]) / CULLING_CELL_SIZE)
+        
+    def get_visible_culling_cells(self, margin=CULLING_MARGIN):
+        """
+        Returns the range (x1, y1, x2, y2) of culling cells that are at least partly in the visible part of the view, including a margin
+        """
+        grid_width, grid_height = convert_actual_coordinate_to_grid(self.__canvas_size[0], self.__canvas_size[1], self.get_length_unit())
+        
+        return self.get_culling_cell(-margin, -margin) + self.get_culling_cell(grid_width+margin, grid_height+margin)
+        
+    @staticmethod
+    def is_culling_cell_in_range(cell, culling_cell_range):
+        x1, y1, x2, y2 = culling_cell_range
+        
+        return x1 <= cell[0] <= x2 and y1 <= cell[1] <= y2
+        
+    def update_culling_cells(self, block, x1, y1, x2, y2):
+        """
+        Updates which culling cells a block or connection overlaps given its grid bounding box, such as after it has moved, and shows or hides it accordingly
+        """
+        self.remove_culling_cells(block)
+        
+        cell_x1, cell_y1 = self.get_culling_cell(x1, y1)
+        cell_x2, cell_y2 = self.get_culling_cell(x2, y2)
+        culling_cells = [(cell_x, cell_y) for cell_x in range(cell_x1, cell_x2+1) for cell_y in range(cell_y1, cell_y2+1)]
+        
+        for culling_cell in culling_cells:
+            if culling_cell not in self.__culled_blocks:
+                self.__culled_blocks[culling_cell] = set()
+                
+            self.__culled_blocks[culling_cell].add(block)
+            
+        self.__culling_cells_per_block[block] = culling_cells
+        self.update_block_shown(block)
+        
+    def remove_culling_cells(self, block):
+        for culling_cell in self.__culling_cells_per_block.pop(block, []):
+            self.__culled_blocks[culling_cell].remove(block)
+            
+            if len(self.__culled_blocks[culling_cell]) == 0:
+                del self.__culled_blocks[culling_cell]
+                
+    def update_block_shown(self, block):
+        """
+        Shows a block if it overlaps a visible culling cell, and hides it otherwise, where only its rectangle is shown at low zoom levels
+        The items of blocks far outside the visible part of the view are released, where it returns whether they were recreated
+        """
+        culling_cells = self.__culling_cells_per_block[block]
+        is_visible = any(self.is_culling_cell_in_range(culling_cell, self.__visible_culling_cells) for culling_cell in culling_cells)
+        is_detail_shown = is_visible and not self.is_low_detail()
+        is_released = not any(self.is_culling_cell_in_range(culling_cell, self.__kept_culling_cells) for culling_cell in culling_cells)
+        was_released = block.is_released()
+        
+        # Items are recreated before they are shown and released after they are hidden
+        if was_released and not is_released:
+            block.set_released(False)
+            
+        if is_visible != block.is_shown() or is_detail_shown != block.is_detail_shown():
+            block.set_shown(is_visible, is_detail_shown)
+            
+        if is_released and not was_released:
+            block.set_released(True)
+            
+        return was_released and not is_released
+        
+    def update_detail(self):
+        """
+        Shows or hides the details of all visible blocks, such as after zooming past LENGTH_UNIT_LOW_DETAIL
+        """
+        for block in self.get_blocks_in_culling_cells(self.__visible_culling_cells):
+            self.update_block_shown(block)
+            
+    def get_blocks_in_culling_cells(self, *culling_cell_ranges):
+        """
+        Returns all blocks overlapping any culling cell within the specified ranges (x1, y1, x2, y2)
+        """
+        blocks = set()
+        
+        for x1, y1, x2, y2 in culling_cell_ranges:
+            for cell_x in range(x1, x2+1):
+                for cell_y in range(y1, y2+1):
+                    blocks.update(self.__culled_blocks.get((cell_x, cell_y), ()))
+                    
+        return blocks
+        
+    def update_culling(self):
+        """
+        Shows blocks that have come into the visible part of the view and hides those that have left it, where only blocks in culling cells that were or are visible need to be checked
+        """
+        last_visible_culling_cells = self.__visible_culling_cells
+        last_kept_culling_cells = self.__kept_culling_cells
+        self.__visible_culling_cells = self.get_visible_culling_cells()
+        self.__kept_culling_cells = self.get_visible_culling_cells(CULLING_RELEASE_MARGIN)
+        
+        if self.__visible_culling_cells == last_visible_culling_cells and self.__kept_culling_cells == last_kept_culling_cells:
+            return
+            
+        blocks = self.get_blocks_in_culling_cells(last_visible_culling_cells, self.__visible_culling_cells)
+        
+        # Blocks can only be released or recreated if they overlap culling cells that are kept either before or after, but not both
+        for x1, y1, x2, y2 in (last_kept_culling_cells, self.__kept_culling_cells):
+            for cell_x in range(x1, x2+1):
+                for cell_y in range(y1, y2+1):
+                    culling_cell = (cell_x, cell_y)
+                    
+                    if not self.is_culling_cell_in_range(culling_cell, last_kept_culling_cells) or not self.is_culling_cell_in_range(culling_cell, self.__kept_culling_cells):
+                        blocks.update(self.__culled_blocks.get(culling_cell, ()))
+                        
+        was_any_recreated = False
+        
+        for block in blocks:
+            was_any_recreated |= self.update_block_shown(block)
+            
+        # Recreated items are otherwise drawn on top of everything
+        if was_any_recreated:
+            self.update_shown_order()
+            
     def on_resize(self, event):
         """
         Changing the window size
@@ -142,14 +317,8 @@ class View(tk.Frame):
         move_x, move_y = convert_actual_coordinate_to_grid(actual_move_x, actual_move_y, LENGTH_UNIT)
         
         self.__canvas_size = (event.width, event.height)
+        self.update_culling()
         
-        # Buttons and their accompanying headers to move so that they do not end up outside the window
-        for item_to_move_x in self.__view_headers + \
-                              list(self.__configuration_change_view_buttons.values()) + \
-                              list(self.__setup_change_view_buttons.values()) + \
-                              [self.__add_change_configuration_view_button, self.__add_change_setup_view_button]:
-            item_to_move_x.move_block(move_x, 0)
-            
         self.__save_button.move_block(0, move_y)
         self.__settings_button.move_block(0, move_y)
         
@@ -164,106 +333,160 @@ class View(tk.Frame):
         """
         Refreshes the order that items should be shown in to make sure some are shown on top of others
         """
+        # Only refreshed once when building many blocks at once
+        if self.__model.is_bulk_building():
+            self.__model.postpone_shown_order(self)
+            return
+            
+        # Only refreshed once the view is visited
+        if not self.__has_been_shown:
+            self.__is_shown_order_outdated = True
+            return
+            
         for tag in (TAG_INPUT, TAG_INPUT_TEXT, TAG_CONNECTION_LINE, TAG_CONNECTION_CORNER, TAG_INDICATOR, TAG_INDICATOR_TEXT, TAG_BUTTON, TAG_BUTTON_TEXT, TAG_OPTIONS_HIGHLIGHT, TAG_OPTIONS_BACKGROUND, TAG_OPTIONS, TAG_OPTIONS_TEXT):
             self.__canvas.tag_raise(tag)
             
     def open_options(self):
         return Options.view(self.get_model(), self)
         
-    def get_model(self):
-        return self.__model
+    def open_value_entry(self, block, actual_x, actual_y, actual_width, actual_height, text):
+        """
+        Attaches the Entry field of the view to a block so that its value can be edited, where the block is told about each change and when the Entry field is closed
+        """
+        self.close_value_entry()
         
-    def get_name(self):
-        return self.__name
+        # Any pending font update after zooming would otherwise also resize the attached Entry
+        self.update_fonts()
         
-    def set_name(self, name):
-        self.__name = name
-        self.__model.set_text_change_view_buttons(self, name) # Need to update the text of the change view buttons in all views
+        if self.__value_entry == None:
+            self.__value_entry_text = tk.StringVar(self)
+            self.__value_entry_text.trace_add("write", lambda *args: self.write_value_entry())
+            
+            self.__value_entry = tk.Entry(self, textvariable=self.__value_entry_text)
+            self.__value_entry.bind("<FocusOut>", lambda *args: self.close_value_entry() if self.focus_get() != self.__value_entry else None) # Remove the Entry when unfocused
+            
+        self.__value_entry_text.set(text) # Set before attaching the block so that the block is not told about its own text
+        self.__value_entry.config(font=get_font(self.get_length_unit()))
+        self.__value_entry_block = block
         
-    def get_canvas(self):
-        return self.__canvas
+        self.__value_entry_window = self.__canvas.create_window(actual_x, \
+                                                                actual_y, \
+                                                                window=self.__value_entry, \
+                                                                anchor="nw", \
+                                                                width=actual_width, \
+                                                                height=actual_height, \
+                                                                tags=(TAG_CONTENT, TAG_ENTRY_WINDOW))
         
-    def set_background_color(self, color):
-        self.__canvas.config(bg=color)
+        # When starting to edit the entered value, unselect all blocks
+        self.unselect_all_items()
+        
+        self.__value_entry.focus()
+        self.__value_entry.icursor(tk.END)
         
-    def add_change_view_button(self, view_to_change_to, is_configuration_view):
+    def close_value_entry(self, block=None, *, show_entered_value=True):
         """
-        Adds a button to change to a specified view
+        Removes the Entry field from the block it is attached to, or only if it is attached to the specified block
+        
+        show_entered_value: Whether the block shows its entered value again, which is not needed if it is about to show another value
         """
-        # Move down the button that adds another view
-        if is_configuration_view:
-            self.__configuration_change_view_buttons[view_to_change_to] = TouchButton.change_view(self.__model, self, view_to_change_to.get_name(), view_to_change_to, True, len(self.__configuration_change_view_buttons))
-            self.__add_change_configuration_view_button.move_block(0, CHANGE_VIEW_HEIGHT)
+        if self.__value_entry_block == None or (block != None and block != self.__value_entry_block):
+            return
             
-        else:
-            self.__setup_change_view_buttons[view_to_change_to] = TouchButton.change_view(self.__model, self, view_to_change_to.get_name(), view_to_change_to, False, len(self.__setup_change_view_buttons))
-            self.__add_change_setup_view_button.move_block(0, CHANGE_VIEW_HEIGHT)
+        closed_block = self.__value_entry_block
+        self.__value_entry_block = None
+        
+        self.__canvas.delete(self.__value_entry_window)
+        self.__value_entry_window = None
+        
+        if show_entered_value:
+            closed_block.show_entered_value()
+        
+    def is_value_entry_attached(self, block):
+        return block == self.__value_entry_block
+        
+    def write_value_entry(self):
+        """
+        Passes on the text written in the Entry field to the block it is attached to
+        """
+        if self.__value_entry_block != None:
+            self.__value_entry_block.write_entered_value(self.__value_entry_text.get())
             
-    def remove_change_view_button(self, view_to_remove):
+    def set_changed(self, affects_values=True, *, affects_blocks=True):
         """
-        Removes a button that changes to a specified view
+        Marks that the view needs to be saved again, where calculated values also become outdated unless only they have changed
+        Blocks are also marked as changed for the model unless only values or the grid offset have changed
         """
-        from configuration_view import ConfigurationView
-        from setup_view import SetupView
+        self.__has_unsaved_changes = True
+        self.__num_changes += 1
         
-        # Move up the button that adds another view
-        if isinstance(view_to_remove, ConfigurationView):
-            change_view_buttons = self.__configuration_change_view_buttons
-            self.__add_change_configuration_view_button.move_block(0, -CHANGE_VIEW_HEIGHT)
+        if affects_values:
+            self.__model.set_values_outdated()
             
-        elif isinstance(view_to_remove, SetupView):
-            change_view_buttons = self.__setup_change_view_buttons
-            self.__add_change_setup_view_button.move_block(0, -CHANGE_VIEW_HEIGHT)
+        if affects_blocks:
+            self.__model.set_blocks_changed()
             
-        button_to_remove = change_view_buttons[view_to_remove]
+    def has_unread_save(self):
+        """
+        Returns whether the view has not read its record in the save file yet, in which case its saved state is the same as that record
+        """
+        return False
         
-        # Move up all buttons that change view that are after the removed button
-        for change_view_button in change_view_buttons.values():
-            if change_view_button.get_y() > button_to_remove.get_y():
-                change_view_button.move_block(0, -CHANGE_VIEW_HEIGHT)
-                
-        # Remove the button to change view
-        button_to_remove.delete()
-        change_view_buttons.pop(view_to_remove)
+    def has_unsaved_changes(self):
+        return self.__has_unsaved_changes
+        
+    def set_saved(self):
+        self.__has_unsaved_changes = False
+        
+    def get_num_changes(self):
+        return self.__num_changes
         
-    def move_change_view_button(self, view_to_move, up):
+    def has_been_shown(self):
+        return self.__has_been_shown
+        
+    def postpone_text_fitting(self, block):
+        self.__blocks_to_fit_text.add(block)
+        
+    def prepare_to_show(self):
         """
-        Moves a change view button up or down a step
+        Fits the texts of all blocks and orders the items on the canvas when the view is shown for the first time
         """
-        to_move = CHANGE_VIEW_HEIGHT
-        
-        if up:
-            to_move *= -1
+        if self.__has_been_shown:
+            return
             
-        from configuration_view import ConfigurationView
-        from setup_view import SetupView
+        self.__has_been_shown = True
         
-        if isinstance(view_to_move, ConfigurationView):
-            self.__configuration_change_view_buttons[view_to_move].move_block(0, to_move)
-            
-        elif isinstance(view_to_move, SetupView):
-            self.__setup_change_view_buttons[view_to_move].move_block(0, to_move)
-            
-    def set_color_change_view_button(self, view, color):
-        from configuration_view import ConfigurationView
-        from setup_view import SetupView
+        for block in self.__blocks_to_fit_text:
+            if not block.is_deleted():
+                block.fit_pending_text()
+                
+        self.__blocks_to_fit_text.clear()
         
-        if isinstance(view, ConfigurationView):
-            self.__configuration_change_view_buttons[view].set_fill_color(color)
-            
-        elif isinstance(view, SetupView):
-            self.__setup_change_view_buttons[view].set_fill_color(color)
+        if self.__is_shown_order_outdated:
+            self.update_shown_order()
             
-    def set_text_change_view_button(self, view_with_changed_name, text):
+    def bulk_build(self):
         """
-        Change the text of a specific change view button within this view
+        Used in a with statement when creating many blocks at once, see Model.bulk_build
         """
-        if view_with_changed_name in self.__configuration_change_view_buttons:
-            self.__configuration_change_view_buttons[view_with_changed_name].set_text(text)
-            
-        elif view_with_changed_name in self.__setup_change_view_buttons:
-            self.__setup_change_view_buttons[view_with_changed_name].set_text(text)
-            
+        return self.__model.bulk_build()
+        
+    def get_model(self):
+        return self.__model
+        
+    def get_name(self):
+        return self.__name
+        
+    def set_name(self, name):
+        self.__name = name
+        self.__model.get_view_navigator().update_view(self) # Need to update the text shown in the list of views
+        self.set_changed(False)
+        
+    def get_canvas(self):
+        return self.__canvas
+        
+    def set_background_color(self, color):
+        self.__canvas.config(bg=color)
+        
     def get_selected_items(self):
         return self.__selected_items
         
@@ -303,21 +526,30 @@ class View(tk.Frame):
         """
         return LENGTH_UNIT + self.__length_unit_difference
         
+    def is_low_detail(self):
+        """
+        Returns whether the view is zoomed out so far that only the rectangles of blocks are drawn
+        """
+        return self.get_length_unit() < LENGTH_UNIT_LOW_DETAIL
+        
     def update_grid_offset(self, move_x, move_y):
         """
         Update the current offset of the grid due to panning/zooming
         """
-        # Set the offset of each value to be within [0, 1)
-        grid_offset_x = (self.__grid_offset[0] + move_x) % 1
-        grid_offset_y = (self.__grid_offset[1] + move_y) % 1
+        self.__offset = (self.__offset[0] + move_x, self.__offset[1] + move_y)
+        self.set_changed(False, affects_blocks=False) # Blocks are saved relative to the offset
         
-        self.__grid_offset = (grid_offset_x, grid_offset_y)
+    def get_offset(self):
+        return self.__offset
         
     def get_grid_offset(self):
-        return self.__grid_offset
+        """
+        Returns how much items are offset from the grid in the range [0, 1) due to panning/zooming
+        """
+        return (self.__offset[0] % 1, self.__offset[1] % 1)
         
     def set_grid_offset(self, offset_x, offset_y):
-        self.__grid_offset = (offset_x, offset_y)
+        self.__offset = (offset_x, offset_y)
         
     def set_currently_open_options(self, currently_open_options):
         # Already open
@@ -334,4 +566,7 @@ class View(tk.Frame):
         self.__currently_open_options = None
         
     def delete(self):
+        if self.__font_update_id != None:
+            self.after_cancel(self.__font_update_id)
+            
         self.destroy()
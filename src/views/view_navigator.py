@@ -0,0 +1,204 @@
+import tkinter as tk
+from configuration_view import ConfigurationView
+from config import *
+
+class ViewNavigator(tk.Frame):
+    """
+    Single list of all views, shown next to the canvases, that is used to change between views
+    """
+    def __init__(self, model):
+        super().__init__(model.get_root(), width=VIEW_NAVIGATOR_WIDTH, bg=CHANGE_VIEW_HEADER_COLOR)
+        self.__model = model
+        self.__current_view = None
+        self.__shown_views = {True: [], False: []} # Key: Whether configuration views, Value: Views in the order they are shown in the corresponding list
+        self.__listboxes = {}
+        
+        self.grid_propagate(False)
+        self.columnconfigure(0, weight=1)
+        
+        # Field for only showing views whose name contains the entered text
+        self.__filter_text = tk.StringVar()
+        self.__filter_text.trace_add("write", lambda *args: self.refresh())
+        
+        tk.Label(self, text="Filter views:", font=FONT, bg=CHANGE_VIEW_HEADER_COLOR).grid(row=0, column=0, columnspan=2, sticky="w")
+        tk.Entry(self, textvariable=self.__filter_text, font=FONT, bg=ENTRY_COLOR).grid(row=1, column=0, columnspan=2, sticky="we")
+        
+        for i, (text, is_configuration_view) in enumerate([("Metamodel:", True), ("System:", False)]):
+            row = 2 + 3 * i
+            
+            tk.Label(self, text=text, font=FONT, bg=CHANGE_VIEW_HEADER_COLOR).grid(row=row, column=0, sticky="w")
+            
+            # Button for adding another view
+            tk.Button(self, text="+", font=FONT, bg=ADD_CHANGE_VIEW_COLOR, command=lambda is_configuration_view=is_configuration_view: self.add_new_view(is_configuration_view)).grid(row=row, column=1, sticky="e")
+            
+            # The listbox only draws the rows that are visible, independent of the number of views
+            listbox = tk.Listbox(self, font=FONT, bg=CHANGE_VIEW_COLOR, activestyle="none", exportselection=False)
+            scrollbar = tk.Scrollbar(self, orient="vertical", command=listbox.yview)
+            listbox.config(yscrollcommand=scrollbar.set)
+            listbox.bind("<<ListboxSelect>>", lambda event, is_configuration_view=is_configuration_view: self.on_select(is_configuration_view))
+            
+            listbox.grid(row=row+1, column=0, sticky="nswe")
+            scrollbar.grid(row=row+1, column=1, sticky="ns")
+            self.rowconfigure(row+1, weight=1)
+            
+            self.__listboxes[is_configuration_view] = listbox
+            
+    def add_new_view(self, is_configuration_view):
+        """
+        Creates a new view from the button in the navigator
+        """
+        if is_configuration_view:
+            self.__model.create_view(True, "New configuration")
+        else:
+            self.__model.create_view(False, "New setup")
+            
+    def on_select(self, is_configuration_view):
+        """
+        When pressing a view in one of the lists
+        """
+        selected_indices = self.__listboxes[is_configuration_view].curselection()
+        
+        if len(selected_indices) > 0:
+            self.__model.change_view(self.__shown_views[is_configuration_view][selected_indices[0]])
+            
+    def set_filter(self, text):
+        self.__filter_text.set(text)
+        
+    def matches_filter(self, view):
+        return self.__filter_text.get().lower() in view.get_name().lower()
+        
+    def get_views(self, is_configuration_view):
+        """
+        Returns all views of one type in the order they are stored in the model
+        """
+        if is_configuration_view:
+            return self.__model.get_configuration_views()
+            
+        return self.__model.get_setup_views()
+        
+    def get_shown_views(self, is_configuration_view):
+        return self.__shown_views[is_configuration_view]
+        
+    def get_shown_text(self, view):
+        """
+        Returns the text shown in the list for a specified view, or None if it is currently filtered out
+        """
+        is_configuration_view = isinstance(view, ConfigurationView)
+        
+        if view not in self.__shown_views[is_configuration_view]:
+            return None
+            
+        return self.__listboxes[is_configuration_view].get(self.__shown_views[is_configuration_view].index(view))
+        
+    def get_view_color(self, view):
+        if view == self.__current_view:
+            return CHANGE_VIEW_SELECTED_COLOR
+            
+        if not isinstance(view, ConfigurationView) and view.is_excluded():
+            return VIEW_EXCLUDED_COLOR
+            
+        return CHANGE_VIEW_COLOR
+        
+    def refresh(self, is_configuration_view=None):
+        """
+        Rebuilds the shown lists from the stored views, such as when the filter changes
+        """
+        if is_configuration_view == None:
+            is_configuration_views = (True, False)
+        else:
+            is_configuration_views = (is_configuration_view,)
+            
+        for is_configuration_view in is_configuration_views:
+            listbox = self.__listboxes[is_configuration_view]
+            listbox.delete(0, tk.END)
+            
+            self.__shown_views[is_configuration_view] = [view for view in self.get_views(is_configuration_view) if self.matches_filter(view)]
+            
+            for i, view in enumerate(self.__shown_views[is_configuration_view]):
+                listbox.insert(tk.END, view.get_name())
+                listbox.itemconfig(i, bg=self.get_view_color(view))
+                
+    def add_view(self, view, is_configuration_view):
+        """
+        Adds a view to the end of its list, which does not depend on the number of existing views
+        """
+        if not self.matches_filter(view):
+            return
+            
+        listbox = self.__listboxes[is_configuration_view]
+        listbox.insert(tk.END, view.get_name())
+        listbox.itemconfig(tk.END, bg=self.get_view_color(view))
+        
+        self.__shown_views[is_configuration_view].append(view)
+        
+    def remove_view(self, view):
+        is_configuration_view = isinstance(view, ConfigurationView)
+        shown_views = self.__shown_views[is_configuration_view]
+        
+        if view in shown_views:
+            self.__listboxes[is_configuration_view].delete(shown_views.index(view))
+            shown_views.remove(view)
+            
+        if view == self.__current_view:
+            self.__current_view = None
+            
+    def swap_views(self, view_1, view_2):
+        """
+        Swaps the shown order of two views that are next to each other in the model
+        """
+        is_configuration_view = isinstance(view_1, ConfigurationView)
+        shown_views = self.__shown_views[is_configuration_view]
+        
+        # Only the order among shown views matters, and a hidden view can not be between two adjacent views
+        if view_1 in shown_views and view_2 in shown_views:
+            index_1, index_2 = shown_views.index(view_1), shown_views.index(view_2)
+            shown_views[index_1], shown_views[index_2] = shown_views[index_2], shown_views[index_1]
+            
+            self.update_row(index_1, is_configuration_view)
+            self.update_row(index_2, is_configuration_view)
+            
+    def update_row(self, index, is_configuration_view):
+        """
+        Updates the text and color of a single row to match the view shown in it
+        """
+        listbox = self.__listboxes[is_configuration_view]
+        view = self.__shown_views[is_configuration_view][index]
+        
+        listbox.delete(index)
+        listbox.insert(index, view.get_name())
+        listbox.itemconfig(index, bg=self.get_view_color(view))
+        
+    def update_view(self, view):
+        """
+        Updates the text and color shown for a specific view, such as after changing its name or excluding it
+        """
+        is_configuration_view = isinstance(view, ConfigurationView)
+        shown_views = self.__shown_views[is_configuration_view]
+        
+        # The view might have started or stopped matching the filter
+        if (view in shown_views) != self.matches_filter(view):
+            self.refresh(is_configuration_view)
+            
+        elif view in shown_views:
+            self.update_row(shown_views.index(view), is_configuration_view)
+            
+    def set_current_view(self, view):
+        """
+        Marks which view is currently shown
+        """
+        last_view = self.__current_view
+        
+        if view == last_view:
+            return
+            
+        self.__current_view = view
+        
+        for updated_view in (last_view, view):
+            if updated_view != None:
+                is_configuration_view = isinstance(updated_view, ConfigurationView)
+                
+                if updated_view in self.__shown_views[is_configuration_view]:
+                    self.__listboxes[is_configuration_view].itemconfig(self.__shown_views[is_configuration_view].index(updated_view), bg=self.get_view_color(updated_view))
+                    
+        for listbox in self.__listboxes.values():
+            listbox.selection_clear(0, tk.END)
@@ -0,0 +1,60 @@
+import sys
+import os
+import time
+import subprocess
+
+sys.path.append(os.path.join("..", "config"))
+from program_paths import BASE_PATH
+
+STARTUP_TIME_LIMIT = 100 # Milliseconds that entry points without a GUI should start within
+NUM_RUNS = 5 # The fastest run is used, as the first run also compiles the imported modules
+
+# Sets up the import paths in the same way as main.py, where the settings are given a save name so that they do not depend on the settings file
+SETUP_CODE = "import sys; sys.path.append('config'); from program_paths import IMPORT_PATHS; sys.path.extend(IMPORT_PATHS); from settings import load_settings; load_settings('custom'); "
+
+# Key: Name, Value: Tuple (arguments to Python, whether the entry point should start within the time limit)
+ENTRY_POINTS = {"Command line usage": (["main.py"], True), \
+                "Calculation layer": (["-c", SETUP_CODE + "import configuration_class_calculation"], True), \
+                "GUI model": (["-c", SETUP_CODE + "import model"], False)}
+                
+def measure_startup(arguments):
+    """
+    Returns the time in milliseconds to start Python with the specified arguments, and the time of the imports as reported by -X importtime
+    """
+    start_time = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime"] + arguments, cwd=BASE_PATH, capture_output=True, text=True)
+    startup_time = (time.perf_counter() - start_time) * 1000
+    
+    if process.returncode != 0:
+        print(process.stderr)
+        raise RuntimeError(f"Could not start {arguments}")
+        
+    import_time = 0
+    
+    # Lines are formatted as "import time: self [us] | cumulative | imported package", where nested imports are indented
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("imported package"):
+            self_time, cumulative_time, module_name = line[len("import time:"):].split("|")
+            
+            if not module_name[1:].startswith(" "):
+                import_time += int(cumulative_time) / 1000
+                
+    return startup_time, import_time
+    
+def main():
+    is_within_limit = True
+    
+    print(f"{'Entry point':<25}{'Startup [ms]':>15}{'Imports [ms]':>15}")
+    
+    for name, (arguments, has_limit) in ENTRY_POINTS.items():
+        startup_time, import_time = min(measure_startup(arguments) for i in range(NUM_RUNS))
+        
+        exceeds_limit = has_limit and startup_time > STARTUP_TIME_LIMIT
+        is_within_limit = is_within_limit and not exceeds_limit
+        
+        print(f"{name:<25}{startup_time:>15.1f}{import_time:>15.1f}{'  Exceeds ' + str(STARTUP_TIME_LIMIT) + ' ms' if exceeds_limit else ''}")
+        
+    return 0 if is_within_limit else 1
+    
+if __name__ == "__main__":
+    sys.exit(main())
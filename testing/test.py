@@ -1,8 +1,13 @@
 import unittest
+import unittest.mock
 import tkinter as tk
 import sys
 import os
 import time
+import json
+import sqlite3
+import tempfile
+from contextlib import closing
 from tkinter import font
 from io import StringIO
 
@@ -13,14 +18,22 @@ for path in IMPORT_PATHS:
     sys.path.append(os.path.join("..", path))
     
 from model import Model
+import background_calculation
+from background_calculation import BackgroundCalculation
+from setup_attribute_snapshot import SetupAttributeSnapshot
+from save_file import SaveFile
+from autosave import Autosave
 from script_interface import ScriptInterface
+from script_registry import ScriptRegistry
 from configuration_class_calculation import ConfigurationClass
-from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid
+from helper_functions_general import convert_grid_coordinate_to_actual, convert_actual_coordinate_to_grid, get_font
 from default_coordinate_functions import get_block_start_coordinates
 from config import *
 
 # sys.stdout = StringIO() # Suppress prints
 
+BACKGROUND_CALCULATION_TIMEOUT = 60 # Seconds that tests wait for a calculation in another thread before failing
+
 def process_changes(root):
     """
     Manually process changes made to the GUI
@@ -221,7 +234,27 @@ class Test(unittest.TestCase):
             
         if is_bold != None:
             self.assertEqual(font.Font(font=view.get_canvas().itemcget(block._GUIModelingBlock__label_text, "font")).actual("weight") == "bold", is_bold)
-
+            
+    def wait_for_background_calculation(self, on_processed=None):
+        """
+        Processes changes until the calculation in another thread has finished, and fails if it takes too long
+        
+        on_processed: Function called each time changes have been processed
+        """
+        deadline = time.monotonic() + BACKGROUND_CALCULATION_TIMEOUT
+        
+        while self.model.is_calculating_in_background():
+            if time.monotonic() > deadline:
+                self.model.cancel_background_calculation()
+                self.fail(f"The calculation in the background did not finish within {BACKGROUND_CALCULATION_TIMEOUT} seconds")
+                
+            process_changes(self.root)
+            
+            if on_processed != None:
+                on_processed()
+                
+            time.sleep(0.01)
+            
 class TestCreatingBlocks(Test):
     def test_configuration_class(self):
         view = self.get_configuration_view()
@@ -275,6 +308,69 @@ class TestCreatingBlocks(Test):
             setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[i]
             self.check_coordinate(setup_attribute_gui, (setup_class_gui.get_x(), setup_class_gui.get_y()+CLASS_HEIGHT+i*ATTRIBUTE_HEIGHT))
             
+    def test_bulk_build(self):
+        configuration_class_gui = self.configuration_class()
+        view = self.get_setup_view()
+        self.model.change_view(view)
+        
+        with view.bulk_build():
+            setup_class_gui = view.create_setup_class_gui(configuration_class_gui=configuration_class_gui, position=(15, 15))
+            setup_class_gui.set_name("BULK")
+            
+            # Texts are only fitted to the blocks once all blocks have been created
+            self.assertEqual(view.get_canvas().itemcget(setup_class_gui._GUIModelingBlock__label_text, "text"), "")
+            
+        self.assertTrue(view.get_canvas().itemcget(setup_class_gui._GUIModelingBlock__label_text, "text").replace("\n", " ").endswith("BULK"))
+        self.assertFalse(self.model.is_bulk_building())
+        
+    def test_unvisited_view(self):
+        configuration_class_gui = self.configuration_class()
+        view = self.get_setup_view(1)
+        label_text = self.setup_class(configuration_class_gui, view=view)._GUIModelingBlock__label_text
+        
+        # Texts are only fitted once the view is visited
+        self.assertFalse(view.has_been_shown())
+        self.assertEqual(view.get_canvas().itemcget(label_text, "text"), "")
+        
+        self.model.change_view(view)
+        
+        self.assertTrue(view.has_been_shown())
+        self.assertNotEqual(view.get_canvas().itemcget(label_text, "text"), "")
+        
+    def test_value_entry(self):
+        configuration_class_gui = self.configuration_class()
+        self.attribute(configuration_class_gui)
+        
+        view = self.get_setup_view()
+        self.model.change_view(view)
+        
+        setup_attribute_gui = self.setup_class(configuration_class_gui).get_setup_attributes_gui()[0]
+        linked_setup_attribute_gui = self.linked_setup_class(setup_attribute_gui.get_setup_class_gui(), x=15, y=15).get_setup_attributes_gui()[0]
+        
+        # Pressing the manually entered value attaches the Entry field of the view
+        perform_action(setup_attribute_gui, setup_attribute_gui.left_pressed, setup_attribute_gui.get_x()+ATTRIBUTE_WIDTH, setup_attribute_gui.get_y())
+        self.assertTrue(view.is_value_entry_attached(setup_attribute_gui))
+        
+        view._View__value_entry_text.set("5")
+        view.close_value_entry()
+        
+        self.assertFalse(view.is_value_entry_attached(setup_attribute_gui))
+        
+        for attribute_gui in (setup_attribute_gui, linked_setup_attribute_gui):
+            self.assertEqual(view.get_canvas().itemcget(attribute_gui._GUISetupAttribute__label_value, "text"), "5")
+            
+        # Displaying another value removes the Entry field without displaying the entered value first
+        setup_attribute_gui.edit_entered_value()
+        displayed_texts = []
+        set_displayed_value = setup_attribute_gui.set_displayed_value
+        setup_attribute_gui.set_displayed_value = lambda text, color=None: displayed_texts.append(text) or set_displayed_value(text, color)
+        
+        setup_attribute_gui.set_displayed_value("6")
+        
+        self.assertFalse(view.is_value_entry_attached(setup_attribute_gui))
+        self.assertEqual(displayed_texts, ["6"])
+        self.assertEqual(view.get_canvas().itemcget(setup_attribute_gui._GUISetupAttribute__label_value, "text"), "6")
+        
 class TestDraggingBlocks(Test):
     def setUp(self):
         super().setUp()
@@ -352,6 +448,148 @@ class TestDraggingBlocks(Test):
             setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[i]
             self.check_coordinate(setup_attribute_gui, (setup_class_gui.get_x(), setup_class_gui.get_y()+CLASS_HEIGHT+i*ATTRIBUTE_HEIGHT))
             
+    def test_pan(self):
+        self.attribute(self.configuration_class_gui)
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=15, y=15)
+        setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[0]
+        canvas = self.setup_view.get_canvas()
+        
+        actual_coordinates = canvas.coords(setup_class_gui._GUIModelingBlock__rect)
+        self.setup_view.move_content(3, 2)
+        
+        # Blocks should follow the items on the canvas without being moved individually
+        self.check_coordinate(setup_class_gui, (18, 17))
+        self.check_coordinate(setup_attribute_gui, (18, 17+CLASS_HEIGHT))
+        self.assertEqual(canvas.coords(setup_class_gui._GUIModelingBlock__rect), \
+                         [value + move for value, move in zip(actual_coordinates, convert_grid_coordinate_to_actual(3, 2, self.setup_view.get_length_unit())*2)])
+        
+        # Setup classes should still be found next to their new position
+        self.assertEqual(self.setup_view.get_adjacent_setup_class_gui(18, 16), (setup_class_gui, "UP"))
+        
+    def test_zoom(self):
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=15, y=15)
+        canvas = self.setup_view.get_canvas()
+        label_text = setup_class_gui._GUIModelingBlock__label_text
+        
+        # Zoom around the canvas origin so that no items are moved
+        event = tk.Event()
+        event.x = 0
+        event.y = 0
+        self.setup_view.zoom_in(event)
+        
+        length_unit = self.setup_view.get_length_unit()
+        self.check_coordinate(setup_class_gui, (15, 15))
+        
+        for actual_value, expected_value in zip(canvas.coords(setup_class_gui._GUIModelingBlock__rect), \
+                                                convert_grid_coordinate_to_actual(15, 15, length_unit) + convert_grid_coordinate_to_actual(15+CLASS_WIDTH, 15+CLASS_HEIGHT, length_unit)):
+            self.assertAlmostEqual(actual_value, expected_value)
+            
+        # Fonts are only updated once zooming has stopped
+        self.setup_view.update_fonts()
+        self.assertEqual(int(canvas.itemcget(label_text, "font").split()[1]), get_font(length_unit, canvas_and_label=(canvas, label_text))[1])
+        
+    def test_culling(self):
+        self.attribute(self.configuration_class_gui)
+        canvas = self.setup_view.get_canvas()
+        
+        # Place a setup class far outside the visible part of the view
+        grid_width = convert_actual_coordinate_to_grid(settings.get_canvas_width(), 0, self.setup_view.get_length_unit())[0]
+        x = int(grid_width) + CULLING_MARGIN + 2 * CULLING_CELL_SIZE
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=x, y=15)
+        setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[0]
+        
+        self.assertFalse(setup_class_gui.is_shown())
+        self.assertFalse(setup_attribute_gui.is_shown())
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__rect, "state"), "hidden")
+        
+        # Panning to the setup class shows it again
+        self.setup_view.move_content(15 - x, 0)
+        
+        self.assertTrue(setup_class_gui.is_shown())
+        self.assertTrue(setup_attribute_gui.is_shown())
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__rect, "state"), "normal")
+        self.check_coordinate(setup_class_gui, (15, 15))
+        
+    def test_release(self):
+        self.attribute(self.configuration_class_gui)
+        canvas = self.setup_view.get_canvas()
+        
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=15, y=15)
+        other_setup_class_gui = self.setup_class(self.configuration_class_gui, x=30, y=15)
+        connection = setup_connection(setup_class_gui, "RIGHT", other_setup_class_gui, "LEFT")
+        setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[0]
+        
+        label_text = setup_class_gui._GUIModelingBlock__label_text
+        text = canvas.itemcget(label_text, "text")
+        value_text = canvas.itemcget(setup_attribute_gui._GUISetupAttribute__label_value, "text")
+        
+        # Panning far away deletes the text of the blocks and the lines of the connection
+        grid_width = convert_actual_coordinate_to_grid(settings.get_canvas_width(), 0, self.setup_view.get_length_unit())[0]
+        move_x = -(int(grid_width) + CULLING_RELEASE_MARGIN + 2 * CULLING_CELL_SIZE)
+        self.setup_view.move_content(move_x, 0)
+        
+        self.assertTrue(setup_class_gui.is_released())
+        self.assertTrue(setup_attribute_gui.is_released())
+        self.assertTrue(connection.is_released())
+        self.assertFalse(connection.is_shown())
+        self.assertIsNone(canvas.type(label_text))
+        self.assertEqual(connection._GUIConnection__lines, [])
+        
+        # Panning back recreates them
+        self.setup_view.move_content(-move_x, 0)
+        
+        self.assertFalse(setup_class_gui.is_released())
+        self.assertFalse(connection.is_released())
+        self.assertTrue(connection.is_shown())
+        self.assertNotEqual(connection._GUIConnection__lines, [])
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__label_text, "text"), text)
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__label_text, "state"), "normal")
+        self.assertEqual(canvas.itemcget(setup_attribute_gui._GUISetupAttribute__label_value, "text"), value_text)
+        self.check_coordinate(setup_class_gui, (15, 15))
+        
+    def test_low_detail(self):
+        self.attribute(self.configuration_class_gui)
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=15, y=15)
+        setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[0]
+        canvas = self.setup_view.get_canvas()
+        
+        event = tk.Event()
+        event.x = 0
+        event.y = 0
+        
+        # Only the rectangle of the setup class is drawn when zoomed out far enough
+        while not self.setup_view.is_low_detail():
+            self.setup_view.zoom_out(event)
+            
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__rect, "state"), "normal")
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__label_text, "state"), "hidden")
+        self.assertFalse(setup_attribute_gui.is_shown())
+        
+        self.setup_view.zoom_in(event)
+        
+        self.assertEqual(canvas.itemcget(setup_class_gui._GUIModelingBlock__label_text, "state"), "normal")
+        self.assertTrue(setup_attribute_gui.is_shown())
+        
+    def test_unsaved_changes(self):
+        setup_class_gui = self.setup_class(self.configuration_class_gui, x=15, y=15)
+        views = self.model.get_configuration_views() + self.model.get_setup_views()
+        
+        self.model.calculate_values()
+        
+        for view in views:
+            view.set_saved()
+            
+        drag_to(setup_class_gui, 20, 20)
+        
+        # Only the view with the moved block needs to be saved again, while the calculated values are still current
+        for view in views:
+            self.assertEqual(view.has_unsaved_changes(), view == self.setup_view)
+            
+        self.assertTrue(self.model._Model__are_values_current)
+        
+        self.configuration_class_gui.set_name("Changed")
+        self.assertTrue(self.configuration_view.has_unsaved_changes())
+        
 class TestChangeName(Test):
     def test_class(self):
         configuration_name = "CONFIGURATION CLASS 123"
@@ -372,6 +610,43 @@ class TestChangeName(Test):
         self.assertEqual(setup_class_gui.get_setup_class().get_instance_name(), setup_name)
         self.assertEqual(setup_class_gui.get_setup_class().get_configuration_name(), configuration_name)
         
+    def test_long_name(self):
+        long_name = "CONFIGURATION CLASS WITH A VERY LONG NAME"
+        canvas = self.get_configuration_view().get_canvas()
+        
+        # The second class reuses the text fitted for the first one
+        configuration_class_guis = [self.configuration_class(x=10, y=10+5*i) for i in range(2)]
+        
+        for configuration_class_gui in configuration_class_guis:
+            configuration_class_gui.set_name(long_name)
+            
+        label_texts = [canvas.itemcget(configuration_class_gui._GUIModelingBlock__label_text, "text") for configuration_class_gui in configuration_class_guis]
+        
+        self.assertIn("\n", label_texts[0])
+        self.assertEqual(label_texts[0].replace("\n", " "), long_name)
+        self.assertEqual(label_texts[0], label_texts[1])
+        
+    def test_class_palette(self):
+        class_palette = self.model.get_class_palette()
+        
+        configuration_class_gui_1 = self.configuration_class(x=10, y=10)
+        configuration_class_gui_2 = self.configuration_class(x=20, y=20)
+        self.model.create_linked_configuration_class_gui(configuration_class_gui_1, self.get_configuration_view(1))
+        
+        # Linked copies are only shown once, sorted by name
+        configuration_class_gui_1.set_name("B")
+        configuration_class_gui_2.set_name("A")
+        
+        self.assertEqual(class_palette.get_configuration_classes_gui(), [configuration_class_gui_2, configuration_class_gui_1])
+        self.assertEqual(class_palette.get_shown_texts(), ["A", "B"])
+        
+        # Creating views does not add any classes
+        self.model.create_view(False, "New setup")
+        self.assertEqual(class_palette.get_shown_texts(), ["A", "B"])
+        
+        configuration_class_gui_2.delete()
+        self.assertEqual(class_palette.get_shown_texts(), ["B"])
+        
     def test_attribute(self):
         attribute_name = "ATTRIBUTE 123"
         
@@ -393,9 +668,7 @@ class TestChangeName(Test):
         configuration_view.set_name(view_name)
         
         self.assertEqual(configuration_view.get_name(), view_name)
-        
-        for view in self.model.get_configuration_views() + self.model.get_setup_views():
-            self.check_text(view._View__configuration_change_view_buttons[configuration_view], view, text=view_name, is_bold=False)
+        self.assertEqual(self.model.get_view_navigator().get_shown_text(configuration_view), view_name)
             
     def test_setup_view(self):
         view_name = "SETUP VIEW 123"
@@ -403,9 +676,7 @@ class TestChangeName(Test):
         setup_view.set_name(view_name)
         
         self.assertEqual(setup_view.get_name(), view_name)
-        
-        for view in self.model.get_configuration_views() + self.model.get_setup_views():
-            self.check_text(view._View__setup_change_view_buttons[setup_view], view, text=view_name, is_bold=False)
+        self.assertEqual(self.model.get_view_navigator().get_shown_text(setup_view), view_name)
             
     def test_set_calculation_type(self):
         configuration_view = self.get_configuration_view()
@@ -527,54 +798,71 @@ class TestSwitchPlaces(Test):
         view_1, view_2 = views
         self.assertEqual((view_1, view_2), (top_view, bottom_view))
         
-    def check_change_view_button_positions(self, is_configuration_view, top_view, bottom_view):
+    def check_view_list_positions(self, is_configuration_view, top_view, bottom_view):
         """
-        Checks that the buttons for changing views are in a specified order
+        Checks that the views are shown in a specified order in the list of views
         """
-        for view in self.model.get_configuration_views() + self.model.get_setup_views():
-            if is_configuration_view:
-                change_view_buttons = view._View__configuration_change_view_buttons
-            else:
-                change_view_buttons = view._View__setup_change_view_buttons
-                
-            top_button = change_view_buttons[top_view]
-            bottom_button = change_view_buttons[bottom_view]
-            
-            self.assertTrue(top_button.get_y() < bottom_button.get_y())
+        shown_views = self.model.get_view_navigator().get_shown_views(is_configuration_view)
+        
+        self.assertTrue(shown_views.index(top_view) < shown_views.index(bottom_view))
+        self.assertEqual(self.model.get_view_navigator().get_shown_text(top_view), top_view.get_name())
+        self.assertEqual(self.model.get_view_navigator().get_shown_text(bottom_view), bottom_view.get_name())
             
     def test_switch_change_configuration_views(self):
         configuration_view_1, configuration_view_2 = self.get_configuration_view(0), self.get_configuration_view(1)
         
-        self.check_change_view_button_positions(True, configuration_view_1, configuration_view_2)
+        self.check_view_list_positions(True, configuration_view_1, configuration_view_2)
         
         self.model.swap_view_places(configuration_view_1, True) # Should not move up when at the top
         self.model.swap_view_places(configuration_view_1, False) # Move down
         
         self.check_view_order(self.model.get_configuration_views(), configuration_view_2, configuration_view_1)
-        self.check_change_view_button_positions(True, configuration_view_2, configuration_view_1)
+        self.check_view_list_positions(True, configuration_view_2, configuration_view_1)
         
         self.model.swap_view_places(configuration_view_1, False) # Should not move down when at the bottom
         self.model.swap_view_places(configuration_view_1, True) # Move up
         
         self.check_view_order(self.model.get_configuration_views(), configuration_view_1, configuration_view_2)
-        self.check_change_view_button_positions(True, configuration_view_1, configuration_view_2)
+        self.check_view_list_positions(True, configuration_view_1, configuration_view_2)
         
     def test_switch_change_setup_views(self):
         setup_view_1, setup_view_2 = self.get_setup_view(0), self.get_setup_view(1)
         
-        self.check_change_view_button_positions(False, setup_view_1, setup_view_2)
+        self.check_view_list_positions(False, setup_view_1, setup_view_2)
         
         self.model.swap_view_places(setup_view_1, True) # Should not move up when at the top
         self.model.swap_view_places(setup_view_1, False) # Move down
         
         self.check_view_order(self.model.get_setup_views(), setup_view_2, setup_view_1)
-        self.check_change_view_button_positions(False, setup_view_2, setup_view_1)
+        self.check_view_list_positions(False, setup_view_2, setup_view_1)
         
         self.model.swap_view_places(setup_view_1, False) # Should not move down when at the bottom
         self.model.swap_view_places(setup_view_1, True) # Move up
         
         self.check_view_order(self.model.get_setup_views(), setup_view_1, setup_view_2)
-        self.check_change_view_button_positions(False, setup_view_1, setup_view_2)
+        self.check_view_list_positions(False, setup_view_1, setup_view_2)
+        
+    def test_filter_views(self):
+        view_navigator = self.model.get_view_navigator()
+        setup_view_1, setup_view_2 = self.get_setup_view(0), self.get_setup_view(1)
+        
+        setup_view_1.set_name("Attack tree")
+        view_navigator.set_filter("attack")
+        
+        self.assertEqual(view_navigator.get_shown_views(False), [setup_view_1])
+        self.assertEqual(view_navigator.get_shown_views(True), [])
+        self.assertEqual(view_navigator.get_shown_text(setup_view_2), None)
+        
+        # Views that are created while filtering are only shown if they match
+        new_setup_view = self.model.create_view(False, "Second attack tree")
+        self.model.create_view(False, "Other")
+        
+        self.assertEqual(view_navigator.get_shown_views(False), [setup_view_1, new_setup_view])
+        
+        view_navigator.set_filter("")
+        
+        self.assertEqual(view_navigator.get_shown_views(False), self.model.get_setup_views())
+        self.assertEqual(view_navigator.get_shown_views(True), self.model.get_configuration_views())
         
 class TestConnections(Test):
     def test_configuration_connection(self):
@@ -654,6 +942,147 @@ class TestConnections(Test):
         
         self.assertEqual(list(input_setup_class.get_input_setup_classes().keys())[0], output_setup_class)
         
+        # Check the GUI setup attributes that are highlighted as input
+        input_setup_attribute_gui = input_setup_class_gui.get_setup_attributes_gui()[0]
+        self.assertEqual(input_setup_class_gui.get_connected_setup_attributes_gui(input_setup_attribute_gui.get_setup_attribute()), [output_setup_class_gui.get_setup_attributes_gui()[0]])
+        
+    def test_background_calculation(self):
+        input_configuration_class_gui = self.configuration_class(x=20, y=20)
+        input_configuration_attribute_gui = self.attribute(input_configuration_class_gui)
+        
+        configuration_input_gui = self.configuration_input()
+        drag_and_attach_input(configuration_input_gui, input_configuration_attribute_gui, "LEFT")
+        
+        output_configuration_class_gui = self.configuration_class(x=10, y=10)
+        output_configuration_attribute_gui = self.attribute(output_configuration_class_gui)
+        
+        configuration_connection(output_configuration_attribute_gui, "RIGHT", configuration_input_gui)
+        
+        input_setup_class_gui = self.setup_class(input_configuration_class_gui, x=20, y=20)
+        output_setup_class_gui = self.setup_class(output_configuration_class_gui, x=10, y=10)
+        setup_connection(output_setup_class_gui, "RIGHT", input_setup_class_gui, "LEFT")
+        
+        output_setup_class_gui.get_setup_attributes_gui()[0].set_entry_value("3")
+        input_setup_attribute = input_setup_class_gui.get_setup_attributes_gui()[0].get_setup_attribute()
+        
+        self.model.calculate_values_in_background()
+        self.assertTrue(self.model.is_calculating_in_background())
+        self.assertFalse(self.model._Model__are_values_current)
+        
+        self.wait_for_background_calculation()
+        background_value = input_setup_attribute.get_value()
+        
+        # A complete calculation does not need to be done again before saving
+        self.assertTrue(self.model._Model__are_values_current)
+        
+        # Same value as when calculating in the main thread
+        self.model.calculate_values()
+        self.assertEqual(background_value, input_setup_attribute.get_value())
+        
+    def test_progressive_refinement(self):
+        input_configuration_class_gui = self.configuration_class(x=20, y=20)
+        input_configuration_attribute_gui = self.attribute(input_configuration_class_gui)
+        input_configuration_attribute_gui.set_value_type(ValueTypeProbability)
+        
+        configuration_input_gui = self.configuration_input()
+        drag_and_attach_input(configuration_input_gui, input_configuration_attribute_gui, "LEFT")
+        configuration_input_gui.set_calculation_type(CalculationTypeSampleTriangle)
+        
+        output_configuration_class_gui = self.configuration_class(x=10, y=10)
+        
+        for i in range(2):
+            output_configuration_attribute_gui = self.attribute(output_configuration_class_gui)
+            output_configuration_attribute_gui.set_value_type(ValueTypeTriangleDistribution)
+            configuration_connection(output_configuration_attribute_gui, "RIGHT", configuration_input_gui)
+            
+        setup_view = self.get_setup_view()
+        self.model.change_view(setup_view)
+        
+        input_setup_class_gui = self.setup_class(input_configuration_class_gui, x=20, y=20)
+        output_setup_class_gui = self.setup_class(output_configuration_class_gui, x=10, y=10)
+        setup_connection(output_setup_class_gui, "RIGHT", input_setup_class_gui, "LEFT")
+        
+        for setup_attribute_gui, value in zip(output_setup_class_gui.get_setup_attributes_gui(), ["1 / 2 / 3", "1.5 / 2.5 / 3.5"]):
+            setup_attribute_gui.set_entry_value(value)
+            
+        input_setup_attribute_gui = input_setup_class_gui.get_setup_attributes_gui()[0]
+        input_setup_attribute = input_setup_attribute_gui.get_setup_attribute()
+        label_value = input_setup_attribute_gui._GUISetupAttribute__label_value
+        
+        num_samples = settings.get_num_samples()
+        settings.set_num_samples(4 * PROGRESSIVE_INITIAL_NUM_SAMPLES)
+        num_rounds = len(BackgroundCalculation.get_num_samples_per_round(settings.get_num_samples(), True))
+        shown_texts = []
+        
+        # One value is applied at a time, so that each estimate is shown before it is replaced
+        try:
+            with unittest.mock.patch.object(background_calculation, "CALCULATION_VALUES_PER_BATCH", 1), \
+                 unittest.mock.patch.object(SetupAttributeSnapshot, "apply_value", autospec=True, side_effect=SetupAttributeSnapshot.apply_value) as apply_value:
+                self.model.calculate_values_in_background(progressive=True)
+                self.wait_for_background_calculation(lambda: shown_texts.append(setup_view.get_canvas().itemcget(label_value, "text")))
+                process_changes(self.root)
+        finally:
+            settings.set_num_samples(num_samples)
+            
+        applied_values = [call.args[1] for call in apply_value.call_args_list if call.args[0].get_setup_attribute() == input_setup_attribute]
+        
+        # Estimates are marked while being refined, and each round replaces the estimate of the previous one
+        self.assertTrue(any(text.startswith(REFINING_VALUE_MARKER) for text in shown_texts))
+        self.assertEqual(len(applied_values), num_rounds)
+        self.assertIs(input_setup_attribute.get_value(), applied_values[-1])
+        
+        # The marker is removed once the value has been refined
+        self.assertFalse(self.model.is_refining_value(input_setup_attribute))
+        self.assertFalse(setup_view.get_canvas().itemcget(label_value, "text").startswith(REFINING_VALUE_MARKER))
+        
+    def test_adjacent_setup_class(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        
+        setup_class_gui = self.setup_class(configuration_class_gui, x=10, y=10)
+        setup_attribute_gui = setup_class_gui.get_setup_attributes_gui()[0]
+        setup_view = setup_class_gui.get_view()
+        
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(10, 9), (setup_class_gui, "UP"))
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(10, setup_attribute_gui.get_y()+setup_attribute_gui.get_height()), (setup_class_gui, "DOWN"))
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(9, setup_attribute_gui.get_y()), (setup_class_gui, "LEFT"))
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(10+setup_class_gui.get_width(), 10), (setup_class_gui, "RIGHT"))
+        
+        # Moving the setup class should also move where it is found
+        drag_to(setup_class_gui, 20, 20, setup_view.get_length_unit())
+        
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(10, 9), (None, ""))
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(20, 19), (setup_class_gui, "UP"))
+        
+        setup_class_gui.delete()
+        
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(20, 19), (None, ""))
+        
+    def test_connect_by_reference(self):
+        input_configuration_class_gui = self.configuration_class(x=20, y=20)
+        output_configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(output_configuration_class_gui)
+        
+        input_setup_class_gui = self.setup_class(input_configuration_class_gui, x=20, y=20)
+        output_setup_class_gui = self.setup_class(output_configuration_class_gui, x=10, y=10)
+        setup_view = input_setup_class_gui.get_view()
+        
+        connection = setup_view.connect(output_setup_class_gui, input_setup_class_gui, sides=("DOWN", "UP"))
+        
+        self.assertEqual(connection.get_start_setup_class_gui(), output_setup_class_gui)
+        self.assertEqual(connection.get_end_setup_class_gui(), input_setup_class_gui)
+        self.assertEqual((connection.get_start_direction(), connection.get_end_direction()), ("DOWN", "UP"))
+        self.assertEqual(list(input_setup_class_gui.get_setup_class().get_input_setup_classes().keys()), [output_setup_class_gui.get_setup_class()])
+        
+        # The triangle blocks should be placed where they would attach when dragged there
+        start_block = connection.get_start_block()
+        self.assertEqual(setup_view.get_adjacent_setup_class_gui(start_block.get_x(), start_block.get_y()), (output_setup_class_gui, "DOWN"))
+        
+        # Setup classes that are already connected are not connected again
+        self.assertIsNone(setup_view.connect(output_setup_class_gui, input_setup_class_gui))
+        self.assertEqual(input_setup_class_gui.get_connected_setup_classes_gui(), [output_setup_class_gui])
+        self.assertEqual(len(setup_view._SetupView__connections_with_blocks), 1)
+        
     def test_external_configuration_connection(self):
         configuration_class_gui = self.configuration_class(x=10, y=10)
         output_configuration_attribute_gui = self.attribute(configuration_class_gui)
@@ -733,6 +1162,13 @@ class TestCalculations(Test):
     def test_sample_triangle(self):
         self.check_calculation(CalculationTypeSampleTriangle, ValueTypeProbability, [ValueTypeTriangleDistribution]*2, ["1 / 2 / 3", "4 / 5 / 6"], "0")
         self.check_calculation(CalculationTypeSampleTriangle, ValueTypeProbability, [ValueTypeTriangleDistribution]*2, ["4 / 5 / 6", "1 / 2 / 3"], "1")
+        
+    def test_progressive_num_samples(self):
+        num_samples = 4 * PROGRESSIVE_INITIAL_NUM_SAMPLES
+        
+        self.assertEqual(BackgroundCalculation.get_num_samples_per_round(num_samples, False), [num_samples])
+        self.assertEqual(BackgroundCalculation.get_num_samples_per_round(num_samples, True), [PROGRESSIVE_INITIAL_NUM_SAMPLES, 2 * PROGRESSIVE_INITIAL_NUM_SAMPLES, num_samples])
+        self.assertEqual(BackgroundCalculation.get_num_samples_per_round(PROGRESSIVE_INITIAL_NUM_SAMPLES // 2, True), [PROGRESSIVE_INITIAL_NUM_SAMPLES // 2])
                 
 class TestScripts(Test):
     def setUp(self):
@@ -815,6 +1251,28 @@ class TestScripts(Test):
         self.elements_are_equal(self.script_if.get_attribute_values("CLASS 0", "CLASS 0 INSTANCE 0", None), (("VALUE 0",), ("VALUE 1",)))
         self.elements_are_equal(self.script_if.get_attribute_values("CLASS 1", None, None), (()))
         
+    def test_get_attribute_table(self):
+        class_instance_names, columns = self.script_if.get_attribute_table("CLASS 0", self.setup_view_names[2])
+        
+        self.assertEqual(class_instance_names, ["CLASS 0 INSTANCE 0"])
+        self.assertEqual(columns, {"CLASS 0 ATTRIBUTE 0": [("VALUE 0",)], "CLASS 0 ATTRIBUTE 1": [("VALUE 1",)]})
+        
+    def test_override_attribute_table(self):
+        self.script_if.override_attribute_table([[1, 2]], "CLASS 0", "CLASS 0 ATTRIBUTE 0", class_instances=["CLASS 0 INSTANCE 0"])
+        self.check_attribute_values(self.setup_class_gui, [(1, 2), ("VALUE 1",)])
+        
+        # Numeric columns are returned as arrays with one row per class instance
+        class_instance_names, columns = self.script_if.get_attribute_table("CLASS 0", self.setup_view_names[2])
+        self.assertEqual(columns["CLASS 0 ATTRIBUTE 0"].tolist(), [[1, 2]])
+        
+        # Values in a sequence that are not numbers are kept as they are, even if they look like numbers
+        self.script_if.override_attribute_table([("1", 2)], "CLASS 0", "CLASS 0 ATTRIBUTE 0", class_instances=["CLASS 0 INSTANCE 0"])
+        class_instance_names, columns = self.script_if.get_attribute_table("CLASS 0", self.setup_view_names[2])
+        self.assertEqual(columns["CLASS 0 ATTRIBUTE 0"], [("1", 2)])
+        
+        with self.assertRaises(ValueError):
+            self.script_if.override_attribute_table(["1"], "CLASS 0", "CLASS 0 ATTRIBUTE 0")
+            
     def test_convert_value_to_string(self):
         self.assertEqual(self.script_if.convert_value_to_string((1, 2, 3)), "1 / 2 / 3")
         
@@ -841,6 +1299,309 @@ class TestScripts(Test):
         self.script_if.reset_override_attribute_values()
         self.check_attribute_values(self.setup_class_gui, (("VALUE 0",), ("VALUE 1",)))
         
+    def test_displayed_values(self):
+        view = self.setup_views[0]
+        self.model.change_view(view)
+        
+        setup_attribute_gui = self.setup_class_gui.get_setup_attributes_gui()[0]
+        label_value = setup_attribute_gui._GUISetupAttribute__label_value
+        
+        self.script_if.override_attribute_values("OVERRIDE", "CLASS 0", class_instance="CLASS 0 INSTANCE 0", attribute="CLASS 0 ATTRIBUTE 0")
+        self.model.calculate_values()
+        
+        # Changed values are shown once the GUI is idle
+        self.assertTrue(setup_attribute_gui.has_displayed_value_changed())
+        process_changes(self.root)
+        
+        self.assertFalse(setup_attribute_gui.has_displayed_value_changed())
+        self.assertEqual(view.get_canvas().itemcget(label_value, "text").replace("\n", ""), "OVERRIDE")
+        
+    def test_script_index(self):
+        script_helper = self.script_if._ScriptInterface__script_helper
+        setup_attributes_gui = script_helper.get_setup_attributes_gui(None, "CLASS 0", None, "CLASS 0 ATTRIBUTE 0")
+        
+        # Found blocks are kept until blocks or views change, which calculating values does not
+        self.model.calculate_values()
+        
+        # Setup views are only restored when the index is built
+        with unittest.mock.patch.object(self.model, "restore_all_setup_views") as restore_all_setup_views:
+            self.assertIs(script_helper.get_setup_attributes_gui(None, "CLASS 0", None, "CLASS 0 ATTRIBUTE 0"), setup_attributes_gui)
+            restore_all_setup_views.assert_not_called()
+            
+        self.setup_class_gui.set_name("CLASS 0 INSTANCE 3")
+        self.elements_are_equal(self.script_if.get_class_instance_names("CLASS 0"), ("CLASS 0 INSTANCE 1", "CLASS 0 INSTANCE 2", "CLASS 0 INSTANCE 3"))
+        
+        self.setup_views[1].set_excluded(True)
+        self.elements_are_equal(self.script_if.get_class_instance_names("CLASS 0"), ("CLASS 0 INSTANCE 1", "CLASS 0 INSTANCE 3"))
+        
+    def test_script_registry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "Script.py")
+            
+            for file_name in ("Script.py", "SCRIPT_TEMPLATE.py"):
+                with open(os.path.join(directory, file_name), "w") as file:
+                    file.write("def script_control(script_if):\n    script_if.calculate_values()\n")
+                    
+            script_registry = ScriptRegistry(self.model, directory)
+            script_module = script_registry.get_script_module("Script")
+            
+            # Scripts are only loaded again once their file has changed
+            self.assertEqual(script_registry.get_script_names(), ["Script"])
+            self.assertIs(script_registry.get_script_module("Script"), script_module)
+            
+            os.utime(file_path, (0, 0))
+            self.assertIsNot(script_registry.get_script_module("Script"), script_module)
+            
+class TestSave(Test):
+    def test_save_file(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        self.setup_class(configuration_class_gui, x=10, y=10)
+        
+        views = self.model.get_configuration_views() + self.model.get_setup_views()
+        view_order = [(view in self.model.get_configuration_views(), view.get_name()) for view in views]
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file = SaveFile(os.path.join(directory, "save.sqlite"))
+            save_file.write({key: view.get_saved_state() for key, view in zip(view_order, views)}, view_order)
+            
+            # Deleted views are kept in the save, but are no longer restored
+            save_file.write({}, view_order[1:])
+            saved_views = list(save_file.read_views())
+            
+        self.assertEqual([(is_configuration_view, name) for is_configuration_view, name, saved_state in saved_views], view_order[1:])
+        self.assertEqual(saved_views[-1][2]["setup_classes"], views[-1].get_saved_state()["setup_classes"])
+        
+    def test_read_save_file_unchanged(self):
+        self.get_setup_view(1).set_excluded(True)
+        
+        views = self.model.get_configuration_views() + self.model.get_setup_views()
+        view_order = [(view in self.model.get_configuration_views(), view.get_name()) for view in views]
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file_path = os.path.join(directory, "save.sqlite")
+            
+            # Save files from before whether setup views are excluded was stored outside of their states
+            with closing(sqlite3.connect(save_file_path)) as connection, connection:
+                connection.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)")
+                connection.execute("CREATE TABLE views (is_configuration_view INTEGER, name TEXT, position INTEGER, state BLOB, PRIMARY KEY (is_configuration_view, name))")
+                connection.execute("INSERT INTO metadata (key, value) VALUES ('format_version', ?)", (str(SAVE_FORMAT_VERSION),))
+                connection.executemany("INSERT INTO views (is_configuration_view, name, position, state) VALUES (?, ?, ?, ?)", \
+                                       [(is_configuration_view, name, position, json.dumps(view.get_saved_state())) for position, ((is_configuration_view, name), view) in enumerate(zip(view_order, views))])
+                                       
+            saved_views = SaveFile(save_file_path).read_views_on_demand()
+            
+            # Reading the save should not add the columns of the current format
+            with closing(sqlite3.connect(save_file_path)) as connection:
+                self.assertFalse(SaveFile.has_excluded_column(connection))
+                
+        self.assertEqual([view[:3] for view in saved_views], [(is_configuration_view, name, not is_configuration_view and view.is_excluded()) for (is_configuration_view, name), view in zip(view_order, views)])
+        
+    def test_restore_values(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        
+        setup_class_gui = self.setup_class(configuration_class_gui, x=10, y=10)
+        setup_class_gui.get_setup_attributes_gui()[0].get_setup_attribute().set_value((0.123456,))
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file = SaveFile(os.path.join(directory, "save.sqlite"))
+            save_file.write({(False, "System"): self.get_setup_view().get_saved_state()}, [(False, "System")])
+            saved_state = list(save_file.read_views())[0][2]
+            
+        view = self.get_setup_view(1)
+        view.restore_save(saved_state, {configuration_class_gui.get_save_id(): configuration_class_gui}, {})
+        restored_setup_class_gui = view.get_setup_classes_gui()[0]
+        
+        self.assertEqual(restored_setup_class_gui.get_name(), setup_class_gui.get_name())
+        self.assertEqual((restored_setup_class_gui.get_x(), restored_setup_class_gui.get_y()), (setup_class_gui.get_x(), setup_class_gui.get_y()))
+        
+        # The saved value is used instead of the rounded value that is shown
+        restored_setup_class_gui.reset_calculated_values()
+        self.assertEqual(restored_setup_class_gui.get_setup_attributes_gui()[0].get_setup_attribute().get_value(), (0.123456,))
+        
+    def test_restore_values_when_shown(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        
+        setup_class_gui = self.setup_class(configuration_class_gui, x=10, y=10)
+        setup_class_gui.get_setup_attributes_gui()[0].get_setup_attribute().set_value((0.123456,))
+        saved_state = self.get_setup_view().get_saved_state()
+        
+        # Restored in bulk into a view that has not been shown, as when starting the program, where the shown text is fitted once the view is shown
+        view = self.get_setup_view(1)
+        
+        with self.model.bulk_build():
+            view.restore_save(saved_state, {configuration_class_gui.get_save_id(): configuration_class_gui}, {})
+            
+        self.model.change_view(view)
+        view_copy = view.create_copy()
+        self.model.change_view(view_copy)
+        
+        for restored_view in (view, view_copy):
+            restored_setup_class_gui = restored_view.get_setup_classes_gui()[0]
+            restored_setup_class_gui.reset_calculated_values()
+            self.assertEqual(restored_setup_class_gui.get_setup_attributes_gui()[0].get_setup_attribute().get_value(), (0.123456,))
+            
+    def test_restore_setup_views_when_needed(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        self.setup_class(configuration_class_gui, x=10, y=10).set_name("Restored")
+        self.get_setup_view(1).set_excluded(True)
+        
+        views = self.model.get_configuration_views() + self.model.get_setup_views()
+        view_order = [(view in self.model.get_configuration_views(), view.get_name()) for view in views]
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file_path = os.path.join(directory, "save.sqlite")
+            SaveFile(save_file_path).write({key: view.get_saved_state() for key, view in zip(view_order, views)}, view_order)
+            
+            root = tk.Tk()
+            
+            try:
+                with unittest.mock.patch("model.SAVE_FILE_PATH", save_file_path), \
+                     unittest.mock.patch.object(Autosave, "get_save_file_to_recover", return_value=None), \
+                     unittest.mock.patch.object(SaveFile, "read_view", autospec=True, side_effect=SaveFile.read_view) as read_view:
+                    model = Model(root)
+                    setup_view = model.get_setup_views()[0]
+                    
+                    # Only the configuration views are read when opening the save, while whether setup views are excluded is known without reading them
+                    self.assertTrue(all(call.args[1] for call in read_view.call_args_list))
+                    self.assertTrue(model.get_setup_views()[1].is_excluded())
+                    
+                    # Setup views are only read and restored once they are shown
+                    self.assertFalse(setup_view.is_restored())
+                    self.assertEqual(setup_view.get_setup_classes_gui(), [])
+                    
+                    model.change_view(setup_view)
+                    self.assertEqual([call.args[1:] for call in read_view.call_args_list if not call.args[1]], [(False, setup_view.get_name())])
+                    
+                self.assertTrue(setup_view.is_restored())
+                self.assertEqual([setup_class_gui.get_name() for setup_class_gui in setup_view.get_setup_classes_gui()], ["Restored"])
+                self.assertFalse(setup_view.has_unsaved_changes())
+                
+                # Calculating values restores all setup views
+                self.assertFalse(model.get_setup_views()[1].is_restored())
+                model.calculate_values()
+                self.assertTrue(all(view.is_restored() for view in model.get_setup_views()))
+                
+            finally:
+                root.destroy()
+                
+    def test_save_setup_view_not_found(self):
+        setup_view = self.get_setup_view(1)
+        setup_view.set_save_to_restore(lambda: None, True)
+        
+        # Views whose save could not be found are saved as empty
+        saved_state = setup_view.get_saved_state()
+        self.assertEqual(saved_state["setup_classes"]["name"], [])
+        self.assertEqual(saved_state["connections_with_blocks"]["start"], [])
+        self.assertTrue(saved_state["is_excluded"])
+        
+    def test_read_configuration_views(self):
+        self.configuration_class()
+        
+        configuration_view = self.get_configuration_view()
+        setup_view = self.get_setup_view()
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file = SaveFile(os.path.join(directory, "save.sqlite"))
+            save_file.write({(True, "Metamodel"): configuration_view.get_saved_state(), (False, "System"): setup_view.get_saved_state()}, [(True, "Metamodel"), (False, "System")])
+            
+            configuration_views = save_file.read_configuration_views()
+            
+            # The configuration views are only read once
+            self.assertEqual([name for name, saved_state in configuration_views], ["Metamodel"])
+            self.assertIs(SaveFile(os.path.join(directory, "save.sqlite")).read_configuration_views(), configuration_views)
+            
+            # There are no configuration views to read without a save
+            with unittest.mock.patch("save_file.FILE_PATHS_SAVES_PATH", os.path.join(directory, "view_file_paths.txt")):
+                self.assertEqual(SaveFile(os.path.join(directory, "missing.sqlite")).read_configuration_views(), [])
+                
+    def test_autosave(self):
+        with tempfile.TemporaryDirectory() as directory:
+            autosave = Autosave(self.model, directory)
+            
+            for i in range(NUM_AUTOSAVES + 1):
+                self.configuration_class()
+                autosave.take_snapshot()
+                
+            autosave._Autosave__snapshots_to_write.join()
+            
+            # Only the most recent snapshots are kept, where the newest one is recovered
+            self.assertEqual(len(Autosave.get_snapshot_paths(directory)), NUM_AUTOSAVES)
+            saved_views = list(Autosave.get_save_file_to_recover(directory).read_views())
+            
+            self.assertEqual(len(saved_views), len(self.model.get_configuration_views() + self.model.get_setup_views()))
+            self.assertEqual(len(saved_views[0][2]["configuration_classes_gui"]), NUM_AUTOSAVES + 1)
+            
+            autosave.stop()
+            self.assertEqual(Autosave.get_save_file_to_recover(directory), None)
+            
+    def test_autosave_disabled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            autosave = Autosave(self.model, directory)
+            self.configuration_class()
+            autosave.take_snapshot()
+            autosave._Autosave__snapshots_to_write.join()
+            
+            # Models that are not the save of the user, such as generated ones, neither take snapshots nor remove those of the user
+            disabled_autosave = Autosave(self.model, directory, is_enabled=False)
+            disabled_autosave.schedule()
+            self.assertEqual(disabled_autosave._Autosave__snapshot_id, None)
+            
+            disabled_autosave.stop()
+            self.assertEqual(len(Autosave.get_snapshot_paths(directory)), 1)
+            
+            autosave.stop()
+            
+    def test_autosave_unrestored_views(self):
+        configuration_class_gui = self.configuration_class(x=10, y=10)
+        self.attribute(configuration_class_gui)
+        self.setup_class(configuration_class_gui, x=10, y=10).set_name("Copied")
+        self.get_setup_view(1).set_excluded(True)
+        
+        views = self.model.get_configuration_views() + self.model.get_setup_views()
+        view_order = [(view in self.model.get_configuration_views(), view.get_name()) for view in views]
+        
+        with tempfile.TemporaryDirectory() as directory:
+            save_file_path = os.path.join(directory, "save.sqlite")
+            SaveFile(save_file_path).write({key: view.get_saved_state() for key, view in zip(view_order, views)}, view_order)
+            
+            root = tk.Tk()
+            
+            try:
+                with unittest.mock.patch("model.SAVE_FILE_PATH", save_file_path), \
+                     unittest.mock.patch.object(Autosave, "get_save_file_to_recover", return_value=None):
+                    model = Model(root)
+                    
+                autosave = Autosave(model, os.path.join(directory, "autosaves"))
+                
+                with unittest.mock.patch.object(SaveFile, "read_view", autospec=True, side_effect=SaveFile.read_view) as read_view:
+                    # Nothing is written without unsaved changes
+                    autosave.take_snapshot()
+                    autosave._Autosave__snapshots_to_write.join()
+                    self.assertEqual(Autosave.get_snapshot_paths(os.path.join(directory, "autosaves")), [])
+                    
+                    model.get_setup_views()[1].set_excluded(False)
+                    autosave.take_snapshot()
+                    autosave._Autosave__snapshots_to_write.join()
+                    
+                    # Setup views that have not been restored are copied from the save file without being read on the main loop
+                    self.assertEqual(read_view.call_count, 0)
+                    self.assertFalse(any(view.is_restored() for view in model.get_setup_views()))
+                    
+                recovered_views = Autosave.get_save_file_to_recover(os.path.join(directory, "autosaves")).read_views_on_demand()
+                
+                self.assertEqual([(is_configuration_view, name) for is_configuration_view, name, is_excluded, read_saved_state in recovered_views], view_order)
+                self.assertFalse(recovered_views[len(self.model.get_configuration_views()) + 1][2])
+                self.assertEqual(recovered_views[len(self.model.get_configuration_views())][3]()["setup_classes"]["name"], ["Copied"])
+                
+                autosave.stop()
+                
+            finally:
+                root.destroy()
+                
 if __name__ == "__main__":
     input("Warning: Risk of flashing lights as GUI windows are rapidly created and destroyed. Press ENTER to proceed: ")
     unittest.main()